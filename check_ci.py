@@ -1,29 +1,68 @@
+import asyncio
 import json
 import sys
 import urllib.request
+from pathlib import Path
+
+import aiohttp
 
 sys.stdout.reconfigure(encoding='utf-8')
 
 RUN_ID = "22236041920"
 REPO = "bess-solutions/open-bess-edge"
+HEADERS = {"Accept": "application/vnd.github+json", "User-Agent": "check-ci"}
+# job_id -> {"etag": ..., "tail": ...}; lets re-runs send If-None-Match and
+# reuse the cached tail on 304 Not Modified instead of re-downloading logs
+CACHE_FILE = Path(".ci_cache.json")
 
 # Get jobs
 url = f"https://api.github.com/repos/{REPO}/actions/runs/{RUN_ID}/jobs"
-req = urllib.request.Request(url, headers={"Accept": "application/vnd.github+json", "User-Agent": "check-ci"})
+req = urllib.request.Request(url, headers=HEADERS)
 with urllib.request.urlopen(req) as r:
     jobs = json.load(r)
 
-# Find failed jobs and get their log URLs
-for job in jobs["jobs"]:
-    if job["conclusion"] == "failure":
+
+def load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+async def fetch_logs(session, job, cache):
+    """Return (job, last 3000 chars of its log) or (job, exception)."""
+    logs_url = f"https://api.github.com/repos/{REPO}/actions/jobs/{job['id']}/logs"
+    key = str(job['id'])
+    headers = dict(HEADERS)
+    if key in cache:
+        headers["If-None-Match"] = cache[key]["etag"]
+    try:
+        async with session.get(logs_url, headers=headers) as r2:
+            if r2.status == 304:
+                return job, cache[key]["tail"]
+            r2.raise_for_status()
+            logs = (await r2.read()).decode('utf-8', errors='replace')
+            tail = logs[-3000:]
+            if etag := r2.headers.get("ETag"):
+                cache[key] = {"etag": etag, "tail": tail}
+            return job, tail
+    except Exception as e:
+        return job, e
+
+
+async def main():
+    # Fetch all failed job logs concurrently; print in job order
+    failed = [job for job in jobs["jobs"] if job["conclusion"] == "failure"]
+    cache = load_cache()
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(*(fetch_logs(session, job, cache) for job in failed))
+    CACHE_FILE.write_text(json.dumps(cache), encoding='utf-8')
+    for job, logs in results:
         print(f"\n=== FAILED JOB: {job['name']} (id={job['id']}) ===")
-        # Get logs URL
-        logs_url = f"https://api.github.com/repos/{REPO}/actions/jobs/{job['id']}/logs"
-        req2 = urllib.request.Request(logs_url, headers={"Accept": "application/vnd.github+json", "User-Agent": "check-ci"})
-        try:
-            with urllib.request.urlopen(req2) as r2:
-                logs = r2.read().decode('utf-8', errors='replace')
-                # Print last 3000 chars
-                print(logs[-3000:])
-        except Exception as e:
-            print(f"Could not get logs: {e}")
+        if isinstance(logs, Exception):
+            print(f"Could not get logs: {logs}")
+        else:
+            print(logs)
+
+
+asyncio.run(main())
@@ -12,9 +12,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import struct
 
-from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext, ModbusSlaveContext
+from pymodbus.datastore import ModbusServerContext, ModbusSlaveContext, ModbusSparseDataBlock
 from pymodbus.device import ModbusDeviceIdentification
 from pymodbus.server import StartAsyncTcpServer
 
@@ -28,12 +27,29 @@ log = logging.getLogger("bessai-sim")
 # but the Modbus protocol uses 1-based, pymodbus handles the offset.
 # We use address as-is matching the device spec (40001 offset not needed
 # for read_holding_registers which is 0-based internally).
-# We create a block large enough to cover all registers (0 to 50000).
-
-def _make_block() -> ModbusSequentialDataBlock:
-    """Build a large zero-filled block and set known register values."""
-    SIZE = 50000
-    data = [0] * SIZE
+# Only the windows the SUN2000/LUNA2000 register map actually uses are
+# backed (zero-filled), so the block holds a few hundred entries instead of
+# a 50000-register array.  Reads outside these windows return ILLEGAL
+# ADDRESS, as on the real device.
+_WINDOWS: tuple[tuple[int, int], ...] = (
+    (32000, 120),  # inverter: alarms, PV strings, AC output, energy
+    (37750, 60),   # LUNA2000 battery
+    (40900, 1),    # watchdog heartbeat (RW)
+    (47086, 2),    # working mode + target SOC (RW)
+)
+
+
+def _dword(value: int) -> tuple[int, int]:
+    """Split a signed/unsigned 32-bit value into (high, low) 16-bit registers."""
+    v = value & 0xFFFFFFFF
+    return v >> 16, v & 0xFFFF
+
+
+def _make_block() -> ModbusSparseDataBlock:
+    """Build a sparse block over ``_WINDOWS`` and set known register values."""
+    data: dict[int, int] = {
+        addr: 0 for start, count in _WINDOWS for addr in range(start, start + count)
+    }
 
     # ── Inverter state ──────────────────────────────────────────────────────
     data[32089] = 256          # Running / Grid Connected
@@ -45,16 +61,12 @@ def _make_block() -> ModbusSequentialDataBlock:
     data[32019] = 820          # PV2 current 8.20A
 
     # ── PV total power INT32 5800W = 5.8kW ──────────────────────────────────
-    pv_power = struct.pack(">i", 5800)
-    data[32064] = int.from_bytes(pv_power[0:2], "big")
-    data[32065] = int.from_bytes(pv_power[2:4], "big")
+    data[32064], data[32065] = _dword(5800)
 
     # ── AC output ────────────────────────────────────────────────────────────
     data[32069] = 2300         # AC voltage 230.0V  (UINT16, *0.1)
     # AC power INT32 5750W = 5.75kW
-    ac_power = struct.pack(">i", 5750)
-    data[32080] = int.from_bytes(ac_power[0:2], "big")
-    data[32081] = int.from_bytes(ac_power[2:4], "big")
+    data[32080], data[32081] = _dword(5750)
     data[32085] = 5000         # Frequency 50.00Hz  (UINT16, *0.01)
     data[32087] = 420          # Temp 42.0°C        (INT16, *0.1)
 
@@ -64,13 +76,9 @@ def _make_block() -> ModbusSequentialDataBlock:
 
     # ── Energy ───────────────────────────────────────────────────────────────
     # daily_energy: 28.50 kWh → UINT32 = 2850 (scale 0.01)
-    daily = struct.pack(">I", 2850)
-    data[32114] = int.from_bytes(daily[0:2], "big")
-    data[32115] = int.from_bytes(daily[2:4], "big")
+    data[32114], data[32115] = _dword(2850)
     # total_energy: 5280.00 kWh → UINT32 = 528000
-    total = struct.pack(">I", 528000)
-    data[32106] = int.from_bytes(total[0:2], "big")
-    data[32107] = int.from_bytes(total[2:4], "big")
+    data[32106], data[32107] = _dword(528000)
 
     # ── LUNA2000 battery ─────────────────────────────────────────────────────
     data[37752] = 260          # temperature 26.0°C (INT16, *0.1)
@@ -78,13 +86,9 @@ def _make_block() -> ModbusSequentialDataBlock:
     data[37761] = 980          # SOH  98.0%         (UINT16, *0.1)
     data[37762] = 88           # cycle count
     # luna_capacity UINT32 14000 Wh = 14.0 kWh (scale 0.001)
-    cap = struct.pack(">I", 14000)
-    data[37758] = int.from_bytes(cap[0:2], "big")
-    data[37759] = int.from_bytes(cap[2:4], "big")
+    data[37758], data[37759] = _dword(14000)
     # luna_power INT32 -2500 W = -2.5 kW discharging (scale 0.001)
-    pwr = struct.pack(">i", -2500)
-    data[37765] = int.from_bytes(pwr[0:2], "big")
-    data[37766] = int.from_bytes(pwr[2:4], "big")
+    data[37765], data[37766] = _dword(-2500)
     data[37800] = 4750         # voltage 475.0V (UINT16, *0.1)
     data[37801] = 0xFFCE       # current -5.0A  (INT16 two's complement -50, *0.1)
 
@@ -95,15 +99,17 @@ def _make_block() -> ModbusSequentialDataBlock:
     # ── Watchdog heartbeat (RW) ───────────────────────────────────────────────
     data[40900] = 0
 
-    return ModbusSequentialDataBlock(0, data)
+    return ModbusSparseDataBlock(data)
 
 
 async def run_server() -> None:
     block = _make_block()
 
-    # One slave for all unit IDs (gateway uses 3, gateway-sim uses 1)
+    # One slave for all unit IDs (gateway uses 3, gateway-sim uses 1).
+    # single=True answers every unit ID from this context without a
+    # per-request unit-ID routing lookup.
     slave = ModbusSlaveContext(hr=block)
-    context = ModbusServerContext(slaves={1: slave, 3: slave}, single=False)
+    context = ModbusServerContext(slaves=slave, single=True)
 
     identity = ModbusDeviceIdentification()
     identity.VendorName = "BESSAI-SIM"
@@ -5,6 +5,7 @@ Runs reproducible benchmarks for BESSAI Edge Gateway.
 
 Usage:
     python scripts/run_benchmarks.py --benchmark 001 --cycles 100 --ci
+    python scripts/run_benchmarks.py --benchmark 001 --cycles 1000 --batch 32
     python scripts/run_benchmarks.py --benchmark 002 --max-sites 50 --ci
 """
 from __future__ import annotations
@@ -12,99 +13,208 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
-import statistics
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Ensure the repo root is on the path when run as a script
 _REPO_ROOT = Path(__file__).parent.parent
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 
+# ---------------------------------------------------------------------------
+# Statistics helpers
+# ---------------------------------------------------------------------------
+
+
+_STATS = ("p50", "p95", "p99", "max")
+
+
+def _latency_stats(samples: np.ndarray | list[float]) -> np.ndarray:
+    """Return ``[p50, p95, p99, max]`` of *samples* along axis 0.
+
+    A 1-D input yields shape ``(4,)``; an ``(n, k)`` matrix yields ``(4, k)``
+    with one column per phase.
+    """
+    arr = np.asarray(samples, dtype=np.float64)
+    return np.concatenate(
+        (np.percentile(arr, [50, 95, 99], axis=0), arr.max(axis=0, keepdims=True)),
+        axis=0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Benchmark 001 — Gateway Cycle Latency
 # ---------------------------------------------------------------------------
 
 
-async def _run_bench_001_cycle(driver_kwargs: dict) -> dict[str, float]:
-    """Run one gateway cycle and return sub-phase timings in milliseconds."""
-    from src.core.safety import SafetyGuard
-    from src.drivers.simulator_driver import SimulatorDriver
-    from src.interfaces.onnx_dispatcher import OnnxDispatcher
+# Constant head of the telemetry envelope, serialized once; only the
+# timestamp and payload are encoded per cycle.
+_SITE_ID = "SITE-CL-001"
+_ENVELOPE_PREFIX = _dumps({
+    "schema_version": "1.0",
+    "message_type": "telemetry",
+    "site_id": _SITE_ID,
+})[:-1] + b',"timestamp":"'
 
-    driver = SimulatorDriver()
-    await driver.connect()
+# Column order of the timing matrix; the last column is the cycle total
+_PHASES = ("read_tags", "safety_eval", "onnx_inference", "publish")
+_COLUMNS = (*_PHASES, "cycle_total")
+
+_MODEL_PATH = Path("models/dispatch_policy.onnx")
+
+# Reused across cycles so the measured phases exclude one-off setup cost
+# (ONNX session init, SafetyGuard construction).
+_DISPATCHER = None
+_GUARD = None
 
-    timings: dict[str, float] = {}
+
+async def _run_bench_001_cycle(driver, out: np.ndarray, features: np.ndarray) -> None:
+    """Run one gateway cycle on a connected *driver*.
+
+    Sub-phase timings in milliseconds are written into the row *out* in
+    ``_COLUMNS`` order; the dispatcher input vector is stored in *features*
+    for the batched-inference pass.
+    """
+    global _DISPATCHER, _GUARD
+    from src.core.safety import SafetyGuard
+    from src.interfaces.onnx_dispatcher import ONNXDispatcher
+
+    if _GUARD is None:
+        _GUARD = SafetyGuard()
+    if _DISPATCHER is None:
+        _DISPATCHER = ONNXDispatcher(model_path=_MODEL_PATH).load()
 
     # Phase: read_tags
     t0 = time.perf_counter()
-    soc = await driver.read_tag("SOC_%")
-    power = await driver.read_tag("P_kW")
-    temp = await driver.read_tag("T_battery_C")
-    alarm = await driver.read_tag("alarm_code")
-    timings["read_tags"] = (time.perf_counter() - t0) * 1000
+    soc, power, temp, _alarm = await asyncio.gather(
+        driver.read_tag("SOC_%"),
+        driver.read_tag("P_kW"),
+        driver.read_tag("T_battery_C"),
+        driver.read_tag("alarm_code"),
+    )
+    out[0] = (time.perf_counter() - t0) * 1000
 
     # Phase: safety_eval
     t0 = time.perf_counter()
-    guard = SafetyGuard()
-    _ = guard.check_safety({"soc": soc, "temp": temp})
-    timings["safety_eval"] = (time.perf_counter() - t0) * 1000
+    _ = _GUARD.check_safety({"soc": soc, "temp": temp})
+    out[1] = (time.perf_counter() - t0) * 1000
 
     # Phase: onnx_inference
+    features[:] = (soc, power, temp, time.gmtime().tm_hour)
     t0 = time.perf_counter()
     try:
-        dispatcher = OnnxDispatcher()
-        model_path = Path("models/dispatch_policy.onnx")
-        if model_path.exists():
-            _ = dispatcher.run_inference(soc_pct=soc, power_kw=power)
-        timings["onnx_inference"] = (time.perf_counter() - t0) * 1000
+        if _DISPATCHER.is_loaded:
+            _ = _DISPATCHER.infer(soc_pct=soc, power_kw=power, temp_c=temp,
+                                  hour_of_day=float(features[3]))
+        out[2] = (time.perf_counter() - t0) * 1000
     except Exception:
-        timings["onnx_inference"] = 0.0
+        out[2] = 0.0
 
     # Phase: publish (simulated serialization only)
     t0 = time.perf_counter()
-    _ = json.dumps({
-        "schema_version": "1.0",
-        "message_type": "telemetry",
-        "site_id": "SITE-CL-001",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "payload": {"soc_pct": soc, "power_kw": power, "temperature_c": temp},
-    })
-    timings["publish"] = (time.perf_counter() - t0) * 1000
+    ts = datetime.now(timezone.utc).isoformat().encode()
+    payload = _dumps({"soc_pct": soc, "power_kw": power, "temperature_c": temp})
+    _ = b"".join((_ENVELOPE_PREFIX, ts, b'","payload":', payload, b"}"))
+    out[3] = (time.perf_counter() - t0) * 1000
 
-    timings["cycle_total"] = sum(timings.values())
+    out[4] = out[:4].sum()
 
-    await driver.disconnect()
-    return timings
 
+def _bench_batched_inference(inputs: np.ndarray, batch: int) -> np.ndarray | None:
+    """Replay recorded cycle inputs through the model *batch* rows per run.
 
-async def benchmark_001(cycles: int = 100, warmup: int = 10) -> dict:
-    """Run Benchmark 001: Gateway Cycle Latency."""
+    Returns the per-sample latency (batch latency / *batch*) in ms for each
+    full batch, or ``None`` if onnxruntime or the model is unavailable.  A
+    dedicated session is used because ``ONNXDispatcher`` pins batch=1.
+    """
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        return None
+    if not _MODEL_PATH.exists():
+        return None
+
+    sess = ort.InferenceSession(str(_MODEL_PATH), providers=["CPUExecutionProvider"])
+    name = sess.get_inputs()[0].name
+    n_batches = len(inputs) // batch
+    per_sample = np.empty(n_batches, dtype=np.float64)
+    for b in range(n_batches):
+        chunk = inputs[b * batch:(b + 1) * batch]
+        t0 = time.perf_counter()
+        sess.run(None, {name: chunk})
+        per_sample[b] = (time.perf_counter() - t0) * 1000 / batch
+    return per_sample
+
+
+async def benchmark_001(cycles: int = 100, warmup: int = 10, batch: int = 1) -> dict:
+    """Run Benchmark 001: Gateway Cycle Latency.
+
+    With ``batch > 1`` the recorded cycle inputs are additionally replayed
+    through the model in batches to report per-sample throughput latency.
+    """
     print(f"\n📊 Benchmark 001 — Gateway Cycle Latency ({cycles} cycles)")
     print(f"   Warmup: {warmup} cycles (excluded)")
 
-    all_timings: list[dict[str, float]] = []
+    from src.drivers.simulator_driver import SimulatorDriver
+
+    # Warmup cycles overwrite a scratch row; measured cycles fill timings[i]
+    timings = np.empty((cycles, len(_COLUMNS)), dtype=np.float64)
+    scratch = np.empty(len(_COLUMNS), dtype=np.float64)
+    inputs = np.empty((cycles, 4), dtype=np.float32)
+    scratch_in = np.empty(4, dtype=np.float32)
 
-    for i in range(cycles + warmup):
-        t = await _run_bench_001_cycle({})
-        if i >= warmup:
-            all_timings.append(t)
-        if (i + 1) % 20 == 0:
-            print(f"   {i + 1 - warmup}/{cycles} cycles completed...")
+    # One connection for the whole run: cycles measure steady-state latency,
+    # not connect/disconnect overhead.
+    driver = SimulatorDriver()
+    await driver.connect()
+    try:
+        for i in range(cycles + warmup):
+            if i >= warmup:
+                await _run_bench_001_cycle(driver, timings[i - warmup], inputs[i - warmup])
+            else:
+                await _run_bench_001_cycle(driver, scratch, scratch_in)
+            if (i + 1) % 20 == 0:
+                print(f"   {i + 1 - warmup}/{cycles} cycles completed...")
+    finally:
+        await driver.disconnect()
 
     results: dict = {"benchmark": "001", "version": "1.0.0", "cycles": cycles,
                      "timestamp": datetime.now(timezone.utc).isoformat()}
 
-    for phase in ["read_tags", "safety_eval", "onnx_inference", "publish", "cycle_total"]:
-        vals = [t[phase] for t in all_timings]
-        results[f"{phase}_p50_ms"] = statistics.median(vals)
-        results[f"{phase}_p95_ms"] = sorted(vals)[int(len(vals) * 0.95)]
-        results[f"{phase}_p99_ms"] = sorted(vals)[int(len(vals) * 0.99)]
-        results[f"{phase}_max_ms"] = max(vals)
+    stats = _latency_stats(timings)
+    for j, phase in enumerate(_COLUMNS):
+        for k, stat in enumerate(_STATS):
+            results[f"{phase}_{stat}_ms"] = float(stats[k, j])
+
+    if batch > 1:
+        per_sample = _bench_batched_inference(inputs, batch)
+        if per_sample is not None and per_sample.size:
+            results["onnx_batch_size"] = batch
+            for stat, val in zip(_STATS, _latency_stats(per_sample), strict=True):
+                results[f"onnx_batched_per_sample_{stat}_ms"] = float(val)
+        else:
+            print("   ⚠️  Batched inference skipped (no model/onnxruntime or batch > cycles)")
 
     print("\n✅ Results:")
     print(f"   cycle_total P50: {results['cycle_total_p50_ms']:.2f}ms")
@@ -118,38 +228,88 @@ async def benchmark_001(cycles: int = 100, warmup: int = 10) -> dict:
 # ---------------------------------------------------------------------------
 
 
+def _shared_fleet_session():
+    """Build one ORT session for all simulated sites, or ``None`` if unavailable.
+
+    Each run is single-threaded (``intra_op_num_threads=1``, sequential
+    execution) so that fan-out parallelism comes from the thread pool
+    rather than from N oversubscribed ORT pools.
+    """
+    try:
+        import onnxruntime as ort
+    except ImportError:
+        return None
+    if not _MODEL_PATH.exists():
+        return None
+
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = 1
+    opts.inter_op_num_threads = 1
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(str(_MODEL_PATH), sess_options=opts,
+                                providers=["CPUExecutionProvider"])
+
+
 async def benchmark_002(max_sites: int = 50, cycles_per_count: int = 20) -> dict:
-    """Run Benchmark 002: Fleet Orchestrator Scalability."""
+    """Run Benchmark 002: Fleet Orchestrator Scalability.
+
+    Each simulated site reads its SOC and, when a dispatch model is
+    available, runs one inference on a shared ONNX session via a thread pool.
+    """
     print(f"\n📊 Benchmark 002 — Fleet Scalability (up to {max_sites} sites)")
 
     from src.drivers.simulator_driver import SimulatorDriver
+    from src.interfaces.onnx_dispatcher import ONNXDispatcher
 
     site_counts = [1, 5, 10, 25, 50]
     site_counts = [s for s in site_counts if s <= max_sites]
 
     results: dict = {"benchmark": "002", "version": "1.0.0",
-                     "timestamp": datetime.now(timezone.utc).isoformat()}
-
-    for n in site_counts:
-        print(f"   Testing {n} sites...")
-        drivers = [SimulatorDriver(site_id=f"SITE-CL-{i:03d}") for i in range(n)]
-        for d in drivers:
-            await d.connect()
-
-        latencies = []
-        for _ in range(cycles_per_count):
-            t0 = time.perf_counter()
-            await asyncio.gather(*[d.read_tag("SOC_%") for d in drivers])
-            latencies.append((time.perf_counter() - t0) * 1000)
+                     "timestamp": datetime.now(timezone.utc).isoformat(),
+                     "event_loop": type(asyncio.get_running_loop()).__module__.split(".")[0]}
 
-        for d in drivers:
-            await d.disconnect()
+    # A single connected driver serves every simulated site: the fan-out is
+    # N concurrent reads, not N connections to the same endpoint.  The
+    # simulated handshake overlaps with ORT session construction.
+    driver = SimulatorDriver()
+    session, _ = await asyncio.gather(
+        asyncio.to_thread(_shared_fleet_session), driver.connect()
+    )
+    results["onnx_enabled"] = session is not None
+    dispatchers: list = []
+    if session is not None:
+        for i in range(max(site_counts, default=0)):
+            dispatchers.append(
+                ONNXDispatcher(model_path=_MODEL_PATH, site_id=f"SITE-CL-{i:03d}",
+                               shared_session=session).load()
+            )
+
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+    async def _site_cycle(i: int) -> None:
+        soc = await driver.read_tag("SOC_%")
+        if dispatchers:
+            await loop.run_in_executor(pool, dispatchers[i].infer, soc, 0.0, 25.0, 12.0)
 
-        sorted_lat = sorted(latencies)
-        results[f"sites_{n}_cycle_p50_ms"] = statistics.median(latencies)
-        results[f"sites_{n}_cycle_p99_ms"] = sorted_lat[int(len(sorted_lat) * 0.99)]
-        print(f"   → {n} sites: P50={results[f'sites_{n}_cycle_p50_ms']:.1f}ms "
-              f"P99={results[f'sites_{n}_cycle_p99_ms']:.1f}ms")
+    try:
+        for n in site_counts:
+            print(f"   Testing {n} sites...")
+            latencies = []
+            for _ in range(cycles_per_count):
+                t0 = time.perf_counter()
+                await asyncio.gather(*(_site_cycle(i) for i in range(n)))
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+            p50, _p95, p99, _mx = _latency_stats(latencies)
+            results[f"sites_{n}_cycle_p50_ms"] = float(p50)
+            results[f"sites_{n}_cycle_p99_ms"] = float(p99)
+            print(f"   → {n} sites: P50={results[f'sites_{n}_cycle_p50_ms']:.1f}ms "
+                  f"P99={results[f'sites_{n}_cycle_p99_ms']:.1f}ms")
+    finally:
+        await driver.disconnect()
+        pool.shutdown()
 
     return results
 
@@ -164,6 +324,8 @@ def main() -> None:
     parser.add_argument("--benchmark", choices=["001", "002"], required=True)
     parser.add_argument("--cycles", type=int, default=100,
                         help="Number of cycles for benchmark 001")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="Benchmark 001: also replay inputs through ONNX in batches of N")
     parser.add_argument("--max-sites", dest="max_sites", type=int, default=50,
                         help="Max sites for benchmark 002")
     parser.add_argument("--ci", action="store_true",
@@ -177,9 +339,12 @@ def main() -> None:
         args.max_sites = min(args.max_sites, 25)
 
     if args.benchmark == "001":
-        results = asyncio.run(benchmark_001(cycles=args.cycles))
+        results = asyncio.run(benchmark_001(cycles=args.cycles, batch=args.batch))
     else:
-        results = asyncio.run(benchmark_002(max_sites=args.max_sites))
+        # The fan-out is dominated by event-loop scheduling; use uvloop when
+        # installed (the loop in use is recorded in the results).
+        run = uvloop.run if uvloop is not None else asyncio.run
+        results = run(benchmark_002(max_sites=args.max_sites))
 
     output_path = args.output or f"benchmark_{args.benchmark}_results.json"
     with open(output_path, "w", encoding="utf-8") as f:
@@ -13,11 +13,14 @@ Requirements (training environment only):
 Usage:
     python scripts/train_drl_policy.py --iterations 100 --out models/dispatch_policy.onnx
     python scripts/train_drl_policy.py --iterations 200 --checkpoint-dir runs/
+    python scripts/train_drl_policy.py --iterations 100 --quantize
 
 Notes:
     - Training runs on the host (not on the edge device).
     - The resulting ONNX model is loaded by ONNXDispatcher at the edge.
     - Edge devices have no Ray/PyTorch dependency at inference time.
+    - ``--quantize`` additionally writes ``<out>.int8.onnx`` (dynamic int8
+      weight quantization via onnxruntime) for CPU-bound edge nodes.
 """
 
 from __future__ import annotations
@@ -55,6 +58,10 @@ def parse_args() -> argparse.Namespace:
         "--max-power-kw", type=float, default=50.0,
         help="Maximum BESS power in kW (default: 50)"
     )
+    parser.add_argument(
+        "--quantize", action="store_true",
+        help="Also export a dynamically int8-quantized model (<out>.int8.onnx)"
+    )
     return parser.parse_args()
 
 
@@ -122,13 +129,17 @@ def train(args: argparse.Namespace) -> None:
     print(f"[BESSAI] Training complete. Best reward: {best_reward:.2f}")
 
     # Export policy network to ONNX
-    _export_to_onnx(algo, args.out)
+    _export_to_onnx(algo, args.out, quantize=args.quantize)
     algo.stop()
     ray.shutdown()
 
 
-def _export_to_onnx(algo, output_path: str) -> None:
-    """Export the trained policy to ONNX format for edge deployment."""
+def _export_to_onnx(algo, output_path: str, quantize: bool = False) -> None:
+    """Export the trained policy to ONNX format for edge deployment.
+
+    With *quantize*, an int8 dynamically quantized copy is written next to
+    the FP32 model; the FP32 model is always kept as the reference.
+    """
     import onnx
     import torch
 
@@ -153,6 +164,28 @@ def _export_to_onnx(algo, output_path: str) -> None:
     print(f"[BESSAI] ONNX model exported: {output_file}")
     print("[BESSAI] Deploy with: cp models/dispatch_policy.onnx /edge/models/")
 
+    if quantize:
+        _quantize_int8(output_file)
+
+
+def _quantize_int8(model_file: Path) -> Path | None:
+    """Write ``<model>.int8.onnx`` with int8 weights (dynamic quantization).
+
+    Weights are quantized offline; activations are quantized at runtime, so
+    no calibration dataset is needed.  Returns ``None`` if onnxruntime's
+    quantization tooling is not installed.
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        print("[WARN] onnxruntime not installed — skipping int8 quantization")
+        return None
+
+    int8_file = model_file.with_suffix(".int8.onnx")
+    quantize_dynamic(str(model_file), str(int8_file), weight_type=QuantType.QInt8)
+    print(f"[BESSAI] int8 ONNX model exported: {int8_file}")
+    return int8_file
+
 
 def main() -> None:
     args = parse_args()
@@ -145,7 +145,8 @@ class SafetyGuard:
                 )
                 return False
 
-        log.debug("safety.check.pass", telemetry=telemetry)
+        # No log on the pass path: this runs every cycle and the caller
+        # already records the verdict on its span.
         return True
 
     # ------------------------------------------------------------------
@@ -21,27 +21,29 @@ Usage
 
 In application code that needs a module-level reference::
 
-    from src.core.config import settings   # lazy â€” resolved at first access
+    from src.core.config import settings   # resolved on first import of the name
 """
 
 from __future__ import annotations
 
+import ipaddress
 import re
-from functools import lru_cache
+from functools import cache, cached_property
 from pathlib import Path
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Accepts IPv4, IPv6 (simplified), Docker service names and DNS hostnames
-# A hostname label: starts/ends with alnum, may contain hyphens.
-_HOST_RE = re.compile(
-    r"^("
-    r"(?:\d{1,3}\.){3}\d{1,3}"  # IPv4
-    r"|(?:[0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}"  # IPv6 (simplified)
-    r"|(?:[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*"  # optional domain labels
-    r"[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?"  # final label (allows hyphens)
-    r")$"
+# Project root (two levels above src/core/), resolved once at import
+_ROOT = Path(__file__).resolve().parents[2]
+
+# DNS hostname or Docker service name: dot-separated labels that start/end
+# with alnum and may contain hyphens.  IP literals are handled separately by
+# ``ipaddress`` so this pattern has no competing alternatives to backtrack over.
+_LABEL_RE = re.compile(
+    r"^(?=.{1,253}$)"
+    r"(?:[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*"  # optional domain labels
+    r"[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$"  # final label (allows hyphens)
 )
 
 
@@ -52,13 +54,17 @@ class Settings(BaseSettings):
     Pydantic-Settings reads variables using the exact field names
     (case-insensitive on most platforms).  A ``.env`` file placed at
     ``config/.env`` is also auto-loaded when present.
+
+    Instances are frozen: settings are read-only after startup, which also
+    makes it safe to memoise derived values such as ``driver_profile_abs``.
     """
 
     model_config = SettingsConfigDict(
-        env_file=str(Path(__file__).resolve().parents[2] / "config" / ".env"),
+        env_file=str(_ROOT / "config" / ".env"),
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # ------------------------------------------------------------------
@@ -84,7 +90,12 @@ class Settings(BaseSettings):
     def validate_inverter_host(cls, v: object) -> str:
         """Accept IPv4, IPv6, or a DNS hostname (e.g. Docker service names)."""
         s = str(v).strip()
-        if not _HOST_RE.match(s):
+        try:
+            ipaddress.ip_address(s)
+            return s
+        except ValueError:
+            pass
+        if not _LABEL_RE.match(s):
             raise ValueError(f"INVERTER_IP must be a valid IP address or hostname, got: {s!r}")
         return s
 
@@ -106,6 +117,31 @@ class Settings(BaseSettings):
         ),
     )
 
+    # ------------------------------------------------------------------
+    # Driver selection (simulator ↔ real hardware)
+    # ------------------------------------------------------------------
+    BESSAI_MODE: str = Field(
+        default="auto",
+        description=(
+            "'demo' always uses the SimulatorDriver; 'auto' uses it only when "
+            "INVERTER_IP is empty; any other value selects the real Modbus driver."
+        ),
+    )
+    BESSAI_SIM_MODE: str = Field(
+        default="normal",
+        description="SimulatorDriver scenario: normal, stress, fault or idle.",
+    )
+    DEVICE_PROFILE: str = Field(
+        default="huawei_sun2000",
+        description="Registry profile name used by the SimulatorDriver.",
+    )
+
+    @field_validator("BESSAI_MODE", "BESSAI_SIM_MODE", mode="before")
+    @classmethod
+    def normalise_mode(cls, v: object) -> str:
+        """Mode names are case-insensitive."""
+        return str(v).strip().lower()
+
     # ------------------------------------------------------------------
     # Safety / watchdog
     # ------------------------------------------------------------------
@@ -126,6 +162,28 @@ class Settings(BaseSettings):
         default=None,
         description="GCP Pub/Sub topic name for telemetry. Required in production.",
     )
+    PUBSUB_BATCH_SIZE: int = Field(
+        default=1,
+        ge=1,
+        description="Telemetry samples buffered per Pub/Sub publish request (1 = every cycle).",
+    )
+    PUBSUB_BATCH_INTERVAL_S: float = Field(
+        default=30.0,
+        gt=0,
+        description="Maximum seconds a buffered sample waits before the batch is flushed.",
+    )
+    PUBSUB_BATCH_MAX_MESSAGES: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum messages per Pub/Sub publish request; larger batches are split.",
+    )
+    PUBSUB_BATCH_MAX_BYTES: int = Field(
+        default=1024 * 1024,
+        ge=1,
+        le=10_000_000,
+        description="Maximum payload bytes per Pub/Sub publish request; larger batches are split.",
+    )
 
     # ------------------------------------------------------------------
     # Observability
@@ -142,6 +200,22 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).",
     )
+    LOG_EVERY_N_CYCLES: int = Field(
+        default=10,
+        ge=1,
+        description=(
+            "Emit per-cycle INFO logs (publish, DRL setpoint) only every N cycles "
+            "or when their state changes; 1 logs every cycle."
+        ),
+    )
+
+    # ------------------------------------------------------------------
+    # Runtime
+    # ------------------------------------------------------------------
+    BESSAI_USE_UVLOOP: bool = Field(
+        default=True,
+        description="Run the gateway on uvloop when it is installed (ignored otherwise).",
+    )
 
     # ------------------------------------------------------------------
     # Health & Metrics HTTP server
@@ -291,46 +365,39 @@ class Settings(BaseSettings):
         """Return the inverter host as a plain string for pymodbus."""
         return self.INVERTER_IP
 
-    @property
+    @cached_property
     def driver_profile_abs(self) -> Path:
         """Resolve the driver profile path relative to the project root."""
-        root = Path(__file__).resolve().parents[2]
         p = Path(self.DRIVER_PROFILE_PATH)
-        return p if p.is_absolute() else (root / p)
+        return p if p.is_absolute() else (_ROOT / p)
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_settings() -> Settings:
     """
     Return the singleton ``Settings`` instance.
 
-    Cached via ``lru_cache`` so that environment variables are parsed
+    Cached via ``functools.cache`` so that environment variables are parsed
     only once per process.  In tests, call ``get_settings.cache_clear()``
     before patching environment variables.
     """
     return Settings()  # type: ignore[call-arg]
 
 
-class _LazySettings:
+def __getattr__(name: str) -> object:
     """
-    Proxy that resolves ``get_settings()`` on first attribute access.
+    Resolve the module-level ``settings`` singleton on first access (PEP 562).
 
     This lets application modules write ``from src.core.config import settings``
-    without triggering a ``Settings()`` parse at import time (which would
-    fail if no ``.env`` file exists, e.g. in unit tests).
+    without triggering a ``Settings()`` parse at import time of this module
+    (which would fail if no ``.env`` file exists, e.g. in unit tests).  The
+    resolved object is then bound in the module namespace, so later
+    ``settings.X`` accesses are plain attribute loads on ``Settings``.
+    ``get_settings.cache_clear()`` does not rebind it; code that must observe
+    re-parsed settings should call ``get_settings()``.
     """
-
-    _instance: Settings | None = None
-
-    def _resolve(self) -> Settings:
-        if self._instance is None:
-            self._instance = get_settings()
-        return self._instance
-
-    def __getattr__(self, name: str) -> object:
-        return getattr(self._resolve(), name)
-
-
-#: Module-level lazy singleton â€” safe to import even without a .env file.
-#: Resolves to the real Settings object on first attribute access.
-settings: Settings = _LazySettings()  # type: ignore[assignment]
+    if name == "settings":
+        resolved = get_settings()
+        globals()["settings"] = resolved
+        return resolved
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
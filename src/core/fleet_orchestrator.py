@@ -30,14 +30,21 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import ssl
 import time
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
 
 import aiohttp
+import numpy as np
 import structlog
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
 from src.interfaces.metrics import (
     FLEET_SITES_ACTIVE,
     FLEET_TOTAL_CAPACITY_KWH,
@@ -47,11 +54,18 @@ __all__ = [
     "FleetOrchestrator",
     "SiteProxy",
     "SiteTelemetry",
+    "FleetTelemetryBatch",
     "FleetSummary",
 ]
 
 log = structlog.get_logger(__name__)
 
+# Idle keep-alive window for pooled site connections (seconds).
+_KEEPALIVE_S = 300.0
+
+# Below this many sites the scalar reductions beat NumPy's array setup cost.
+_VECTORIZE_MIN_SITES = 8
+
 
 @dataclass
 class SiteTelemetry:
@@ -64,7 +78,97 @@ class SiteTelemetry:
     capacity_kwh: float
     available_kw: float
     anomaly_score: float = 0.0
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0  # epoch seconds; 0.0 = not stamped yet (see fetch_telemetry)
+
+
+@dataclass
+class FleetTelemetryBatch:
+    """Column-oriented (SoA) telemetry for a whole fleet poll.
+
+    Each field is a contiguous array with one slot per site, so fleet-wide
+    reductions run over packed float64 memory instead of N dataclasses.
+    ``SiteTelemetry`` remains the per-site view (see :meth:`site`).
+    """
+
+    site_ids: np.ndarray
+    soc: np.ndarray
+    power: np.ndarray
+    temp: np.ndarray
+    capacity: np.ndarray
+    available: np.ndarray
+    anomaly: np.ndarray
+    timestamp: np.ndarray
+
+    @classmethod
+    def empty(cls, n: int) -> FleetTelemetryBatch:
+        """Preallocate a batch with ``n`` zeroed slots."""
+        return cls(
+            site_ids=np.empty(n, dtype=object),
+            soc=np.zeros(n),
+            power=np.zeros(n),
+            temp=np.zeros(n),
+            capacity=np.zeros(n),
+            available=np.zeros(n),
+            anomaly=np.zeros(n),
+            timestamp=np.zeros(n),
+        )
+
+    @classmethod
+    def from_telemetries(cls, telemetries: list[SiteTelemetry]) -> FleetTelemetryBatch:
+        """Pack a list of per-site snapshots into a batch in a single pass."""
+        n = len(telemetries)
+        cols = np.fromiter(
+            (
+                (t.soc_pct, t.power_kw, t.temp_c, t.capacity_kwh,
+                 t.available_kw, t.anomaly_score, t.timestamp)
+                for t in telemetries
+            ),
+            dtype=np.dtype((np.float64, 7)),
+            count=n,
+        ).T
+        site_ids = np.empty(n, dtype=object)
+        site_ids[:] = [t.site_id for t in telemetries]
+        return cls(site_ids, *cols)
+
+    def __len__(self) -> int:
+        return len(self.site_ids)
+
+    def write(self, i: int, tel: SiteTelemetry) -> None:
+        """Store ``tel`` in slot ``i``."""
+        self.site_ids[i] = tel.site_id
+        self.soc[i] = tel.soc_pct
+        self.power[i] = tel.power_kw
+        self.temp[i] = tel.temp_c
+        self.capacity[i] = tel.capacity_kwh
+        self.available[i] = tel.available_kw
+        self.anomaly[i] = tel.anomaly_score
+        self.timestamp[i] = tel.timestamp
+
+    def take(self, mask: np.ndarray) -> FleetTelemetryBatch:
+        """Return a compacted batch holding only the slots where ``mask`` is set."""
+        return FleetTelemetryBatch(
+            site_ids=self.site_ids[mask],
+            soc=self.soc[mask],
+            power=self.power[mask],
+            temp=self.temp[mask],
+            capacity=self.capacity[mask],
+            available=self.available[mask],
+            anomaly=self.anomaly[mask],
+            timestamp=self.timestamp[mask],
+        )
+
+    def site(self, i: int) -> SiteTelemetry:
+        """Return slot ``i`` as a ``SiteTelemetry``."""
+        return SiteTelemetry(
+            site_id=str(self.site_ids[i]),
+            soc_pct=float(self.soc[i]),
+            power_kw=float(self.power[i]),
+            temp_c=float(self.temp[i]),
+            capacity_kwh=float(self.capacity[i]),
+            available_kw=float(self.available[i]),
+            anomaly_score=float(self.anomaly[i]),
+            timestamp=float(self.timestamp[i]),
+        )
 
 
 @dataclass
@@ -78,7 +182,12 @@ class FleetSummary:
     total_available_kw: float  # sum of flex capacity
     sites_in_alarm: int  # sites with anomaly_score > 0.7
     cycle_duration_s: float
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0  # epoch seconds; stamped by run_cycle()
+
+    @classmethod
+    def empty(cls) -> FleetSummary:
+        """Return a zero summary for a cycle with no telemetry."""
+        return cls(0, 0.0, 0.0, 0.0, 0.0, 0, 0.0)
 
     def __repr__(self) -> str:
         return (
@@ -92,7 +201,9 @@ class FleetSummary:
 class SiteProxy:
     """Proxy representing a remote BESSAI edge site.
 
-    In production this would use an async httpx/gRPC call.
+    Talks to the edge REST API over aiohttp. When managed by a
+    FleetOrchestrator the proxy reuses the orchestrator's pooled
+    ``session`` so keep-alive connections survive across cycles.
     In simulation / testing, inject a ``telemetry_fn`` callback.
 
     Parameters:
@@ -101,6 +212,8 @@ class SiteProxy:
         capacity_kwh:   Nameplate BESS capacity.
         ssl_context:    Optional SSL context for mTLS.
         telemetry_fn:   Optional callable returning SiteTelemetry (for testing).
+        session:        Optional shared aiohttp session; a throwaway session
+                        is opened per request when not set.
     """
 
     def __init__(
@@ -110,30 +223,52 @@ class SiteProxy:
         capacity_kwh: float = 100.0,
         ssl_context: ssl.SSLContext | None = None,
         telemetry_fn: Callable[[str], SiteTelemetry] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self.host = host
         self.site_id = site_id
         self.capacity_kwh = capacity_kwh
         self.ssl_context = ssl_context
         self._telemetry_fn = telemetry_fn
+        self.session = session
         self._last_telemetry: SiteTelemetry | None = None
 
-    async def fetch_telemetry(self) -> SiteTelemetry:
+    @property
+    def is_remote(self) -> bool:
+        """True when telemetry comes from the network rather than ``telemetry_fn``."""
+        return self._telemetry_fn is None
+
+    @contextlib.asynccontextmanager
+    async def _client(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self.session is not None and not self.session.closed:
+            yield self.session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+    async def fetch_telemetry(self, now: float | None = None) -> SiteTelemetry:
         """Fetch current telemetry from this site.
 
+        Args:
+            now: Poll timestamp (epoch seconds) shared by every site in one
+                fleet poll; read from the clock when not given. Telemetry
+                from ``telemetry_fn`` keeps its own timestamp if it set one.
+
         Returns:
             SiteTelemetry — from network HTTP endpoint, or inject fn (test).
         """
+        ts = time.time() if now is None else now
         if self._telemetry_fn is not None:
             tel = self._telemetry_fn(self.site_id)
+            if not tel.timestamp:
+                tel.timestamp = ts
             self._last_telemetry = tel
             return tel
 
         try:
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
+            async with self._client() as session:
                 url = f"https://{self.host}:8000/api/v1/telemetry" if self.ssl_context else f"http://{self.host}:8000/api/v1/telemetry"
-                async with session.get(url, timeout=3.0) as resp:
+                async with session.get(url, ssl=self.ssl_context or True, timeout=3.0) as resp:
                     resp.raise_for_status()
                     data = await resp.json()
                     tel = SiteTelemetry(
@@ -143,6 +278,7 @@ class SiteProxy:
                         temp_c=float(data.get("temp_c", 25.0)),
                         capacity_kwh=self.capacity_kwh,
                         available_kw=self.capacity_kwh * 0.5,
+                        timestamp=ts,
                     )
                     self._last_telemetry = tel
                     return tel
@@ -156,6 +292,7 @@ class SiteProxy:
                 temp_c=28.0,
                 capacity_kwh=self.capacity_kwh,
                 available_kw=self.capacity_kwh * 0.5,
+                timestamp=ts,
             )
             self._last_telemetry = stub
             return stub
@@ -167,11 +304,12 @@ class SiteProxy:
             return
 
         try:
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
+            async with self._client() as session:
                 url = f"https://{self.host}:8000/api/v1/setpoint" if self.ssl_context else f"http://{self.host}:8000/api/v1/setpoint"
                 payload = {"target_kw": target_kw, "strategy": strategy}
-                async with session.post(url, json=payload, timeout=3.0) as resp:
+                async with session.post(
+                    url, json=payload, ssl=self.ssl_context or True, timeout=3.0
+                ) as resp:
                     resp.raise_for_status()
                     log.info("site_proxy.dispatched", site_id=self.site_id, target_kw=target_kw, strategy=strategy)
         except Exception as exc:
@@ -182,22 +320,50 @@ class SiteProxy:
         return self._last_telemetry
 
 
+async def _close_when_cancelled(session: aiohttp.ClientSession) -> None:
+    """Hold *session* open until this task is cancelled, then close it."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+
 class FleetOrchestrator:
     """Multi-site BESS fleet orchestrator.
 
     Parameters:
         site_id:            Identifier for Prometheus labels.
         anomaly_threshold:  Score above which a site is counted as 'in alarm'.
+        max_parallel:       Maximum number of site polls in flight at once.
     """
 
     def __init__(
         self,
         site_id: str = "fleet",
         anomaly_threshold: float = 0.7,
+        max_parallel: int = 32,
     ) -> None:
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be >= 1, got {max_parallel}")
         self.site_id = site_id
         self.anomaly_threshold = anomaly_threshold
+        self.max_parallel = max_parallel
         self._sites: dict[str, SiteProxy] = {}
+        # Labeled gauge children bound once; labels() is a dict lookup per call.
+        self._g_sites = FLEET_SITES_ACTIVE.labels(site_id=site_id)
+        self._g_cap = FLEET_TOTAL_CAPACITY_KWH.labels(site_id=site_id)
+        # Running sum of registered capacity, maintained by register/remove_site.
+        self._total_capacity_kwh: float = 0.0
+        # Private loop reused by run_cycle(); created lazily, released by close().
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Pooled HTTP session shared by all remote SiteProxy instances. A
+        # session is bound to the loop it was created on, so remember which.
+        # _http_guard is a task on that loop that closes the session when
+        # cancelled, so the session is released before its loop goes away
+        # (asyncio.run and close() cancel outstanding tasks at shutdown).
+        self._http: aiohttp.ClientSession | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self._http_guard: asyncio.Task[None] | None = None
 
     # ------------------------------------------------------------------
     # Site management
@@ -205,14 +371,24 @@ class FleetOrchestrator:
 
     def register_site(self, site_id: str, proxy: SiteProxy) -> None:
         """Register a remote site under the given ID."""
+        previous = self._sites.get(site_id)
+        self._total_capacity_kwh += proxy.capacity_kwh - (
+            previous.capacity_kwh if previous is not None else 0.0
+        )
         self._sites[site_id] = proxy
-        FLEET_SITES_ACTIVE.labels(site_id=self.site_id).set(len(self._sites))
+        if self._http is not None and proxy.is_remote and proxy.session is None:
+            proxy.session = self._http
+        self._g_sites.set(len(self._sites))
         log.info("fleet.site_registered", site_id=site_id, host=proxy.host)
 
     def remove_site(self, site_id: str) -> None:
         """Remove a site from the fleet."""
-        self._sites.pop(site_id, None)
-        FLEET_SITES_ACTIVE.labels(site_id=self.site_id).set(len(self._sites))
+        removed = self._sites.pop(site_id, None)
+        if removed is not None:
+            self._total_capacity_kwh -= removed.capacity_kwh
+            if not self._sites:
+                self._total_capacity_kwh = 0.0  # drop accumulated float drift
+        self._g_sites.set(len(self._sites))
         log.info("fleet.site_removed", site_id=site_id)
 
     @property
@@ -221,88 +397,158 @@ class FleetOrchestrator:
 
     @property
     def total_capacity_kwh(self) -> float:
-        return sum(p.capacity_kwh for p in self._sites.values())
+        return self._total_capacity_kwh
 
     # ------------------------------------------------------------------
     # Orchestration cycle
     # ------------------------------------------------------------------
 
+    def _ensure_http(self) -> None:
+        """Create (or re-create on a new loop) the pooled session for remote sites."""
+        loop = asyncio.get_running_loop()
+        if self._http is not None and not self._http.closed and self._http_loop is loop:
+            return
+        remote = [p for p in self._sites.values() if p.is_remote]
+        if not remote:
+            return
+        stale = self._http
+        if self._http_guard is not None:
+            # Closes the old session on its own loop the next time that loop runs.
+            self._http_guard.cancel()
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=len(remote) + 8, keepalive_timeout=_KEEPALIVE_S)
+        )
+        self._http_loop = loop
+        self._http_guard = loop.create_task(_close_when_cancelled(self._http))
+        for proxy in remote:
+            if proxy.session is None or proxy.session is stale:
+                proxy.session = self._http
+
+    @staticmethod
+    async def _poll_one(
+        proxy: SiteProxy, sem: asyncio.Semaphore, now: float
+    ) -> SiteTelemetry | None:
+        """Fetch one site under ``sem``; errors are logged and yield ``None``."""
+        async with sem:
+            try:
+                return await proxy.fetch_telemetry(now)
+            except Exception as exc:
+                log.error("fleet.poll_error", site_id=proxy.site_id, error=str(exc))
+                return None
+
     async def poll_all(self) -> list[SiteTelemetry]:
         """Poll all registered sites concurrently.
 
+        At most ``max_parallel`` polls are in flight; failed sites are logged
+        and omitted, and results keep registration order.
+
         Returns:
             List of SiteTelemetry objects (one per site).
         """
-        coros = [proxy.fetch_telemetry() for proxy in self._sites.values()]
-        results = await asyncio.gather(*coros, return_exceptions=True)
-        telemetries: list[SiteTelemetry] = []
-        for result in results:
-            if isinstance(result, BaseException):
-                log.error("fleet.poll_error", error=str(result))
-            elif isinstance(result, SiteTelemetry):
-                telemetries.append(result)
-        return telemetries
-
-    def aggregate(self, telemetries: list[SiteTelemetry]) -> FleetSummary:
-        """Aggregate telemetry list into a FleetSummary.
+        self._ensure_http()
+        proxies = list(self._sites.values())
+        slots: list[SiteTelemetry | None] = [None] * len(proxies)
+        sem = asyncio.Semaphore(self.max_parallel)
+        now = time.time()  # one timestamp for the whole poll
+
+        async def _fetch_into(i: int, proxy: SiteProxy) -> None:
+            slots[i] = await self._poll_one(proxy, sem, now)
+
+        # _poll_one never raises, so gather cannot leave siblings running
+        await asyncio.gather(*(_fetch_into(i, proxy) for i, proxy in enumerate(proxies)))
+        return [tel for tel in slots if tel is not None]
+
+    async def poll_batch(self) -> FleetTelemetryBatch:
+        """Poll all registered sites concurrently into a preallocated batch.
+
+        Each site writes straight into its own slot; sites whose poll failed
+        are dropped from the returned batch.
+
+        Returns:
+            FleetTelemetryBatch with one slot per successfully polled site.
+        """
+        self._ensure_http()
+        proxies = list(self._sites.values())
+        batch = FleetTelemetryBatch.empty(len(proxies))
+        ok = np.zeros(len(proxies), dtype=bool)
+        sem = asyncio.Semaphore(self.max_parallel)
+        now = time.time()  # one timestamp for the whole poll
+
+        async def _fetch_into(i: int, proxy: SiteProxy) -> None:
+            tel = await self._poll_one(proxy, sem, now)
+            if tel is not None:
+                batch.write(i, tel)
+                ok[i] = True
+
+        await asyncio.gather(*(_fetch_into(i, proxy) for i, proxy in enumerate(proxies)))
+        return batch if ok.all() else batch.take(ok)
+
+    def aggregate(
+        self, telemetries: list[SiteTelemetry] | FleetTelemetryBatch
+    ) -> FleetSummary:
+        """Aggregate fleet telemetry into a FleetSummary.
 
         Args:
-            telemetries: List of SiteTelemetry dataclasses.
+            telemetries: List of SiteTelemetry dataclasses, or a
+                FleetTelemetryBatch as returned by :meth:`poll_batch`.
 
         Returns:
             FleetSummary KPIs.
         """
-        if not telemetries:
-            return FleetSummary(
-                n_sites=0,
-                total_capacity_kwh=0.0,
-                fleet_soc_pct=0.0,
-                total_power_kw=0.0,
-                total_available_kw=0.0,
-                sites_in_alarm=0,
-                cycle_duration_s=0.0,
+        n = len(telemetries)
+        if n == 0:
+            return FleetSummary.empty()
+
+        if isinstance(telemetries, list) and n < _VECTORIZE_MIN_SITES:
+            total_cap = sum(t.capacity_kwh for t in telemetries)
+            weighted_soc = (
+                sum(t.soc_pct * t.capacity_kwh for t in telemetries) / total_cap
+                if total_cap > 0
+                else 0.0
             )
-
-        total_cap = sum(t.capacity_kwh for t in telemetries)
-        weighted_soc = (
-            sum(t.soc_pct * t.capacity_kwh for t in telemetries) / total_cap
-            if total_cap > 0
-            else 0.0
-        )
-        total_power = sum(t.power_kw for t in telemetries)
-        total_avail = sum(t.available_kw for t in telemetries)
-        alarms = sum(1 for t in telemetries if t.anomaly_score > self.anomaly_threshold)
+            total_power = sum(t.power_kw for t in telemetries)
+            total_avail = sum(t.available_kw for t in telemetries)
+            alarms = sum(1 for t in telemetries if t.anomaly_score > self.anomaly_threshold)
+        else:
+            batch = (
+                telemetries
+                if isinstance(telemetries, FleetTelemetryBatch)
+                else FleetTelemetryBatch.from_telemetries(telemetries)
+            )
+            total_cap = float(batch.capacity.sum())
+            weighted_soc = float(batch.soc @ batch.capacity) / total_cap if total_cap > 0 else 0.0
+            total_power = float(batch.power.sum())
+            total_avail = float(batch.available.sum())
+            alarms = int(np.count_nonzero(batch.anomaly > self.anomaly_threshold))
 
         # Update Prometheus
-        FLEET_TOTAL_CAPACITY_KWH.labels(site_id=self.site_id).set(total_cap)
-        FLEET_SITES_ACTIVE.labels(site_id=self.site_id).set(len(telemetries))
+        self._g_cap.set(total_cap)
+        self._g_sites.set(n)
 
         return FleetSummary(
-            n_sites=len(telemetries),
+            n_sites=n,
             total_capacity_kwh=total_cap,
             fleet_soc_pct=weighted_soc,
             total_power_kw=total_power,
             total_available_kw=total_avail,
             sites_in_alarm=alarms,
-            cycle_duration_s=0.0,  # populated by run_cycle()
+            cycle_duration_s=0.0,  # populated by run_cycle(), as is timestamp
         )
 
     def run_cycle(self) -> FleetSummary:
-        """Run a synchronous orchestration cycle (wraps async poll_all).
+        """Run a synchronous orchestration cycle (wraps async poll_batch).
 
         Returns:
             FleetSummary with aggregated fleet KPIs.
         """
         t0 = time.perf_counter()
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        if self._loop is None or self._loop.is_closed():
+            self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
 
-        telemetries = loop.run_until_complete(self.poll_all())
-        summary = self.aggregate(telemetries)
+        batch = self._loop.run_until_complete(self.poll_batch())
+        summary = self.aggregate(batch)
         summary.cycle_duration_s = time.perf_counter() - t0
+        summary.timestamp = time.time()
 
         log.info(
             "fleet.cycle_complete",
@@ -313,3 +559,32 @@ class FleetOrchestrator:
             duration_s=round(summary.cycle_duration_s, 4),
         )
         return summary
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session, if one was opened."""
+        session, guard = self._http, self._http_guard
+        self._http = None
+        self._http_loop = None
+        self._http_guard = None
+        if guard is not None:
+            guard.cancel()
+            # On another loop the close completes the next time that loop runs.
+            if guard.get_loop() is asyncio.get_running_loop():
+                await asyncio.wait([guard])
+                if session is not None and not session.closed:
+                    await session.close()  # guard was cancelled before it started
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and the private :meth:`run_cycle` loop."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            if self._http_loop is loop:
+                loop.run_until_complete(self.aclose())
+            # Let cancelled session guards (e.g. from a later loop switch) finish.
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+        self._loop = None
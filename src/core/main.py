@@ -35,10 +35,14 @@ Run
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
 import os
 import signal
 import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from datetime import datetime, timezone
 from importlib.metadata import version as _pkg_version
 from typing import Any
 
@@ -48,15 +52,17 @@ except Exception:
     _GATEWAY_VERSION = "dev"
 
 import structlog
+from opentelemetry import trace
 
 from src.core.config import get_settings
 from src.core.safety import SafetyGuard
 from src.drivers.base import DataProvider
 from src.drivers.modbus_driver import UniversalDriver
-from src.drivers.simulator_driver import SimMode, SimulatorDriver
+from src.drivers.simulator_driver import SimulatorDriver
 from src.interfaces.ancillary_services import CapacityAllocator
 from src.interfaces.metrics import (
     BESS_SSCC_RESERVED_KW,
+    CYCLE_OVERRUNS_TOTAL,
     CYCLES_TOTAL,
     GATEWAY_INFO,
     GRID_FREQUENCY_HZ,
@@ -68,11 +74,22 @@ from src.interfaces.metrics import (
     SAFETY_BLOCKS_TOTAL,
 )
 from src.interfaces.mqtt_publisher import MQTTConnectionError, MQTTPublisher
-from src.interfaces.otel_setup import configure_otel, get_tracer, shutdown_otel
+from src.interfaces.otel_setup import (
+    configure_otel,
+    get_tracer,
+    shutdown_otel,
+    tracing_enabled,
+)
 from src.interfaces.pubsub_publisher import PubSubPublisher
 from src.interfaces.sep2_adapter import SEP2Error, build_adapter_from_env
 from src.interfaces.server import BESSAIServer
 
+# Optional libuv event loop — faster sleep/task scheduling when installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
 # BEP-0200 — DRL Arbitrage Agent (optional, fail-safe)
 try:
     from src.agents.arbitrage_policy import ArbitragePolicy
@@ -99,7 +116,7 @@ except ImportError:
     _COMPLIANCE_AVAILABLE = False
     _ComplianceStack = None  # type: ignore[assignment]
 
-# Resolve settings once at module level (safe — uses _LazySettings proxy)
+# Resolve settings once at module level
 _cfg = get_settings()
 
 
@@ -108,18 +125,53 @@ _cfg = get_settings()
 # ---------------------------------------------------------------------------
 logging.basicConfig(level=logging.INFO)
 
+# Minimum log level from settings, resolved once.  Hot-path INFO logs check
+# _INFO_ENABLED first so a filtered call does not even build its kwargs.
+_level = logging.getLevelName(_cfg.LOG_LEVEL.upper())  # int for known names, else a str
+_LOG_LEVEL: int = _level if isinstance(_level, int) else logging.INFO
+_INFO_ENABLED: bool = _LOG_LEVEL <= logging.INFO
+
+# orjson renders log lines several times faster than stdlib json; it emits
+# bytes, so it is paired with the bytes logger.  Non-str keys and numpy
+# scalars/arrays are accepted like the stdlib path accepts them, and anything
+# else falls back to structlog's repr() handler instead of dropping the line.
+try:
+    import orjson
+
+    _log_renderer = structlog.processors.JSONRenderer(
+        serializer=orjson.dumps,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+    _log_factory: Any = structlog.BytesLoggerFactory()
+except ImportError:
+    try:
+        import ujson
+
+        _log_renderer = structlog.processors.JSONRenderer(serializer=ujson.dumps)
+    except ImportError:
+        _log_renderer = structlog.processors.JSONRenderer()
+    _log_factory = structlog.PrintLoggerFactory()
+
+# Processor chain built once as an immutable tuple.  No code binds
+# contextvars, so merge_contextvars is left out of the chain; the ISO
+# stamper uses datetime.isoformat(), not strftime.
+_LOG_PROCESSORS = (
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    _log_renderer,
+)
+
 structlog.configure(
-    processors=[
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    logger_factory=structlog.PrintLoggerFactory(),
+    processors=_LOG_PROCESSORS,
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+    logger_factory=_log_factory,
+    cache_logger_on_first_use=True,
 )
 
-log: structlog.BoundLogger = structlog.get_logger(__name__)
+# Site and version are bound once rather than passed on individual calls.
+log: structlog.BoundLogger = structlog.get_logger(__name__).bind(
+    site=_cfg.SITE_ID, version=_GATEWAY_VERSION
+)
 
 # ---------------------------------------------------------------------------
 # DRL agent model path (env var or default)
@@ -135,18 +187,82 @@ _WATCHDOG_MANAGER_ENABLED: bool = os.getenv("BESSAI_WATCHDOG_ENABLED", "true").l
 # ---------------------------------------------------------------------------
 # Tags read on every acquisition cycle
 # ---------------------------------------------------------------------------
-_ACQUISITION_TAGS: list[str] = ["active_power", "soc", "frequency", "ac_voltage"]
+_ACQUISITION_TAGS: tuple[str, ...] = ("active_power", "soc", "frequency", "ac_voltage")
 
 # ---------------------------------------------------------------------------
-# Graceful shutdown — shared event set by signal handlers
+# OpenTelemetry span attribute keys for the per-cycle span
 # ---------------------------------------------------------------------------
-_shutdown_event: asyncio.Event
+_ATTR_CYCLE = "cycle"
+_ATTR_SITE = "site_id"
+_ATTR_TAGS = "tags_acquired"
+_ATTR_SAFETY = "safety_ok"
+
+# Labelled children resolved once for the module-level helpers.
+_publish_errors = PUBLISH_ERRORS_TOTAL.labels(site_id=_cfg.SITE_ID)
+_cycle_overruns = CYCLE_OVERRUNS_TOTAL.labels(site_id=_cfg.SITE_ID)
 
+# ---------------------------------------------------------------------------
+# Graceful shutdown — signal handler bound to main()'s shutdown event
+# ---------------------------------------------------------------------------
 
-def _handle_signal(sig: signal.Signals) -> None:
-    """Mark the shutdown event so the main loop exits cleanly."""
+
+def _handle_signal(sig: signal.Signals, shutdown: asyncio.Event) -> None:
+    """Set *shutdown* so the main loop exits cleanly."""
     log.warning("shutdown.signal_received", signal=sig.name)
-    _shutdown_event.set()
+    shutdown.set()
+
+
+# ---------------------------------------------------------------------------
+# Per-cycle acquisition record
+# ---------------------------------------------------------------------------
+
+
+class _Telemetry(Mapping[str, Any]):
+    """
+    Acquisition record allocated once and refilled every cycle.
+
+    One slot per tag in ``_ACQUISITION_TAGS`` plus a bitmask of the tags
+    read this cycle.  It implements the read-only ``Mapping`` interface so
+    the safety guard, compliance stack and publishers consume it exactly
+    like the former per-cycle dict.  Take a copy (``dict(tel)``) before
+    keeping it beyond the current cycle.
+    """
+
+    __slots__ = (*_ACQUISITION_TAGS, "_valid_mask")
+    _BITS: dict[str, int] = {tag: 1 << i for i, tag in enumerate(_ACQUISITION_TAGS)}
+
+    def __init__(self) -> None:
+        self._valid_mask = 0
+
+    def clear(self) -> None:
+        """Mark every tag as not read."""
+        self._valid_mask = 0
+
+    def set(self, tag: str, value: Any) -> None:
+        """Store *value* for *tag* and mark it as read this cycle."""
+        setattr(self, tag, value)
+        self._valid_mask |= self._BITS[tag]
+
+    def __getitem__(self, tag: str) -> Any:
+        if not self._valid_mask & self._BITS.get(tag, 0):
+            raise KeyError(tag)
+        return getattr(self, tag)
+
+    def __contains__(self, tag: object) -> bool:
+        return bool(self._valid_mask & self._BITS.get(tag, 0))  # type: ignore[arg-type]
+
+    def get(self, tag: str, default: Any = None) -> Any:
+        return getattr(self, tag) if tag in self else default
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self._valid_mask
+        return (tag for tag in _ACQUISITION_TAGS if mask & self._BITS[tag])
+
+    def __len__(self) -> int:
+        return self._valid_mask.bit_count()
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 # ---------------------------------------------------------------------------
@@ -154,58 +270,205 @@ def _handle_signal(sig: signal.Signals) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def _acquire(driver: DataProvider) -> dict[str, Any]:
+async def _acquire(
+    driver: DataProvider,
+    tags: tuple[str, ...],
+    read_tags: Callable[[Sequence[str]], Awaitable[dict[str, float]]] | None,
+    out: _Telemetry,
+) -> _Telemetry:
     """
-    Read ``_ACQUISITION_TAGS`` from the device.  Tags that fail are logged
-    and skipped so a single bad register does not block valid readings.
+    Read *tags* (the ``_ACQUISITION_TAGS`` the driver defines, see
+    :func:`_resolve_acquisition_tags`) from the device into *out* and return it.
+
+    *read_tags* is the driver's bulk reader, resolved once at startup
+    (``None`` if the driver has none); it fetches every tag in one
+    coalesced request.  If it is unavailable or fails, the tags are read
+    individually but concurrently; tags that fail are logged and skipped
+    so a single bad register does not block valid readings.
     """
-    telemetry: dict[str, Any] = {}
-    for tag in _ACQUISITION_TAGS:
+    out.clear()
+    if read_tags is not None:
         try:
-            telemetry[tag] = await driver.read_tag(tag)
+            for tag, value in (await read_tags(tags)).items():
+                out.set(tag, value)
+            return out
         except Exception as exc:
-            log.warning("acquire.tag.skip", tag=tag, error=str(exc))
-    return telemetry
+            out.clear()
+            log.debug("acquire.read_tags.fallback", error=str(exc))
+
+    results = await asyncio.gather(*map(driver.read_tag, tags), return_exceptions=True)
+    for tag, result in zip(tags, results, strict=True):
+        if isinstance(result, BaseException):
+            log.warning("acquire.tag.skip", tag=tag, error=str(result))
+        else:
+            out.set(tag, result)
+    return out
+
+
+def _resolve_acquisition_tags(driver: DataProvider) -> tuple[str, ...]:
+    """
+    Return the ``_ACQUISITION_TAGS`` that *driver*'s profile defines.
+
+    Requesting an undefined tag would fail every bulk read and push every
+    cycle onto the single-tag fallback, so missing tags are dropped (and
+    logged) once at startup.  Drivers without ``tag_names`` get them all.
+    """
+    tag_names = getattr(driver, "tag_names", None)
+    if tag_names is None:
+        return _ACQUISITION_TAGS
+    tags = tuple(tag for tag in _ACQUISITION_TAGS if tag in tag_names)
+    missing = [tag for tag in _ACQUISITION_TAGS if tag not in tag_names]
+    if missing:
+        log.warning("acquire.tags_not_in_profile", tags=missing, acquiring=list(tags))
+    return tags
 
 
 # ---------------------------------------------------------------------------
-# Helper — ensure the watchdog task is alive; (re)start if needed
+# Helper — fixed-cadence pacing of the acquisition loop
 # ---------------------------------------------------------------------------
 
 
-def _ensure_watchdog(
-    guard: SafetyGuard,
-    driver: DataProvider,
-    watchdog_ref: list[asyncio.Task[None]],
-) -> None:
+async def _pace(deadline: float, period_s: float, cycle: int) -> float:
     """
-    Start the watchdog background task if it is not currently running.
+    Sleep until the next cycle deadline and return it.
 
-    *watchdog_ref* is a one-element list used as a mutable reference so
-    callers can inspect the current task object.
+    Deadlines are absolute ``loop.time()`` values that advance by
+    *period_s* from the previous deadline rather than from "now", so work
+    time does not accumulate as drift.  If a cycle overruns its slot, the
+    overrun is logged, counted in ``CYCLE_OVERRUNS_TOTAL`` and the schedule
+    restarts from the current time instead of bursting to catch up.
     """
-    task: asyncio.Task[None] | None = watchdog_ref[0] if watchdog_ref else None
-
-    if task is None or task.done():
-        if task is not None and not task.cancelled():
-            exc = task.exception()
-            if exc:
-                log.critical(
-                    "watchdog.died",
-                    error=str(exc),
-                    action="restarting",
-                )
+    loop = asyncio.get_running_loop()
+    deadline += period_s
+    now = loop.time()
+    if now > deadline:
+        log.warning("cycle.overrun", cycle=cycle, slack_s=round(deadline - now, 3))
+        _cycle_overruns.inc()
+        return now
+    await asyncio.sleep(deadline - now)
+    return deadline
+
+
+# ---------------------------------------------------------------------------
+# Helper — flush buffered telemetry to Pub/Sub without awaiting confirms
+# ---------------------------------------------------------------------------
+
+# Seconds to wait for outstanding publishes during graceful shutdown.
+_PUBLISH_DRAIN_TIMEOUT_S = 10.0
 
-        new_task: asyncio.Task[None] = asyncio.create_task(
-            guard.watchdog_loop(driver), name="watchdog"
+
+def _on_publish_done(
+    cycle: int,
+    n_messages: int,
+    log_success: bool,
+    task: asyncio.Task[list[str]],
+) -> None:
+    """Log the outcome of a background publish and count failures."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        log.error(
+            "cycle.publish_failed",
+            cycle=cycle,
+            n_messages=n_messages,
+            error=str(exc),
+        )
+        _publish_errors.inc()
+    elif log_success:
+        log.info(
+            "cycle.published",
+            cycle=cycle,
+            n_messages=n_messages,
+            message_ids=task.result(),
         )
-        if watchdog_ref:
-            watchdog_ref[0] = new_task
-        else:
-            watchdog_ref.append(new_task)
 
+
+async def _flush_publish_batch(
+    publisher: PubSubPublisher,
+    batch: list[dict[str, Any]],
+    cycle: int,
+    log_success: bool = _INFO_ENABLED,
+) -> None:
+    """
+    Hand every sample in *batch* to the publisher in one request and clear it.
+
+    The cycle does not wait for the server's confirmation: the outcome is
+    reported by :func:`_on_publish_done`, which counts failures in
+    ``PUBLISH_ERRORS_TOTAL`` and logs successes only if *log_success*.
+    Failed samples are dropped rather than retried so memory stays bounded.
+    """
+    try:
+        task = await publisher.publish_nowait(batch)
+        task.add_done_callback(
+            functools.partial(_on_publish_done, cycle, len(batch), log_success)
+        )
+    except Exception as exc:
+        log.error(
+            "cycle.publish_failed",
+            cycle=cycle,
+            n_messages=len(batch),
+            error=str(exc),
+        )
+        _publish_errors.inc()
+    finally:
+        batch.clear()
+
+
+# ---------------------------------------------------------------------------
+# Watchdog supervision — restart the heartbeat task if it dies
+# ---------------------------------------------------------------------------
+
+# Pause before restarting a watchdog that died, so a task that fails
+# immediately cannot spin the event loop.
+_WATCHDOG_RESTART_DELAY_S: float = 1.0
+
+
+class _WatchdogSupervisor:
+    """
+    Own the ``SafetyGuard.watchdog_loop`` task and keep it alive.
+
+    Liveness is checked by a done-callback on the task rather than by
+    polling from the acquisition loop: when the task ends for any reason
+    other than :meth:`stop`, it is restarted after
+    ``_WATCHDOG_RESTART_DELAY_S``.
+    """
+
+    def __init__(self, guard: SafetyGuard, driver: DataProvider) -> None:
+        self._guard = guard
+        self._driver = driver
+        self.task: asyncio.Task[None] | None = None
+        self._restart_handle: asyncio.TimerHandle | None = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """Create the watchdog task and attach the restart callback."""
+        self._restart_handle = None
+        self.task = asyncio.create_task(self._guard.watchdog_loop(self._driver), name="watchdog")
+        self.task.add_done_callback(self._on_done)
         log.info("watchdog.started_or_restarted")
 
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        if self._stopping:
+            return
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            log.critical("watchdog.died", error=str(exc), action="restarting")
+        self._restart_handle = asyncio.get_running_loop().call_later(
+            _WATCHDOG_RESTART_DELAY_S, self.start
+        )
+
+    async def stop(self) -> None:
+        """Cancel the watchdog (and any pending restart) and wait for it."""
+        self._stopping = True
+        if self._restart_handle is not None:
+            self._restart_handle.cancel()
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except (asyncio.CancelledError, Exception):
+                pass
+
 
 # ---------------------------------------------------------------------------
 # Main coroutine
@@ -216,35 +479,36 @@ async def main() -> None:  # noqa: C901
     """
     Bootstrap and run the BESSAI Edge Gateway until a shutdown signal.
     """
-    global _shutdown_event
-    _shutdown_event = asyncio.Event()
+    shutdown = asyncio.Event()
 
     # ── Register OS signal handlers ───────────────────────────────────────
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         try:
-            loop.add_signal_handler(sig, _handle_signal, sig)
+            loop.add_signal_handler(sig, _handle_signal, sig, shutdown)
         except NotImplementedError:
             pass  # Ignorado en Windows (EventLoop no soporta señales POSIX)
 
     # ── Step 2 — OpenTelemetry ────────────────────────────────────────────
     configure_otel()
     tracer = get_tracer()
+    # Without an exporter every span would be a non-recording no-op, so the
+    # cycle skips span creation and uses a shared no-op span instead.
+    tracing = tracing_enabled()
+    no_span = contextlib.nullcontext(trace.INVALID_SPAN)
 
     # ── Step 3 — Driver instantiation (factory: sim ↔ real) ─────────────
     # Decision logic:
     #   BESSAI_MODE=demo        → always SimulatorDriver
     #   BESSAI_MODE=production  → always UniversalDriver (fails if IP missing)
     #   BESSAI_MODE=auto (def.) → SimulatorDriver if INVERTER_IP not set, else UniversalDriver
-    _bessai_mode = os.getenv("BESSAI_MODE", "auto").lower()
-    _inverter_ip = getattr(_cfg, "inverter_ip_str", None) or os.getenv("INVERTER_IP", "")
-
-    _use_sim = _bessai_mode == "demo" or (_bessai_mode == "auto" and not _inverter_ip)
+    _bessai_mode = _cfg.BESSAI_MODE
+    _use_sim = _bessai_mode == "demo" or (_bessai_mode == "auto" and not _cfg.inverter_ip_str)
 
     driver: DataProvider
     if _use_sim:
-        _sim_mode = os.getenv("BESSAI_SIM_MODE", SimMode.NORMAL)
-        _profile = getattr(_cfg, "DEVICE_PROFILE", "huawei_sun2000")
+        _sim_mode = _cfg.BESSAI_SIM_MODE
+        _profile = _cfg.DEVICE_PROFILE
         driver = SimulatorDriver(
             profile=_profile,
             mode=_sim_mode,
@@ -307,12 +571,23 @@ async def main() -> None:  # noqa: C901
         version=_GATEWAY_VERSION,
         port=_cfg.HEALTH_PORT,
     )
+    health_server.set_driver(driver)
     # Register static info gauge
     GATEWAY_INFO.labels(site_id=_cfg.SITE_ID, version=_GATEWAY_VERSION).set(1)
-
-    # ── Step 5 — Safety guard, publisher, watchdog reference ─────────────
+    # Per-cycle gauges/counters: the site label never changes, so resolve
+    # each labelled child once instead of calling .labels() every cycle.
+    _last_soc = LAST_SOC_PERCENT.labels(site_id=_cfg.SITE_ID)
+    _last_power = LAST_POWER_KW.labels(site_id=_cfg.SITE_ID)
+    _grid_freq = GRID_FREQUENCY_HZ.labels(site_id=_cfg.SITE_ID)
+    _grid_voltage = GRID_VOLTAGE_V.labels(site_id=_cfg.SITE_ID)
+    _safety_blocks = SAFETY_BLOCKS_TOTAL.labels(site_id=_cfg.SITE_ID, reason="out_of_range")
+    _sscc_reserved = BESS_SSCC_RESERVED_KW.labels(site_id=_cfg.SITE_ID)
+    _cycles = CYCLES_TOTAL.labels(site_id=_cfg.SITE_ID)
+    _last_duration = LAST_CYCLE_DURATION_S.labels(site_id=_cfg.SITE_ID)
+
+    # ── Step 5 — Safety guard, publisher, watchdog supervisor ────────────
     guard = SafetyGuard(watchdog_interval_s=1.0)
-    watchdog_ref: list[asyncio.Task[None]] = []  # mutable single-element ref
+    watchdog = _WatchdogSupervisor(guard, driver)
 
     if not _cfg.GCP_PROJECT_ID:
         raise ValueError(
@@ -326,6 +601,8 @@ async def main() -> None:  # noqa: C901
         PubSubPublisher(
             project_id=_cfg.GCP_PROJECT_ID,
             topic_name=_cfg.GCP_PUBSUB_TOPIC,
+            max_request_messages=_cfg.PUBSUB_BATCH_MAX_MESSAGES,
+            max_request_bytes=_cfg.PUBSUB_BATCH_MAX_BYTES,
         ) as publisher,
         health_server.run(),
     ):
@@ -453,60 +730,101 @@ async def main() -> None:  # noqa: C901
 
         log.info(
             "gateway.started",
-            site=_cfg.SITE_ID,
             inverter=_cfg.inverter_ip_str,
             poll_interval_s=_cfg.WATCHDOG_TIMEOUT,
             health_port=_cfg.HEALTH_PORT,
         )
+        log.info(
+            "pubsub.batching",
+            batch_size=_cfg.PUBSUB_BATCH_SIZE,
+            batch_interval_s=_cfg.PUBSUB_BATCH_INTERVAL_S,
+            max_request_messages=_cfg.PUBSUB_BATCH_MAX_MESSAGES,
+            max_request_bytes=_cfg.PUBSUB_BATCH_MAX_BYTES,
+        )
 
         cycle: int = 0
+        # Pub/Sub batching: flush every PUBSUB_BATCH_SIZE samples or
+        # PUBSUB_BATCH_INTERVAL_S seconds, whichever comes first.
+        _publish_batch: list[dict[str, Any]] = []
+        _last_flush = time.monotonic()
+        # Start of the current cycle's slot; advanced by _pace() each cycle.
+        deadline = asyncio.get_running_loop().time()
+        _tel = _Telemetry()
+
+        # Settings and callables used every cycle, bound to fast locals.
+        site_id = _cfg.SITE_ID
+        period_s = _cfg.WATCHDOG_TIMEOUT
+        batch_size = _cfg.PUBSUB_BATCH_SIZE
+        batch_interval_s = _cfg.PUBSUB_BATCH_INTERVAL_S
+        monotonic = time.monotonic
+        shutdown_is_set = shutdown.is_set
+        # Capability probes done once here instead of every cycle.
+        read_tags = getattr(driver, "read_tags", None)
+        acquisition_tags = _resolve_acquisition_tags(driver)
+        # Per-cycle INFO logs are sampled: every log_every cycles, or when
+        # the logged state changes (errors and warnings are never sampled).
+        log_every = _cfg.LOG_EVERY_N_CYCLES
+        _prev_drl_rule: Any = None
 
         # ── Infinite acquisition loop ─────────────────────────────────────
-        while not _shutdown_event.is_set():
+        while not shutdown_is_set():
             cycle += 1
-            cycle_start = time.monotonic()
-
-            with tracer.start_as_current_span("bess.cycle") as span:
-                span.set_attribute("cycle", cycle)
-                span.set_attribute("site_id", _cfg.SITE_ID)
-
-                # ── STEP 1: Adquisición ───────────────────────────────────
-                telemetry = await _acquire(driver)
-
-                if not telemetry:
-                    log.warning("cycle.empty_telemetry", cycle=cycle)
-                    health_server.last_cycle_ok = False
-                    await asyncio.sleep(_cfg.WATCHDOG_TIMEOUT)
-                    continue
+            cycle_start = monotonic()
+            log_sampled = _INFO_ENABLED and cycle % log_every == 0
+            cycle_start_ns = time.time_ns()
+
+            # ── STEP 1: Adquisición ───────────────────────────────────────
+            # Acquire before opening the span so empty cycles never pay for
+            # one; the span is backdated below to still cover acquisition.
+            telemetry = await _acquire(driver, acquisition_tags, read_tags, _tel)
+
+            if not telemetry:
+                log.warning("cycle.empty_telemetry", cycle=cycle)
+                health_server.last_cycle_ok = False
+                deadline = await _pace(deadline, period_s, cycle)
+                continue
+
+            with (
+                tracer.start_as_current_span(
+                    "bess.cycle",
+                    attributes={_ATTR_CYCLE: cycle, _ATTR_SITE: site_id},
+                    start_time=cycle_start_ns,
+                )
+                if tracing
+                else no_span
+            ) as span:
+                span.set_attribute(_ATTR_TAGS, tuple(telemetry))
 
-                span.set_attribute("tags_acquired", list(telemetry.keys()))
+                # Bind the readings used below once per cycle.
+                soc = telemetry.get("soc")
+                power_w = telemetry.get("active_power")
+                soc_pct = float(soc) if soc is not None else None
+                p_kw = float(power_w) / 1000.0 if power_w is not None else 0.0
 
                 # Update telemetry gauges
-                if "soc" in telemetry:
-                    LAST_SOC_PERCENT.labels(site_id=_cfg.SITE_ID).set(float(telemetry["soc"]))
-                if "active_power" in telemetry:
-                    LAST_POWER_KW.labels(site_id=_cfg.SITE_ID).set(
-                        float(telemetry["active_power"]) / 1000.0
-                    )
-                if "frequency" in telemetry:
-                    GRID_FREQUENCY_HZ.labels(site_id=_cfg.SITE_ID).set(float(telemetry["frequency"]))
-                if "ac_voltage" in telemetry:
-                    GRID_VOLTAGE_V.labels(site_id=_cfg.SITE_ID).set(float(telemetry["ac_voltage"]))
+                if soc_pct is not None:
+                    _last_soc.set(soc_pct)
+                if power_w is not None:
+                    _last_power.set(p_kw)
+                if (frequency := telemetry.get("frequency")) is not None:
+                    _grid_freq.set(float(frequency))
+                if (ac_voltage := telemetry.get("ac_voltage")) is not None:
+                    _grid_voltage.set(float(ac_voltage))
 
                 # ── STEP 2: Seguridad ─────────────────────────────────────
                 is_safe = guard.check_safety(telemetry)
-                span.set_attribute("safety_ok", is_safe)
+                span.set_attribute(_ATTR_SAFETY, is_safe)
 
                 if not is_safe:
                     log.critical(
                         "SAFETY_BLOCK",
                         cycle=cycle,
-                        telemetry=telemetry,
+                        telemetry=dict(telemetry),
                         action="HALTING_PUBLISH — manual intervention required",
                     )
-                    SAFETY_BLOCKS_TOTAL.labels(site_id=_cfg.SITE_ID, reason="out_of_range").inc()
+                    _safety_blocks.inc()
                     health_server.set_cycle(cycle, ok=False, safety_status="BLOCKED")
-                    await asyncio.sleep(_cfg.WATCHDOG_TIMEOUT)
+                    deadline = await _pace(deadline, period_s, cycle)
                     continue
 
                 # ── STEP 2b: NTSyCS Compliance (v2.15.0) ──────────────────
@@ -536,40 +854,46 @@ async def main() -> None:  # noqa: C901
                         )
 
                 # ── STEP 2c: Capacity Allocator (SS.CC.) ──────────────────
-                _soc_pct_alloc = float(telemetry.get("soc", 50.0))
-                sscc_stack = _capacity_allocator.allocate(soc_pct=_soc_pct_alloc)
-                BESS_SSCC_RESERVED_KW.labels(site_id=_cfg.SITE_ID).set(sscc_stack.total_reserved_kw)
+                sscc_stack = _capacity_allocator.allocate(
+                    soc_pct=soc_pct if soc_pct is not None else 50.0
+                )
+                _sscc_reserved.set(sscc_stack.total_reserved_kw)
                 span.set_attribute("sscc_reserved_kw", sscc_stack.total_reserved_kw)
 
                 health_server.set_cycle(cycle, ok=True, safety_status="ok")
 
                 # ── STEP 3: Watchdog ──────────────────────────────────────
-                _ensure_watchdog(guard, driver, watchdog_ref)
+                # Started after the first safe cycle; restarts are handled
+                # by the supervisor's done-callback.
+                if watchdog.task is None:
+                    watchdog.start()
 
                 # ── STEP 4: Publicación ───────────────────────────────────
-                try:
-                    msg_id = await publisher.publish(telemetry)
-                    log.info(
-                        "cycle.published",
-                        cycle=cycle,
-                        message_id=msg_id,
-                        telemetry=telemetry,
-                    )
-                except Exception as exc:
-                    log.error(
-                        "cycle.publish_failed",
-                        cycle=cycle,
-                        error=str(exc),
+                # Stamp at acquisition time so batched samples keep their own time.
+                _publish_batch.append(
+                    {"observed_at": datetime.now(tz=timezone.utc).isoformat(), **telemetry}
+                )
+                _now = monotonic()
+                if (
+                    len(_publish_batch) >= batch_size
+                    or _now - _last_flush >= batch_interval_s
+                ):
+                    span.set_attribute("published_messages", len(_publish_batch))
+                    await _flush_publish_batch(
+                        publisher,
+                        _publish_batch,
+                        cycle,
+                        log_success=log_sampled
+                        or (_INFO_ENABLED and len(_publish_batch) >= log_every),
                     )
-                    PUBLISH_ERRORS_TOTAL.labels(site_id=_cfg.SITE_ID).inc()
-                    span.record_exception(exc)
+                    _last_flush = _now
 
                 # ── STEP 4b: MQTT dual-channel (fail-safe) ────────────────
                 if mqtt_pub is not None and mqtt_pub.is_connected:
                     try:
                         await mqtt_pub.publish_telemetry(
-                            soc=float(telemetry.get("soc", 0.0)),
-                            power_kw=float(telemetry.get("active_power", 0.0)) / 1000.0,
+                            soc=soc_pct or 0.0,
+                            power_kw=p_kw,
                             temp_c=float(telemetry.get("temp_c", 25.0)),
                         )
                         await mqtt_pub.publish_safety(
@@ -587,12 +911,12 @@ async def main() -> None:  # noqa: C901
                 # ── STEP 4c: DRL Arbitrage setpoint (BEP-0200 / BEP-0300) ────
                 # BEP-0200: observe-only mode  (BESSAI_DRL_WRITE=false, default)
                 # BEP-0300: active dispatch     (BESSAI_DRL_WRITE=true, opt-in)
-                if _drl_agent is not None and "soc" in telemetry:
+                if _drl_agent is not None and soc_pct is not None:
                     import numpy as np  # local import — optional for edge
 
                     # Build 8-d observation vector (matches BESSArbitrageEnv)
-                    _soc = float(telemetry.get("soc", 50.0)) / 100.0  # [0,1]
-                    _pwr = float(telemetry.get("active_power", 0.0)) / 1000.0  # kW
+                    _soc = soc_pct / 100.0  # [0,1]
+                    _pwr = p_kw  # kW
                     _temp = float(telemetry.get("temp_c", 25.0))
                     # (CMg fields are 0 until CMg Predictor v2 is integrated)
                     _obs = np.array(
@@ -611,6 +935,9 @@ async def main() -> None:  # noqa: C901
                     _p_pu, _drl_info = _drl_agent.predict(_obs)
                     _max_kw: float = sscc_stack.available_for_arbitrage_kw
                     _p_kw = _p_pu * _max_kw
+                    _drl_rule = _drl_info.get("rule", "")
+                    _log_drl = log_sampled or (_INFO_ENABLED and _drl_rule != _prev_drl_rule)
+                    _prev_drl_rule = _drl_rule
 
                     if _DRL_WRITE_ENABLED and is_safe:
                         # BEP-0300: active dispatch — write setpoint to inverter
@@ -618,16 +945,17 @@ async def main() -> None:  # noqa: C901
                         _p_kw_clamped = max(-_max_kw, min(_max_kw, _p_kw))
                         try:
                             await driver.write_tag("active_power_setpoint", _p_kw_clamped)
-                            log.info(
-                                "drl_agent.setpoint_written",
-                                cycle=cycle,
-                                p_pu=round(_p_pu, 3),
-                                p_kw=round(_p_kw_clamped, 1),
-                                source=_drl_info.get("source", "unknown"),
-                                rule=_drl_info.get("rule", ""),
-                                soc_pct=round(_soc * 100, 1),
-                                bep="BEP-0300-active",
-                            )
+                            if _log_drl:
+                                log.info(
+                                    "drl_agent.setpoint_written",
+                                    cycle=cycle,
+                                    p_pu=round(_p_pu, 3),
+                                    p_kw=round(_p_kw_clamped, 1),
+                                    source=_drl_info.get("source", "unknown"),
+                                    rule=_drl_rule,
+                                    soc_pct=round(_soc * 100, 1),
+                                    bep="BEP-0300-active",
+                                )
                         except Exception as _write_exc:
                             log.error(
                                 "drl_agent.write_tag_failed",
@@ -637,45 +965,43 @@ async def main() -> None:  # noqa: C901
                             )
                     else:
                         # BEP-0200: observe-only — log setpoint but do NOT write
-                        log.info(
-                            "drl_agent.setpoint",
-                            cycle=cycle,
-                            p_pu=round(_p_pu, 3),
-                            p_kw=round(_p_kw, 1),
-                            source=_drl_info.get("source", "unknown"),
-                            rule=_drl_info.get("rule", ""),
-                            soc_pct=round(_soc * 100, 1),
-                            bep="BEP-0200-observe-only",
-                            tip="Set BESSAI_DRL_WRITE=true in .env for BEP-0300 active dispatch"
-                            if not _DRL_WRITE_ENABLED
-                            else "Not writing: safety guard blocked this cycle",
-                        )
+                        if _log_drl:
+                            log.info(
+                                "drl_agent.setpoint",
+                                cycle=cycle,
+                                p_pu=round(_p_pu, 3),
+                                p_kw=round(_p_kw, 1),
+                                source=_drl_info.get("source", "unknown"),
+                                rule=_drl_rule,
+                                soc_pct=round(_soc * 100, 1),
+                                bep="BEP-0200-observe-only",
+                                tip="Set BESSAI_DRL_WRITE=true in .env for BEP-0300 active dispatch"
+                                if not _DRL_WRITE_ENABLED
+                                else "Not writing: safety guard blocked this cycle",
+                            )
 
-                CYCLES_TOTAL.labels(site_id=_cfg.SITE_ID).inc()
-                LAST_CYCLE_DURATION_S.labels(site_id=_cfg.SITE_ID).set(
-                    time.monotonic() - cycle_start
-                )
+                _cycles.inc()
+                _last_duration.set(monotonic() - cycle_start)
                 # Feed telemetry into BESSAIServer (/api/v1/telemetry endpoint)
                 health_server.set_telemetry({
-                    "site_id": _cfg.SITE_ID,
-                    "soc_pct": float(telemetry.get("soc", 0.0)),
-                    "p_kw": float(telemetry.get("active_power", 0.0)) / 1000.0,
+                    "site_id": site_id,
+                    "soc_pct": soc_pct or 0.0,
+                    "p_kw": p_kw,
                     "temp_c": float(telemetry.get("temp_c", 25.0)),
                     "safety_ok": is_safe,
                 })
 
                 # ── STEP 5: Ritmo ─────────────────────────────────────────
-                await asyncio.sleep(_cfg.WATCHDOG_TIMEOUT)
+                deadline = await _pace(deadline, period_s, cycle)
 
         # ── Graceful shutdown ─────────────────────────────────────────────
         log.info("shutdown.starting")
 
-        if watchdog_ref and not watchdog_ref[0].done():
-            watchdog_ref[0].cancel()
-            try:
-                await watchdog_ref[0]
-            except (asyncio.CancelledError, Exception):
-                pass
+        if _publish_batch:
+            await _flush_publish_batch(publisher, _publish_batch, cycle)
+        await publisher.drain(timeout=_PUBLISH_DRAIN_TIMEOUT_S)
+
+        await watchdog.stop()
 
     # PubSubPublisher.__aexit__ already closed the session here.
     if _watchdog_manager_task is not None and not _watchdog_manager_task.done():
@@ -698,7 +1024,8 @@ async def main() -> None:  # noqa: C901
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    _run = uvloop.run if uvloop is not None and _cfg.BESSAI_USE_UVLOOP else asyncio.run
     try:
-        asyncio.run(main())
+        _run(main())
     except KeyboardInterrupt:
         pass  # Handled via signal handler inside main()
@@ -78,6 +78,9 @@ class SafetyGuard:
     def __init__(self, watchdog_interval_s: float = 1.0) -> None:
         self._watchdog_interval_s = watchdog_interval_s
         self._heartbeat_counter: int = 0
+        # Limits bound once so the per-cycle check avoids attribute lookups;
+        # read from the instance so subclass overrides still apply.
+        self._limits: tuple[float, float, float] = (self.SOC_MIN, self.SOC_MAX, self.TEMP_MAX)
 
     # ------------------------------------------------------------------
     # Public API — safety check
@@ -113,39 +116,54 @@ class SafetyGuard:
             ok = guard.check_safety({"soc": 3.0, "temp": 30.0})
             # ok == False  (SOC below minimum)
         """
+        soc_min, soc_max, temp_max = self._limits
+        soc = telemetry.get("soc")
+        temp = telemetry.get("temp")
+        try:
+            if (soc is None or soc_min <= soc <= soc_max) and (temp is None or temp <= temp_max):
+                return True
+        except TypeError:
+            pass  # non-numeric value: let the slow path coerce it with float()
+        return self._check_slow(soc, temp)
+
+    def _check_slow(self, soc: Any, temp: Any) -> bool:
+        """Identify and log the tripped limit; called only off the fast path."""
+        soc_min, soc_max, temp_max = self._limits
+
         # --- State of Charge ---
-        if "soc" in telemetry:
-            soc: float = float(telemetry["soc"])
-            if soc < self.SOC_MIN:
+        if soc is not None:
+            soc = float(soc)
+            if soc < soc_min:
                 log.warning(
                     "safety.block.soc_low",
                     soc=soc,
-                    limit=self.SOC_MIN,
+                    limit=soc_min,
                     action="BLOCK",
                 )
                 return False
-            if soc > self.SOC_MAX:
+            if soc > soc_max:
                 log.warning(
                     "safety.block.soc_high",
                     soc=soc,
-                    limit=self.SOC_MAX,
+                    limit=soc_max,
                     action="BLOCK",
                 )
                 return False
 
         # --- Temperature ---
-        if "temp" in telemetry:
-            temp: float = float(telemetry["temp"])
-            if temp > self.TEMP_MAX:
+        if temp is not None:
+            temp = float(temp)
+            if temp > temp_max:
                 log.warning(
                     "safety.block.temp_high",
                     temp=temp,
-                    limit=self.TEMP_MAX,
+                    limit=temp_max,
                     action="BLOCK",
                 )
                 return False
 
-        log.debug("safety.check.pass", telemetry=telemetry)
+        # No log on the pass path: this runs every cycle and the caller
+        # already records the verdict on its span.
         return True
 
     # ------------------------------------------------------------------
@@ -193,8 +211,8 @@ class SafetyGuard:
             while True:
                 await asyncio.sleep(self._watchdog_interval_s)
 
-                # Wrap counter within UINT16 range
-                self._heartbeat_counter = (self._heartbeat_counter + 1) % (self._WATCHDOG_MAX + 1)
+                # Wrap counter within UINT16 range (_WATCHDOG_MAX is 0xFFFF)
+                self._heartbeat_counter = (self._heartbeat_counter + 1) & self._WATCHDOG_MAX
 
                 try:
                     await driver.write_tag("watchdog_heartbeat", float(self._heartbeat_counter))
@@ -29,6 +29,7 @@ Usage::
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 __all__ = ["DataProvider", "DataProviderError", "DriverMode"]
@@ -69,6 +70,8 @@ class DataProvider(Protocol):
     Any class that implements these async methods satisfies the protocol
     without explicit inheritance. Uses ``typing.Protocol`` with
     ``@runtime_checkable`` so ``isinstance(driver, DataProvider)`` works.
+    That check probes every member and is meant for bootstrap and the
+    SPEC-001 contract tests only — never call it per cycle.
 
     Required methods
     ----------------
@@ -83,6 +86,11 @@ class DataProvider(Protocol):
         Read a named register by its profile key (e.g. ``"luna_soc"``).
         Returns the decoded float value with scale applied.
 
+    read_tags(tags)
+        Read several named registers in as few device transactions as
+        possible (e.g. one coalesced Modbus read).  Returns a dict keyed
+        by tag name in request order.
+
     write_tag(tag_name, value)
         Write a named register with scale applied in reverse.
 
@@ -123,6 +131,28 @@ class DataProvider(Protocol):
         """
         ...
 
+    async def read_tags(self, tags: Sequence[str]) -> dict[str, float]:
+        """
+        Read several registers by profile tag name in one operation.
+
+        Parameters
+        ----------
+        tags:
+            Keys from the device profile registers dict.
+
+        Returns
+        -------
+        dict[str, float]
+            Decoded values with scale applied, keyed by tag name in the
+            order requested.
+
+        Raises
+        ------
+        DataProviderError
+            If a tag is unknown or the read fails after retries.
+        """
+        ...
+
     async def write_tag(self, tag_name: str, value: float) -> None:
         """
         Write a register by profile tag name.
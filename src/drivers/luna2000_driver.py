@@ -12,6 +12,9 @@ via Modbus TCP (through the inverter as gateway, slave_id=3 typically).
 Register addresses from: Huawei SUN2000 Modbus Interface Definition v3.0 (2024)
 Battery registers start at 37xxx.
 
+Uses the native asyncio pymodbus client, so reads and writes are plain
+awaits on the event loop rather than executor thread hops.
+
 Usage::
 
     async with LUNADriver(host="192.168.1.100", port=502, slave_id=3) as drv:
@@ -21,8 +24,9 @@ Usage::
 
 from __future__ import annotations
 
-import asyncio
+import struct
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -47,6 +51,46 @@ REG_LUNA_CURRENT = 37801  # INT16  /10 A
 REG_LUNA_MODE = 47086  # UINT16 RW working mode
 REG_LUNA_TARGET_SOC = 47087  # UINT16 RW /10 % charge target
 
+# Bulk FC03 read windows (start, count) covering every telemetry register.
+# FC03 allows at most 125 registers per request.
+_BLOCKS: tuple[tuple[int, int], ...] = (
+    (REG_LUNA_TEMP, REG_LUNA_CURRENT - REG_LUNA_TEMP + 1),  # 37752–37801
+    (REG_LUNA_MODE, 2),  # 47086–47087
+)
+
+# Telemetry fields of the first block in address order, as struct codes.
+_TELEMETRY_FIELDS: tuple[tuple[int, str], ...] = (
+    (REG_LUNA_TEMP, "h"),
+    (REG_LUNA_CAPACITY_HI, "I"),
+    (REG_LUNA_SOC, "H"),
+    (REG_LUNA_SOH, "H"),
+    (REG_LUNA_CYCLE_COUNT, "H"),
+    (REG_LUNA_POWER_HI, "i"),
+    (REG_LUNA_VOLTAGE, "H"),
+    (REG_LUNA_CURRENT, "h"),
+)
+
+
+def _block_decoder(start: int, count: int, fields: tuple[tuple[int, str], ...]) -> struct.Struct:
+    """Build a big-endian Struct that unpacks *fields* from a register block.
+
+    Registers between fields are skipped with pad bytes, so a whole block
+    decodes (including sign extension) in a single C call.
+    """
+    fmt, pos = ">", start
+    for address, code in fields:
+        if address > pos:
+            fmt += f"{2 * (address - pos)}x"
+        fmt += code
+        pos = address + struct.calcsize(code) // 2
+    if start + count > pos:
+        fmt += f"{2 * (start + count - pos)}x"
+    return struct.Struct(fmt)
+
+
+_TELEMETRY_WORDS = struct.Struct(f">{_BLOCKS[0][1]}H")
+_TELEMETRY_DECODER = _block_decoder(*_BLOCKS[0], _TELEMETRY_FIELDS)
+
 
 class BatteryMode(IntEnum):
     """LUNA2000 working mode codes (register 47086)."""
@@ -57,7 +101,7 @@ class BatteryMode(IntEnum):
     REMOTE_DISPATCH = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class LUNATelemetry:
     """Single telemetry snapshot from the LUNA2000 ESS."""
 
@@ -130,10 +174,10 @@ class LUNADriver:
 
     def _make_client(self) -> object:
         try:
-            from pymodbus.client import ModbusTcpClient  # type: ignore
+            from pymodbus.client import AsyncModbusTcpClient  # type: ignore
 
-            return ModbusTcpClient(
-                host=self.host,
+            return AsyncModbusTcpClient(
+                self.host,
                 port=self.port,
                 timeout=3,
                 retries=2,
@@ -141,21 +185,24 @@ class LUNADriver:
         except ImportError:
             raise RuntimeError("pymodbus not installed") from None
 
-    def _read_regs(self, address: int, count: int) -> list[int]:
-        """Read holding registers (FC03). Returns list of raw uint16 values."""
+    async def _read_regs(self, address: int, count: int) -> Sequence[int]:
+        """Read holding registers (FC03). Returns the raw uint16 values.
+
+        The response's register list is returned as-is, without copying.
+        """
         assert self._client is not None
-        result = self._client.read_holding_registers(  # type: ignore
-            address=address, count=count, slave=self.slave_id
+        result = await self._client.read_holding_registers(  # type: ignore
+            address=address, count=count, device_id=self.slave_id
         )
         if result.isError():
             raise OSError(f"Modbus read error addr={address}: {result}")
-        return list(result.registers)
+        return result.registers
 
-    def _write_reg(self, address: int, value: int) -> None:
+    async def _write_reg(self, address: int, value: int) -> None:
         """Write single holding register (FC06)."""
         assert self._client is not None
-        result = self._client.write_register(  # type: ignore
-            address=address, value=value, slave=self.slave_id
+        result = await self._client.write_register(  # type: ignore
+            address=address, value=value, device_id=self.slave_id
         )
         if result.isError():
             raise OSError(f"Modbus write error addr={address}: {result}")
@@ -179,10 +226,7 @@ class LUNADriver:
 
     async def __aenter__(self) -> LUNADriver:
         self._client = self._make_client()
-        connected = await asyncio.get_event_loop().run_in_executor(
-            None,
-            self._client.connect,  # type: ignore
-        )
+        connected = await self._client.connect()  # type: ignore
         if not connected:
             raise ConnectionError(f"Cannot connect to SUN2000 at {self.host}:{self.port}")
         log.info("luna.connected", host=self.host, slave_id=self.slave_id)
@@ -190,10 +234,7 @@ class LUNADriver:
 
     async def __aexit__(self, *_: object) -> None:
         if self._client:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._client.close,  # type: ignore
-            )
+            self._client.close()  # type: ignore
         log.info("luna.disconnected")
 
     # ------------------------------------------------------------------
@@ -206,32 +247,32 @@ class LUNADriver:
         Returns:
             LUNATelemetry with all measured values.
         """
-        loop = asyncio.get_event_loop()
-
-        def _read() -> LUNATelemetry:
-            temp_raw = self._read_regs(REG_LUNA_TEMP, 1)[0]
-            soc_raw = self._read_regs(REG_LUNA_SOC, 1)[0]
-            soh_raw = self._read_regs(REG_LUNA_SOH, 1)[0]
-            cycles = self._read_regs(REG_LUNA_CYCLE_COUNT, 1)[0]
-            cap_regs = self._read_regs(REG_LUNA_CAPACITY_HI, 2)
-            pwr_regs = self._read_regs(REG_LUNA_POWER_HI, 2)
-            volt_raw = self._read_regs(REG_LUNA_VOLTAGE, 1)[0]
-            curr_raw = self._read_regs(REG_LUNA_CURRENT, 1)[0]
-            mode_raw = self._read_regs(REG_LUNA_MODE, 1)[0]
-
-            return LUNATelemetry(
-                soc_pct=soc_raw * 0.1,
-                soh_pct=soh_raw * 0.1,
-                power_kw=self._to_int32(*pwr_regs) * 0.001,
-                voltage_v=volt_raw * 0.1,
-                current_a=self._to_int16(curr_raw) * 0.1,
-                temperature_c=self._to_int16(temp_raw) * 0.1,
-                cycle_count=cycles,
-                capacity_kwh=self._to_uint32(*cap_regs) * 0.001,
-                working_mode=BatteryMode(min(mode_raw, 3)),
-            )
-
-        return await loop.run_in_executor(None, _read)
+        (tel_start, tel_count), (mode_start, mode_count) = _BLOCKS
+        # Two bulk FC03 transactions instead of one round-trip per register.
+        block = await self._read_regs(tel_start, tel_count)
+        mode_raw = (await self._read_regs(mode_start, mode_count))[0]
+        (
+            temp_raw,
+            capacity_raw,
+            soc_raw,
+            soh_raw,
+            cycles,
+            power_raw,
+            volt_raw,
+            curr_raw,
+        ) = _TELEMETRY_DECODER.unpack(_TELEMETRY_WORDS.pack(*block))
+
+        return LUNATelemetry(
+            soc_pct=soc_raw * 0.1,
+            soh_pct=soh_raw * 0.1,
+            power_kw=power_raw * 0.001,
+            voltage_v=volt_raw * 0.1,
+            current_a=curr_raw * 0.1,
+            temperature_c=temp_raw * 0.1,
+            cycle_count=cycles,
+            capacity_kwh=capacity_raw * 0.001,
+            working_mode=BatteryMode(min(mode_raw, 3)),
+        )
 
     async def set_mode(self, mode: BatteryMode) -> None:
         """Set LUNA2000 working mode (FC06 write to register 47086).
@@ -239,8 +280,7 @@ class LUNADriver:
         Args:
             mode: BatteryMode enum value.
         """
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: self._write_reg(REG_LUNA_MODE, int(mode)))
+        await self._write_reg(REG_LUNA_MODE, int(mode))
         log.info("luna.mode_set", mode=mode.name)
 
     async def set_charge_target_soc(self, target_pct: float) -> None:
@@ -252,6 +292,5 @@ class LUNADriver:
         if not 0.0 <= target_pct <= 100.0:
             raise ValueError(f"target_pct must be 0–100, got {target_pct}")
         raw = int(round(target_pct * 10))
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: self._write_reg(REG_LUNA_TARGET_SOC, raw))
+        await self._write_reg(REG_LUNA_TARGET_SOC, raw)
         log.info("luna.charge_target_set", target_pct=target_pct)
@@ -24,8 +24,12 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import socket
 import ssl
 import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Final
 
@@ -43,12 +47,31 @@ try:
 except ImportError:
     _OT_TLS_AVAILABLE = False
 
+# orjson parses device profiles ~2.5x faster than stdlib json; its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 _MAX_CONNECT_RETRIES: Final[int] = 3
 _RETRY_BACKOFF_BASE_S: Final[float] = 2.0  # seconds; doubles each retry
 _AUTO_RECONNECT_DELAY_S: Final[float] = 0.5  # short pause before mid-session reconnect
+_MAX_READ_REGISTERS: Final[int] = 125  # Modbus limit for one Read Holding Registers PDU
+_MAX_COALESCE_GAP: Final[int] = 16  # unused registers tolerated between coalesced tags
+# How long read_tag() waits for concurrent callers before issuing one
+# coalesced read.  0 still batches every caller queued in the same loop turn.
+_READ_BATCH_WINDOW_S: Final[float] = 0.0
+# TCP keepalive on the long-lived Modbus socket: probe after 30 s idle, every
+# 10 s, and declare the peer dead after 3 missed probes.
+_TCP_KEEPALIVE_OPTS: Final[tuple[tuple[str, int], ...]] = (
+    ("TCP_KEEPIDLE", 30),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 3),
+)
 
 # ---------------------------------------------------------------------------
 # Logger
@@ -75,6 +98,10 @@ class ModbusReadError(IOError):
     """Raised when a Modbus read operation fails after retries."""
 
 
+class _ExceptionResponse(ModbusReadError):
+    """The device answered a read with a Modbus exception response."""
+
+
 class ModbusWriteError(IOError):
     """Raised when a Modbus write operation fails."""
 
@@ -88,11 +115,110 @@ _ENDIAN_MAP: dict[str, str] = {
 }
 
 
+# struct format codes for the supported register types
+_STRUCT_CODES: dict[str, str] = {
+    "INT32": "i",
+    "UINT32": "I",
+    "FLOAT32": "f",
+    "UINT16": "H",
+    "INT16": "h",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _TagPlan:
+    """Decoder for one profile tag, precomputed when the profile loads.
+
+    ``codec`` is ``None`` for register types the driver cannot decode;
+    reading or writing such a tag raises ``DriverConfigError``.
+    """
+
+    address: int
+    count: int
+    reg_type: str
+    scale: float
+    codec: struct.Struct | None
+    writable: bool = False
+    # 1/scale, so writes multiply instead of divide (0.0 when scale is 0).
+    inv_scale: float = 1.0
+    # Packs the encoded bytes back into 16-bit words (one "H" per register).
+    words: struct.Struct | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _ReadSpan:
+    """One contiguous register read covering several tags.
+
+    ``tags`` holds ``(name, offset, plan)`` tuples, where ``offset`` is the
+    register offset relative to ``address``.
+    """
+
+    address: int
+    count: int
+    tags: tuple[tuple[str, int, _TagPlan], ...]
+
+
 def _resolve_endian(value: str, field: str) -> str:
-    try:
-        return _ENDIAN_MAP[value.upper()]
-    except KeyError:
-        raise DriverConfigError(f"Invalid {field} '{value}'. Must be 'BIG' or 'LITTLE'.") from None
+    prefix = _ENDIAN_MAP.get(value.upper())
+    if prefix is None:
+        raise DriverConfigError(f"Invalid {field} '{value}'. Must be 'BIG' or 'LITTLE'.")
+    return prefix
+
+
+def _words_to_bytes(registers: Sequence[int]) -> bytes:
+    """Pack 16-bit register words into big-endian bytes (2 per register)."""
+    return struct.pack(f">{len(registers)}H", *registers)
+
+
+def _abort_reads(pending: dict[str, asyncio.Future[float]]) -> None:
+    """Fail every still-unresolved batched read in *pending*."""
+    for name, fut in pending.items():
+        if not fut.done():
+            fut.set_exception(ModbusReadError(f"Batched read of tag '{name}' was aborted"))
+
+
+# ---------------------------------------------------------------------------
+# Shared TCP clients
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    client: AsyncModbusTcpClient
+    loop: asyncio.AbstractEventLoop
+    users: int = 0
+
+
+# Plain Modbus TCP clients shared by drivers created with shared_client=True,
+# keyed by (host, port).  pymodbus serialises transactions on one client and
+# every request carries its own device_id, so profiles for different unit ids
+# behind the same gateway can use one socket.
+_CLIENT_POOL: dict[tuple[str, int], _PooledClient] = {}
+
+
+def _acquire_client(host: str, port: int) -> AsyncModbusTcpClient:
+    """Return the shared client for *host*:*port*, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _CLIENT_POOL.get((host, port))
+    if entry is None or entry.loop is not loop:
+        # pymodbus clients are bound to the loop they were created on.
+        entry = _CLIENT_POOL[(host, port)] = _PooledClient(
+            AsyncModbusTcpClient(host=host, port=port), loop
+        )
+    entry.users += 1
+    return entry.client
+
+
+def _release_client(host: str, port: int, client: AsyncModbusTcpClient) -> bool:
+    """Drop one user of the shared *client*; True if nobody else uses it."""
+    entry = _CLIENT_POOL.get((host, port))
+    if entry is None or entry.client is not client:
+        return True  # pool entry was replaced; this client is ours alone
+    entry.users -= 1
+    if entry.users > 0:
+        return False
+    del _CLIENT_POOL[(host, port)]
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +238,12 @@ class UniversalDriver:
         TCP port (default 502).
     profile_path:
         Path to the JSON device profile.
+    read_batch_window_s:
+        How long ``read_tag`` waits to batch concurrent callers.
+    shared_client:
+        Reuse one plain-TCP connection for every driver that passes
+        ``True`` with the same *host* and *port* (e.g. inverter and meter
+        profiles behind one gateway).  Ignored for RTU and TLS.
 
     Examples
     --------
@@ -140,24 +272,48 @@ class UniversalDriver:
         tls_client_cert: Path | None = None,
         tls_client_key: Path | None = None,
         tls_context: ssl.SSLContext | None = None,
+        read_batch_window_s: float = _READ_BATCH_WINDOW_S,
+        shared_client: bool = False,
     ) -> None:
         self._host = host
         self._port = port
+        # Per-instance logger with the endpoint bound once for every event.
+        # Hot-path debug events are guarded by ``__debug__`` so ``python -O``
+        # compiles them out entirely.
+        self._log = log.bind(host=host, port=port)
         self._profile: DeviceProfile = self._load_profile(Path(profile_path))
         self._registers: dict[str, RegisterProfile] = self._profile["registers"]
+        # The RTU client is a blocking pyserial client driven via to_thread();
+        # one transaction at a time may use the serial line.
+        self._serial_lock = asyncio.Lock()
+        # Coalesced read plans for read_tags(), keyed by the requested tag tuple.
+        self._read_plans: dict[tuple[str, ...], list[_ReadSpan]] = {}
+        # Concurrent read_tag() callers are batched: tag -> shared future,
+        # flushed by one task per window.  _flush_task is the task whose batch
+        # is still collecting; _flush_tasks holds strong references to every
+        # flush until it finishes (the loop only keeps weak ones).
+        self._read_batch_window_s = read_batch_window_s
+        self._pending_reads: dict[str, asyncio.Future[float]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
 
         # Connection byte / word order from profile (struct format prefix: '>' or '<')
         conn = self._profile.get("connection", {})
         self._byte_order: str = _resolve_endian(conn.get("byte_order", "BIG"), "byte_order")
         self._word_order: str = _resolve_endian(conn.get("word_order", "BIG"), "word_order")
 
+        # Per-tag decoders built once, so reads skip profile parsing entirely.
+        self._tag_plans: dict[str, _TagPlan] = {
+            name: self._build_tag_plan(name, reg) for name, reg in self._registers.items()
+        }
+
         # ── TLS setup (IEC 62443 GAP-003) ────────────────────────────────────
         # Priority: explicit tls_context > cert paths > plain TCP
         _sslctx: ssl.SSLContext | None = None
 
         if tls_context is not None:
             _sslctx = tls_context
-            log.info("driver.mtls_enabled", host=host, port=port, source="explicit_context")
+            self._log.info("driver.mtls_enabled", source="explicit_context")
         elif (
             tls_ca_cert is not None and tls_client_cert is not None and tls_client_key is not None
         ):
@@ -172,19 +328,24 @@ class UniversalDriver:
                     client_key_path=tls_client_key,
                 )
                 _sslctx = _build(_cfg)
-                log.info("driver.mtls_enabled", host=host, port=port, source="cert_paths")
+                self._log.info("driver.mtls_enabled", source="cert_paths")
             else:
-                log.warning(
+                self._log.warning(
                     "driver.mtls_skipped",
                     reason="ot_tls_config module not available",
-                    host=host,
-                    port=port,
                 )
         else:
-            log.info("driver.mtls_disabled", host=host, port=port, reason="no_tls_config")
-
-        protocol = self._profile.get("driver", {}).get("protocol", "modbus_tcp")
-        if protocol == "modbus_rtu":
+            self._log.info("driver.mtls_disabled", reason="no_tls_config")
+
+        self._protocol: str = self._profile.get("driver", {}).get("protocol", "modbus_tcp")
+        self._slave_id: int = self._profile.get("driver", {}).get("slave_id", 1)
+        # Only plain TCP connections are pooled; TLS contexts are per driver.
+        self._pool_key: tuple[str, int] | None = None
+        self._pool_released = False
+        if shared_client and self._protocol != "modbus_rtu" and _sslctx is None:
+            self._pool_key = (host, port)
+            self._client = _acquire_client(host, port)
+        elif self._protocol == "modbus_rtu":
             self._client = ModbusSerialClient(
                 port=self._host,
                 baudrate=int(self._port),
@@ -197,14 +358,14 @@ class UniversalDriver:
                 **(dict(sslctx=_sslctx) if _sslctx else {}),  # type: ignore[arg-type]
             )
 
-        log.info(
-            "driver.initialized",
-            host=host,
-            port=port,
-            profile=str(profile_path),
-            registers=list(self._registers.keys()),
-            mtls=_sslctx is not None,
-        )
+        # structlog evaluates kwargs eagerly; only build the tag list if INFO is on.
+        if self._log.is_enabled_for(logging.INFO):
+            self._log.info(
+                "driver.initialized",
+                profile=str(profile_path),
+                registers=list(self._registers.keys()),
+                mtls=_sslctx is not None,
+            )
 
     # ------------------------------------------------------------------
     # Profile loading
@@ -216,8 +377,7 @@ class UniversalDriver:
         if not path.exists():
             raise DriverConfigError(f"Device profile not found: {path}")
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                profile: DeviceProfile = json.load(fh)
+            profile: DeviceProfile = _json_loads(path.read_bytes())
         except json.JSONDecodeError as exc:
             raise DriverConfigError(f"Device profile JSON is invalid: {path}") from exc
 
@@ -238,11 +398,15 @@ class UniversalDriver:
 
         Attempts up to ``_MAX_CONNECT_RETRIES`` times with exponential
         back-off.  Raises ``ConnectionException`` if all attempts fail.
+        The TCP socket is kept open for the driver's lifetime and tuned
+        with ``TCP_NODELAY`` and keepalive (see :meth:`_tune_socket`).
         """
+        if self._pool_key is not None and self.is_connected:
+            return  # shared client already connected by another driver
         last_exc: BaseException | None = None
+        protocol = self._protocol
         for attempt in range(1, _MAX_CONNECT_RETRIES + 1):
             try:
-                protocol = self._profile.get("driver", {}).get("protocol", "modbus_tcp")
                 if protocol == "modbus_rtu":
                     await asyncio.to_thread(self._client.connect)
                 else:
@@ -256,23 +420,21 @@ class UniversalDriver:
 
                 if is_conn:
                     if protocol == "modbus_rtu":
-                        log.info("driver.bootloader_wait", msg="Esperando 3s para que el Arduino inicie post-DTR...")
+                        self._log.info("driver.bootloader_wait", msg="Esperando 3s para que el Arduino inicie post-DTR...")
                         await asyncio.sleep(5.0)
-                        
-                    log.info(
+                    else:
+                        self._tune_socket()
+
+                    self._log.info(
                         "driver.connected",
-                        host=self._host,
-                        port=self._port,
                         attempt=attempt,
                     )
                     return
             except Exception as exc:  # pymodbus may raise various base exceptions
                 last_exc = exc
                 wait = _RETRY_BACKOFF_BASE_S ** (attempt - 1)
-                log.warning(
+                self._log.warning(
                     "driver.connect_failed",
-                    host=self._host,
-                    port=self._port,
                     attempt=attempt,
                     max_attempts=_MAX_CONNECT_RETRIES,
                     retry_in_s=wait,
@@ -285,10 +447,48 @@ class UniversalDriver:
             f"Could not connect to {self._host}:{self._port} after {_MAX_CONNECT_RETRIES} attempts"
         ) from last_exc
 
+    def _tune_socket(self) -> None:
+        """
+        Disable Nagle and enable keepalive on the connected TCP socket.
+
+        Each poll is a small request/response exchange, so Nagle's delay
+        only adds latency; keepalive detects a silently dropped peer
+        between polls.  Failures are logged and otherwise ignored.
+        """
+        transport = getattr(getattr(self._client, "ctx", None), "transport", None)
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for name, value in _TCP_KEEPALIVE_OPTS:
+                opt = getattr(socket, name, None)  # not defined on every platform
+                if opt is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, opt, value)
+        except OSError as exc:
+            self._log.warning("driver.socket_tuning_failed", error=str(exc))
+
     async def disconnect(self) -> None:
-        """Close the Modbus TCP connection gracefully."""
+        """
+        Close the Modbus TCP connection gracefully.
+
+        A shared client is only closed when its last driver disconnects.
+        Batched read_tag() calls still in flight fail with ModbusReadError.
+        """
+        if self._flush_tasks:
+            for task in self._flush_tasks:
+                task.cancel()
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        if self._pool_key is not None:
+            if self._pool_released:
+                return
+            self._pool_released = True
+            if not _release_client(*self._pool_key, self._client):
+                self._log.info("driver.disconnected", shared=True)
+                return
         self._client.close()
-        log.info("driver.disconnected", host=self._host, port=self._port)
+        self._log.info("driver.disconnected")
 
     async def reconnect(self) -> None:
         """
@@ -300,10 +500,8 @@ class UniversalDriver:
             self._client.stopbits = 1
 
 
-        log.warning(
+        self._log.warning(
             "driver.reconnecting",
-            host=self._host,
-            port=self._port,
             action="closing_then_reconnecting",
         )
         try:
@@ -317,70 +515,212 @@ class UniversalDriver:
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _get_register(self, tag_name: str) -> RegisterProfile:
-        """Return the register metadata for *tag_name* or raise."""
+    def _build_tag_plan(self, name: str, reg: RegisterProfile) -> _TagPlan:
+        """Precompute address, scale and ``struct`` decoder for one register."""
+        reg_type: str = reg["type"]
+        code = _STRUCT_CODES.get(reg_type.upper())
+        codec = struct.Struct(self._byte_order + code) if code is not None else None
+        count: int = reg.get("count", 1)
+        if codec is not None and count * 2 != codec.size:
+            raise DriverConfigError(
+                f"Tag '{name}' is {reg_type} ({codec.size // 2} registers) "
+                f"but its profile count is {count}"
+            )
+        scale = float(reg.get("scale", 1))
+        return _TagPlan(
+            address=reg["address"],
+            count=count,
+            reg_type=reg_type,
+            scale=scale,
+            codec=codec,
+            writable=reg.get("access", "RO").upper() != "RO",
+            inv_scale=1.0 / scale if scale else 0.0,
+            words=struct.Struct(f">{codec.size // 2}H") if codec is not None else None,
+        )
+
+    def _get_plan(self, tag_name: str) -> _TagPlan:
+        """Return the precomputed decoder for *tag_name* or raise."""
         try:
-            return self._registers[tag_name]
+            return self._tag_plans[tag_name]
         except KeyError:
             raise TagNotFoundError(
                 f"Tag '{tag_name}' is not defined in the device profile. "
                 f"Available tags: {list(self._registers.keys())}"
             ) from None
 
-    def _decode_value(self, registers: list[int], reg_type: str, scale: float) -> float:
+    async def _serial_call(self, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking RTU client call in a thread, one at a time."""
+        async with self._serial_lock:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def _plan_reads(self, tags: tuple[str, ...]) -> list[_ReadSpan]:
+        """
+        Group *tags* into as few contiguous register reads as possible.
+
+        Tags are merged into one span while the span stays within one
+        Modbus PDU and the unused gap between neighbours is small.
+        """
+        plans = sorted(
+            ((self._get_plan(name), name) for name in dict.fromkeys(tags)),
+            key=lambda item: item[0].address,
+        )
+        spans: list[_ReadSpan] = []
+        start = end = 0
+        members: list[tuple[str, int, _TagPlan]] = []
+        for plan, name in plans:
+            address, count = plan.address, plan.count
+            if members and (
+                address - end > _MAX_COALESCE_GAP
+                or max(end, address + count) - start > _MAX_READ_REGISTERS
+            ):
+                spans.append(_ReadSpan(start, end - start, tuple(members)))
+                members = []
+            if not members:
+                start = end = address
+            members.append((name, address - start, plan))
+            end = max(end, address + count)
+        if members:
+            spans.append(_ReadSpan(start, end - start, tuple(members)))
+        return spans
+
+    async def _read_block(self, address: int, count: int, what: str) -> Sequence[int]:
+        """
+        Read *count* holding registers at *address*, reconnecting once.
+
+        *what* names the tag(s) being read for logs and error messages.
+        """
+        protocol = self._protocol
+        slave_id = self._slave_id
+
+        try:
+            if protocol == "modbus_rtu":
+                # pymodbus 3.x kwargs -> slave argument replaces unit
+                result = await self._serial_call(self._client.read_holding_registers, address, count=count, device_id=slave_id)
+            else:
+                result = await self._client.read_holding_registers(address=address, count=count, device_id=slave_id)
+        except (ConnectionException, ModbusIOException) as exc:
+            # Mid-session disconnect \u2014 attempt one automatic reconnect
+            self._log.warning(
+                "driver.read_tag.connection_lost",
+                tag=what,
+                error=str(exc),
+                action="auto_reconnecting",
+            )
+            await self.reconnect()
+            try:
+                if protocol == "modbus_rtu":
+                    result = await self._serial_call(self._client.read_holding_registers, address, count=count, device_id=slave_id)
+                else:
+                    result = await self._client.read_holding_registers(address=address, count=count, device_id=slave_id)
+            except (ConnectionException, ModbusIOException) as exc2:
+                raise ModbusReadError(
+                    f"Modbus read failed for tag '{what}' at address {address} "
+                    f"after reconnect: {exc2}"
+                ) from exc2
+
+        if result.isError():
+            raise _ExceptionResponse(
+                f"Modbus exception response for tag '{what}' at address {address}: {result}"
+            )
+        return result.registers
+
+    def _cached_plan(self, key: tuple[str, ...]) -> list[_ReadSpan]:
+        plan = self._read_plans.get(key)
+        if plan is None:
+            plan = self._read_plans[key] = self._plan_reads(key)
+        return plan
+
+    async def _read_span(self, span: _ReadSpan) -> bytes:
+        """Read one coalesced span and return its words as big-endian bytes."""
+        what = ",".join(name for name, _, _ in span.tags)
+        return _words_to_bytes(await self._read_block(span.address, span.count, what))
+
+    async def _flush_reads(self, pending: dict[str, asyncio.Future[float]]) -> None:
+        """Serve every read_tag() call collected in *pending* with coalesced reads."""
+        try:
+            await asyncio.sleep(self._read_batch_window_s)
+            self._close_batch(pending)
+            for span in self._cached_plan(tuple(sorted(pending))):
+                try:
+                    buf = await self._read_span(span)
+                except _ExceptionResponse as exc:
+                    if len(span.tags) > 1:
+                        # One bad register must not fail its neighbours:
+                        # retry the span's tags with one read each.
+                        await self._read_span_per_tag(span, pending)
+                    else:
+                        pending[span.tags[0][0]].set_exception(exc)
+                    continue
+                except Exception as exc:
+                    # A failed span only fails the tags it covers.
+                    for name, _, _ in span.tags:
+                        pending[name].set_exception(exc)
+                    continue
+                for name, offset, tag_plan in span.tags:
+                    fut = pending[name]
+                    try:
+                        fut.set_result(self._decode(tag_plan, buf, offset))
+                    except Exception as exc:
+                        fut.set_exception(exc)
+        finally:
+            # Cancelled (disconnect, loop shutdown) or aborted by a
+            # BaseException: never leave a read_tag() caller waiting.
+            self._close_batch(pending)
+            _abort_reads(pending)
+
+    async def _read_span_per_tag(
+        self, span: _ReadSpan, pending: dict[str, asyncio.Future[float]]
+    ) -> None:
+        """Serve each tag of a span the device rejected with its own read."""
+        for name, _, tag_plan in span.tags:
+            fut = pending[name]
+            try:
+                words = await self._read_block(tag_plan.address, tag_plan.count, name)
+                fut.set_result(self._decode(tag_plan, _words_to_bytes(words)))
+            except Exception as exc:
+                fut.set_exception(exc)
+
+    def _close_batch(self, pending: dict[str, asyncio.Future[float]]) -> None:
+        """Stop *pending* from collecting further read_tag() calls."""
+        if self._pending_reads is pending:
+            self._pending_reads = {}
+            self._flush_task = None
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        self._flush_tasks.discard(task)
+        if self._flush_task is task:
+            # Cancelled before its first step, so the finally above never ran.
+            pending = self._pending_reads
+            self._close_batch(pending)
+            _abort_reads(pending)
+
+    @staticmethod
+    def _decode(plan: _TagPlan, buf: bytes, offset: int = 0) -> float:
         """
-        Decode raw Modbus register words into a scaled Python float.
+        Decode the tag described by *plan* from raw register bytes.
 
-        Uses ``struct`` (stdlib) to unpack bytes, replacing the removed
-        ``BinaryPayloadDecoder`` API from pymodbus < 3.7.
+        *buf* holds the register words as big-endian bytes (2 per
+        register) and *offset* is the tag's register offset within it.
         """
-        # Convert register words → raw bytes (each register = 2 bytes, big-endian)
-        raw_bytes = b"".join(r.to_bytes(2, byteorder="big") for r in registers)
-        bo = self._byte_order  # '>' or '<'
-        raw: int | float
-        match reg_type.upper():
-            case "INT32":
-                (raw,) = struct.unpack(f"{bo}i", raw_bytes)
-            case "UINT32":
-                (raw,) = struct.unpack(f"{bo}I", raw_bytes)
-            case "FLOAT32":
-                (raw,) = struct.unpack(f"{bo}f", raw_bytes)
-            case "UINT16":
-                (raw,) = struct.unpack(f"{bo}H", raw_bytes)
-            case "INT16":
-                (raw,) = struct.unpack(f"{bo}h", raw_bytes)
-            case _:
-                raise DriverConfigError(f"Unsupported register type: '{reg_type}'")
-        return float(raw) * scale
-
-    def _encode_value(self, value: float, reg_type: str, scale: float) -> list[int]:
+        if plan.codec is None:
+            raise DriverConfigError(f"Unsupported register type: '{plan.reg_type}'")
+        (raw,) = plan.codec.unpack_from(buf, 2 * offset)
+        return float(raw) * plan.scale
+
+    @staticmethod
+    def _encode(plan: _TagPlan, value: float) -> list[int]:
         """
-        Encode a scaled Python value back into Modbus register words.
+        Encode a scaled engineering value into register words using *plan*.
 
-        Uses ``struct`` (stdlib), replacing the removed
-        ``BinaryPayloadBuilder`` API from pymodbus < 3.7.
+        Integer register types truncate toward zero.
         """
-        raw = value / scale  # inverse scale
-        bo = self._byte_order  # '>' or '<'
-        packed: bytes
-        match reg_type.upper():
-            case "INT32":
-                packed = struct.pack(f"{bo}i", int(raw))
-            case "UINT32":
-                packed = struct.pack(f"{bo}I", int(raw))
-            case "FLOAT32":
-                packed = struct.pack(f"{bo}f", float(raw))
-            case "UINT16":
-                packed = struct.pack(f"{bo}H", int(raw))
-            case "INT16":
-                packed = struct.pack(f"{bo}h", int(raw))
-            case _:
-                raise DriverConfigError(f"Unsupported register type: '{reg_type}'")
-        # Convert packed bytes back to list of 16-bit register values
-        return [
-            int.from_bytes(packed[i : i + 2], byteorder="big")  # type: ignore[index]
-            for i in range(0, len(packed), 2)
-        ]
+        if plan.codec is None or plan.words is None:
+            raise DriverConfigError(f"Unsupported register type: '{plan.reg_type}'")
+        if not plan.inv_scale:
+            raise DriverConfigError("Cannot write a tag with scale 0")
+        raw = value * plan.inv_scale  # inverse scale
+        packed = plan.codec.pack(raw if plan.codec.format[-1] == "f" else int(raw))
+        return list(plan.words.unpack(packed))
 
     # ------------------------------------------------------------------
     # DataProvider protocol properties
@@ -399,6 +739,11 @@ class UniversalDriver:
         """Human-readable identifier of the Modbus data source."""
         return f"ModbusTCP@{self._host}:{self._port}"
 
+    @property
+    def tag_names(self) -> frozenset[str]:
+        """Names of every tag defined by the loaded device profile."""
+        return frozenset(self._tag_plans)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -407,6 +752,10 @@ class UniversalDriver:
         """
         Read a named tag from the device.
 
+        Calls that arrive within the same batch window are served by one
+        coalesced read (see :meth:`read_tags`); concurrent callers of the
+        same tag share a single result.
+
         Parameters
         ----------
         tag_name:
@@ -424,51 +773,62 @@ class UniversalDriver:
         ModbusReadError
             If the Modbus transaction fails.
         """
-        reg = self._get_register(tag_name)
-        address: int = reg["address"]
-        count: int = reg.get("count", 1)
-        reg_type: str = reg["type"]
-        scale: float = float(reg.get("scale", 1))
+        plan = self._get_plan(tag_name)
+
+        debug = __debug__ and self._log.is_enabled_for(logging.DEBUG)
+        if debug:
+            self._log.debug("driver.read_tag.start", tag=tag_name, address=plan.address, count=plan.count)
+        fut = self._pending_reads.get(tag_name)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = self._pending_reads[tag_name] = loop.create_future()
+            if self._flush_task is None:
+                task = loop.create_task(self._flush_reads(self._pending_reads))
+                self._flush_task = task
+                self._flush_tasks.add(task)
+                task.add_done_callback(self._flush_done)
+        # Shielded: the future is shared by every caller of this tag in the batch.
+        value = await asyncio.shield(fut)
+        if debug:
+            self._log.debug("driver.read_tag.done", tag=tag_name, value=value)
+        return value
 
-        log.debug("driver.read_tag.start", tag=tag_name, address=address, count=count)
-        
-        protocol = self._profile.get("driver", {}).get("protocol", "modbus_tcp")
+    async def read_tags(self, tags: Sequence[str]) -> dict[str, float]:
+        """
+        Read several tags with as few Modbus transactions as possible.
 
-        try:
-            slave_id = self._profile.get("driver", {}).get("slave_id", 1)
-            if protocol == "modbus_rtu":
-                # pymodbus 3.x kwargs -> slave argument replaces unit
-                result = await asyncio.to_thread(self._client.read_holding_registers, address, count=count, device_id=slave_id)
-            else:
-                result = await self._client.read_holding_registers(address=address, count=count, device_id=slave_id)
-        except (ConnectionException, ModbusIOException) as exc:
-            # Mid-session disconnect \u2014 attempt one automatic reconnect
-            log.warning(
-                "driver.read_tag.connection_lost",
-                tag=tag_name,
-                error=str(exc),
-                action="auto_reconnecting",
-            )
-            await self.reconnect()
-            try:
-                if protocol == "modbus_rtu":
-                    result = await asyncio.to_thread(self._client.read_holding_registers, address, count=count)
-                else:
-                    result = await self._client.read_holding_registers(address=address, count=count)
-            except (ConnectionException, ModbusIOException) as exc2:
-                raise ModbusReadError(
-                    f"Modbus read failed for tag '{tag_name}' at address {address} "
-                    f"after reconnect: {exc2}"
-                ) from exc2
+        Tags whose registers sit close together are fetched with a single
+        ``read_holding_registers`` call and decoded client-side.  The read
+        plan is computed once per distinct *tags* sequence and cached.
 
-        if result.isError():
-            raise ModbusReadError(
-                f"Modbus exception response for tag '{tag_name}' at address {address}: {result}"
-            )
+        Parameters
+        ----------
+        tags:
+            Keys defined in the profile's ``registers`` section.
 
-        value = self._decode_value(result.registers, reg_type, scale)
-        log.debug("driver.read_tag.done", tag=tag_name, value=value)
-        return value
+        Returns
+        -------
+        dict[str, float]
+            Decoded and scaled values keyed by tag name, in *tags* order.
+
+        Raises
+        ------
+        TagNotFoundError
+            If any tag is not in the profile (raised before any I/O).
+        ModbusReadError
+            If a Modbus transaction fails.
+        """
+        key = tuple(tags)
+        plan = self._cached_plan(key)
+
+        values: dict[str, float] = {}
+        for span in plan:
+            buf = await self._read_span(span)
+            for name, offset, tag_plan in span.tags:
+                values[name] = self._decode(tag_plan, buf, offset)
+        if __debug__ and self._log.is_enabled_for(logging.DEBUG):
+            self._log.debug("driver.read_tags.done", n_tags=len(values), n_reads=len(plan))
+        return {name: values[name] for name in key}
 
     async def write_tag(self, tag_name: str, value: float) -> None:
         """
@@ -492,32 +852,32 @@ class UniversalDriver:
         ModbusWriteError
             If the Modbus write transaction fails.
         """
-        reg = self._get_register(tag_name)
+        plan = self._get_plan(tag_name)
 
-        if reg.get("access", "RO").upper() == "RO":
+        if not plan.writable:
             raise PermissionError(f"Tag '{tag_name}' is read-only (access=RO). Cannot write.")
 
-        address: int = reg["address"]
-        reg_type: str = reg["type"]
-        scale: float = float(reg.get("scale", 1))
-
-        payload = self._encode_value(value, reg_type, scale)
-        log.debug(
-            "driver.write_tag.start",
-            tag=tag_name,
-            address=address,
-            value=value,
-            encoded=payload,
-        )
-        protocol = self._profile.get("driver", {}).get("protocol", "modbus_tcp")
+        address = plan.address
+        payload = self._encode(plan, value)
+        debug = __debug__ and self._log.is_enabled_for(logging.DEBUG)
+        if debug:
+            self._log.debug(
+                "driver.write_tag.start",
+                tag=tag_name,
+                address=address,
+                value=value,
+                encoded=payload,
+            )
+        rtu = self._protocol == "modbus_rtu"
+        slave_id = self._slave_id
         try:
-            if protocol == "modbus_rtu":
-                result = await asyncio.to_thread(self._client.write_registers, address, values=payload)
+            if rtu:
+                result = await self._serial_call(self._client.write_registers, address, values=payload, device_id=slave_id)
             else:
-                result = await self._client.write_registers(address=address, values=payload)
+                result = await self._client.write_registers(address=address, values=payload, device_id=slave_id)
         except (ConnectionException, ModbusIOException) as exc:
             # Mid-session disconnect \u2014 attempt one automatic reconnect
-            log.warning(
+            self._log.warning(
                 "driver.write_tag.connection_lost",
                 tag=tag_name,
                 error=str(exc),
@@ -525,10 +885,10 @@ class UniversalDriver:
             )
             await self.reconnect()
             try:
-                if protocol == "modbus_rtu":
-                    result = await asyncio.to_thread(self._client.write_registers, address, values=payload)
+                if rtu:
+                    result = await self._serial_call(self._client.write_registers, address, values=payload, device_id=slave_id)
                 else:
-                    result = await self._client.write_registers(address=address, values=payload)
+                    result = await self._client.write_registers(address=address, values=payload, device_id=slave_id)
             except (ConnectionException, ModbusIOException) as exc2:
                 raise ModbusWriteError(
                     f"Modbus write failed for tag '{tag_name}' at address {address} "
@@ -541,4 +901,5 @@ class UniversalDriver:
                 f"at address {address}: {result}"
             )
 
-        log.debug("driver.write_tag.done", tag=tag_name, value=value)
+        if debug:
+            self._log.debug("driver.write_tag.done", tag=tag_name, value=value)
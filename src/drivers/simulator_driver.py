@@ -40,6 +40,7 @@ import math
 import os
 import random
 import time
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -70,38 +71,50 @@ class SimMode:
 # ---------------------------------------------------------------------------
 
 _TICK_S = 5.0  # simulated seconds per real second
+_MAX_TICK_GAP_S = 60.0  # cap on real seconds integrated by a single tick
+_UTC_OFFSET_S = -10800  # site local time for the schedule: Chile, UTC-3
 _CAPACITY_KWH = 200.0  # nominal BESS capacity (kWh) — configurable
 _MAX_POWER_KW = 100.0  # peak charge/discharge power (kW)
 _ETA_CHG = 0.96  # round-trip charge efficiency
 _ETA_DIS = 0.96  # round-trip discharge efficiency
 
-# Typical daily dispatch schedule: hour → power fraction (-1=discharge, +1=charge)
-_NORMAL_SCHEDULE: dict[int, float] = {
-    0: 0.8,
-    1: 0.9,
-    2: 0.9,
-    3: 0.9,
-    4: 0.5,
-    5: 0.0,  # night: charge
-    6: 0.0,
-    7: -0.3,
-    8: -0.6,
-    9: -0.8,  # morning peak: discharge
-    10: -0.5,
-    11: -0.3,
-    12: 0.3,
-    13: 0.5,
-    14: 0.3,
-    15: -0.3,  # midday solar
-    16: -0.5,
-    17: -0.8,
-    18: -0.9,
-    19: -0.7,
-    20: -0.4,
-    21: -0.2,  # evening peak
-    22: 0.4,
-    23: 0.7,  # late night: charge
-}
+# Typical daily dispatch schedule, indexed by local hour (0–23):
+# power fraction (-1=discharge, +1=charge)
+_NORMAL_SCHEDULE: tuple[float, ...] = (
+    0.8,  # 00h
+    0.9,  # 01h
+    0.9,  # 02h
+    0.9,  # 03h
+    0.5,  # 04h
+    0.0,  # 05h — night: charge
+    0.0,  # 06h
+    -0.3,  # 07h
+    -0.6,  # 08h
+    -0.8,  # 09h — morning peak: discharge
+    -0.5,  # 10h
+    -0.3,  # 11h
+    0.3,  # 12h
+    0.5,  # 13h
+    0.3,  # 14h
+    -0.3,  # 15h — midday solar
+    -0.5,  # 16h
+    -0.8,  # 17h
+    -0.9,  # 18h
+    -0.7,  # 19h
+    -0.4,  # 20h
+    -0.2,  # 21h — evening peak
+    0.4,  # 22h
+    0.7,  # 23h — late night: charge
+)
+
+
+# Bound once: noise is drawn ~70 times per full tag sweep.
+_random = random.random
+
+
+def _noise(s: float = 0.5) -> float:
+    """Uniform sensor noise in ``[-s, s]`` (same distribution as ``uniform(-s, s)``)."""
+    return s * (2.0 * _random() - 1.0)
 
 
 class SimulatorDriver:
@@ -156,9 +169,13 @@ class SimulatorDriver:
 
         # Timing
         self._connected: bool = False
-        self._start_ts: float = time.time()
-        self._last_tick_ts: float = time.time()
+        # Monotonic clock for deltas: immune to NTP / wall-clock steps
+        self._start_ts: float = time.monotonic()
+        self._last_tick_ts: float = self._start_ts
         self._grid_relay: int = 51  # 51=closed
+        # Schedule fraction for the current local hour, refreshed hourly
+        self._hour_bucket: int = -1
+        self._schedule_fraction: float = 0.0
 
         # Load profile tags
         self._tags: dict[str, dict] = {}
@@ -196,7 +213,7 @@ class SimulatorDriver:
     async def connect(self) -> None:
         await asyncio.sleep(0.05)  # simulate handshake latency
         self._connected = True
-        self._start_ts = time.time()
+        self._start_ts = time.monotonic()
         log.info(
             "simulator.connected",
             profile=self._profile_name,
@@ -216,6 +233,15 @@ class SimulatorDriver:
         await asyncio.sleep(0.001)  # simulate Modbus RTT
         return value
 
+    async def read_tags(self, tags: Sequence[str]) -> dict[str, float]:
+        """Read several tags from one simulation tick, as one Modbus group read."""
+        if not self._connected:
+            raise DataProviderError("SimulatorDriver not connected — call connect() first")
+        self._tick()
+        values = {tag: self._read_value(tag) for tag in tags}
+        await asyncio.sleep(0.001)  # simulate one Modbus RTT for the group
+        return values
+
     async def write_tag(self, tag_name: str, value: float) -> None:
         if not self._connected:
             raise DataProviderError("SimulatorDriver not connected")
@@ -245,64 +271,76 @@ class SimulatorDriver:
     def source_description(self) -> str:
         return f"Simulator[{self._profile_name}][{self._mode}]"
 
+    @property
+    def tag_names(self) -> frozenset[str]:
+        """Names of every tag read_tag() can serve (simulated or profile default)."""
+        return frozenset(_TAG_FNS.keys() | self._tags.keys())
+
     # -----------------------------------------------------------------------
     # Physics simulation
     # -----------------------------------------------------------------------
 
     def _tick(self) -> None:
         """Advance physics simulation since last tick."""
-        now = time.time()
-        elapsed_real = now - self._last_tick_ts
-        self._last_tick_ts = now
+        mono = time.monotonic()
+        # Clamp so a stalled poller cannot inject one huge SOC step
+        elapsed_real = min(max(mono - self._last_tick_ts, 0.0), _MAX_TICK_GAP_S)
+        self._last_tick_ts = mono
 
         # Simulated time advances faster in stress mode
         sim_elapsed_s = elapsed_real * _TICK_S
 
-        if self._mode == SimMode.IDLE:
-            self._power_kw = 0.0
-        elif self._mode == SimMode.FAULT:
+        # State is worked on in locals and written back once at the end
+        mode = self._mode
+        temp_c = self._temp_c
+
+        if mode == SimMode.IDLE:
+            power_kw = 0.0
+        elif mode == SimMode.FAULT:
             # Anomalous: temperature spike + random power
-            self._temp_c = 58.0 + random.uniform(0, 10)
-            self._power_kw = random.uniform(-_MAX_POWER_KW, _MAX_POWER_KW)
-        elif self._mode == SimMode.STRESS:
+            temp_c = 58.0 + random.uniform(0, 10)
+            power_kw = _noise(_MAX_POWER_KW)
+        elif mode == SimMode.STRESS:
             # Aggressive cycling
             hour_phase = (time.time() % 600) / 600  # 10-min fast cycle
-            self._power_kw = _MAX_POWER_KW * math.sin(2 * math.pi * hour_phase)
+            power_kw = _MAX_POWER_KW * math.sin(2 * math.pi * hour_phase)
         else:
-            # Normal: follow daily schedule
-            hour = int(time.gmtime(time.time() - 10800).tm_hour)  # Chile UTC-3
-            fraction = _NORMAL_SCHEDULE.get(hour, 0.0)
-            self._power_kw = _MAX_POWER_KW * fraction * (1 + random.uniform(-0.05, 0.05))
+            # Normal: follow daily schedule (looked up once per local hour)
+            bucket = int((time.time() + _UTC_OFFSET_S) // 3600)
+            if bucket != self._hour_bucket:
+                self._hour_bucket = bucket
+                self._schedule_fraction = _NORMAL_SCHEDULE[bucket % 24]
+            power_kw = _MAX_POWER_KW * self._schedule_fraction * (1 + _noise(0.05))
 
         # Clamp power
-        self._power_kw = max(-_MAX_POWER_KW, min(_MAX_POWER_KW, self._power_kw))
+        power_kw = max(-_MAX_POWER_KW, min(_MAX_POWER_KW, power_kw))
 
         # SOC physics: ΔE = P × Δt / capacity
-        if self._power_kw > 0:  # charging
-            d_soc = (self._power_kw * _ETA_CHG * sim_elapsed_s / 3600) / self._capacity_kwh * 100
+        if power_kw > 0:  # charging
+            d_soc = (power_kw * _ETA_CHG * sim_elapsed_s / 3600) / self._capacity_kwh * 100
         else:  # discharging
-            d_soc = (self._power_kw / _ETA_DIS * sim_elapsed_s / 3600) / self._capacity_kwh * 100
+            d_soc = (power_kw / _ETA_DIS * sim_elapsed_s / 3600) / self._capacity_kwh * 100
 
-        self._soc = max(5.0, min(98.0, self._soc + d_soc))
+        soc = max(5.0, min(98.0, self._soc + d_soc))
 
         # Temperature: follows SOC and power (higher activity = higher temp)
-        target_temp = 25.0 + abs(self._power_kw) / _MAX_POWER_KW * 18.0
-        if self._mode != SimMode.FAULT:
-            self._temp_c += (target_temp - self._temp_c) * 0.02 + random.uniform(-0.2, 0.2)
-            self._temp_c = max(20.0, min(55.0, self._temp_c))
+        if mode != SimMode.FAULT:
+            target_temp = 25.0 + abs(power_kw) / _MAX_POWER_KW * 18.0
+            temp_c += (target_temp - temp_c) * 0.02 + _noise(0.2)
+            temp_c = max(20.0, min(55.0, temp_c))
 
         # Voltage: linear with SOC (rough approximation)
-        self._voltage = 400.0 + (self._soc - 50) * 1.6 + random.uniform(-2, 2)
+        voltage = 400.0 + (soc - 50) * 1.6 + _noise(2)
 
         # Current: I = P / V
-        if self._voltage > 0:
-            self._current = (self._power_kw * 1000) / self._voltage
+        if voltage > 0:
+            self._current = (power_kw * 1000) / voltage
 
         # AC power
-        self._ac_power_w = -self._power_kw * 1000 * 0.98  # inverter loss ~2%
+        self._ac_power_w = -power_kw * 1000 * 0.98  # inverter loss ~2%
 
         # Cycle count: increment on power direction reversal
-        current_sign = 1.0 if self._power_kw > 5 else (-1.0 if self._power_kw < -5 else 0.0)
+        current_sign = 1.0 if power_kw > 5 else (-1.0 if power_kw < -5 else 0.0)
         if (
             current_sign != 0
             and self._last_power_sign != 0
@@ -313,135 +351,33 @@ class SimulatorDriver:
             self._last_power_sign = current_sign
 
         # Energy counters
-        energy_kwh = abs(self._power_kw) * sim_elapsed_s / 3600
-        self._daily_energy_kwh += energy_kwh if self._power_kw > 0 else 0
+        energy_kwh = abs(power_kw) * sim_elapsed_s / 3600
+        self._daily_energy_kwh += energy_kwh if power_kw > 0 else 0
         self._total_energy_kwh += energy_kwh
 
-    def _read_value(self, tag_name: str) -> float:
-        """Map tag names to current simulation state values."""
-
-        def noise(s=0.5):
-            return random.uniform(-s, s)
-
-        mapping: dict[str, float] = {
-            # ----------------------------------------------------------------
-            # BESSAI-SPEC-001 §5.1 — Required normalized tag names
-            # These tags MUST be present in every conformant DataProvider.
-            # ----------------------------------------------------------------
-            "SOC_%": self._soc + noise(0.1),  # 0–100 %
-            "P_kW": self._power_kw + noise(0.05),  # kW (+charge, -discharge)
-            "T_battery_C": self._temp_c + noise(0.2),  # −40 to 100 °C
-            "V_dc_V": max(0.0, self._voltage + noise(2)),  # 0–∞ V
-            "alarm_code": 0.0 if self._mode != SimMode.FAULT else 16.0,  # 0–∞
-            # SPEC-001 §5.1 mode enum: 0=FAULT 1=STRESS 2=NORMAL(TOU) 3=IDLE
-            "mode": (
-                2.0
-                if self._mode == SimMode.NORMAL
-                else 3.0
-                if self._mode == SimMode.IDLE
-                else 1.0
-                if self._mode == SimMode.STRESS
-                else 0.0  # FAULT
-            ),
-            # ----------------------------------------------------------------
-            # State of charge / health
-            "luna_soc": self._soc + noise(0.1),
-            "battery_soc": self._soc + noise(0.1),
-            "luna_soh": 97.5 - self._cycle_count * 0.008 + noise(0.1),
-            "battery_soh": 97.5 - self._cycle_count * 0.008 + noise(0.1),
-            # Power — battery side
-            "luna_power": self._power_kw + noise(0.05),
-            "battery_power": self._power_kw * 1000 + noise(50),  # W for some profiles
-            "pv_power": max(0.0, random.gauss(15, 3)),  # kW solar
-            # Voltage & current
-            "luna_voltage": self._voltage + noise(2),
-            "battery_voltage": self._voltage + noise(2),
-            "luna_current": self._current + noise(0.5),
-            "battery_current": self._current + noise(0.5),
-            # Temperature
-            "luna_temperature": self._temp_c + noise(0.2),
-            "battery_temperature": self._temp_c + noise(0.2),
-            "internal_temperature": self._temp_c - 3 + noise(0.5),  # inverter cooler
-            # AC grid side
-            "active_power": self._ac_power_w / 1000 + noise(0.02),  # kW
-            "ac_power_total": self._ac_power_w + noise(10),  # W
-            "ac_voltage": self._ac_voltage_v + noise(0.5),
-            "ac_voltage_l1": self._ac_voltage_v + noise(0.5),
-            "ac_voltage_l2": self._ac_voltage_v + noise(0.5),
-            "ac_voltage_l3": self._ac_voltage_v + noise(0.5),
-            "ac_current": abs(self._current) * 0.7 + noise(0.1),
-            "ac_current_total": abs(self._current) * 0.7 + noise(0.1),
-            "grid_frequency": self._frequency_hz + noise(0.02),
-            "frequency": self._frequency_hz + noise(0.02),
-            "grid_power": self._ac_power_w + noise(20),  # W
-            # DC input
-            "dc_power": abs(self._power_kw) * 1000 * 1.02,
-            "dc_voltage": self._voltage * 2.5 + noise(5),
-            "pv_total_power": max(0.0, random.gauss(12, 2)),  # kW
-            "pv1_voltage": 280 + noise(5),
-            "pv1_current": max(0.0, random.gauss(8, 1)),
-            "pv2_voltage": 280 + noise(5),
-            "pv2_current": max(0.0, random.gauss(8, 1)),
-            # Power factor
-            "power_factor": 0.98 + noise(0.01),
-            "reactive_power": noise(5),
-            # Capacity & energy
-            "luna_capacity": self._capacity_kwh * 0.95,
-            "battery_charge_total": self._total_energy_kwh * 3600,  # Wh total charge
-            "battery_discharge_total": self._total_energy_kwh * 3600,
-            "daily_energy": self._daily_energy_kwh,
-            "total_energy": self._total_energy_kwh,
-            # Cycles
-            "luna_cycle_count": float(self._cycle_count),
-            # State / status (enums as floats)
-            "inverter_state": 1392.0 if self._mode != SimMode.FAULT else 307.0,  # SMA: 1392=OK
-            "device_status": 1392.0 if self._mode != SimMode.FAULT else 307.0,
-            "battery_status": 3.0 if self._power_kw > 0 else 2.0,  # 3=charging, 2=discharging
-            "grid_relay_status": 51.0,  # 51=closed
-            # AC output (Victron / off-grid)
-            "ac_output_voltage": self._ac_voltage_v + noise(0.3),
-            "ac_output_current": abs(self._current) * 0.6 + noise(0.1),
-            "ac_output_power": abs(self._ac_power_w) * 0.8 + noise(20),
-            "ac_input_voltage": self._ac_voltage_v + noise(1),
-            "ac_input_current": abs(self._current) * 0.3 + noise(0.1),
-            "ac_input_power": self._ac_power_w * 0.5 + noise(30),
-            # Victron specifics
-            "battery_consumed_ah": max(0.0, (100 - self._soc) * self._capacity_kwh * 10 / 48),
-            "time_to_go": max(
-                0.0, self._soc / 100 * self._capacity_kwh / max(0.1, abs(self._power_kw))
-            ),
-            "ess_setpoint": self._power_kw * 1000,
-            "minimum_soc": 10.0,
-            # Alarms (0 = no alarm)
-            "alarm1": 0.0 if self._mode != SimMode.FAULT else 16.0,
-            "alarm2": 0.0 if self._mode != SimMode.FAULT else 512.0,
-            "alarm3": 0.0,
-            "vebus_error": 0.0,
-            # Watchdog / heartbeat (read back what was last written)
-            "watchdog_heartbeat": 1.0,
-            # Control registers (readable current setpoints)
-            "luna_working_mode": 2.0,  # TOU
-            "luna_charge_target_soc": 90.0,
-            "operating_mode": 1467.0,
-            "storage_control_mode": 1.0,  # Auto
-            "storage_setpoint_power": self._power_kw * 1000,
-            "storage_minimum_soc": 10.0,
-            "active_power_limit": _MAX_POWER_KW * 1000,
-        }
-
-        if tag_name not in mapping:
-            if tag_name in self._tags:
-                # Unknown tag but exists in profile — return plausible default
-                log.debug("simulator.unknown_tag_default", tag=tag_name)
-                return 0.0
-            # BESSAI-SPEC-001 §4.5: raise KeyError for unknown tags
-            raise KeyError(
-                f"Tag '{tag_name}' not found in SimulatorDriver "
-                f"(profile: '{self._profile_name}'). "
-                "See BESSAI-SPEC-001 §5 for the required tag set."
-            )
+        self._power_kw = power_kw
+        self._soc = soc
+        self._temp_c = temp_c
+        self._voltage = voltage
 
-        return round(mapping[tag_name], 4)
+    def _read_value(self, tag_name: str) -> float:
+        """Map a tag name to its current simulation state value."""
+        try:
+            fn = _TAG_FNS[tag_name]
+        except KeyError:
+            pass
+        else:
+            return round(fn(self), 4)
+        if tag_name in self._tags:
+            # Unknown tag but exists in profile — return plausible default
+            log.debug("simulator.unknown_tag_default", tag=tag_name)
+            return 0.0
+        # BESSAI-SPEC-001 §4.5: raise KeyError for unknown tags
+        raise KeyError(
+            f"Tag '{tag_name}' not found in SimulatorDriver "
+            f"(profile: '{self._profile_name}'). "
+            "See BESSAI-SPEC-001 §5 for the required tag set."
+        )
 
     # -----------------------------------------------------------------------
     # Factory helpers
@@ -451,3 +387,111 @@ class SimulatorDriver:
     def for_profile(cls, profile: str, **kwargs: Any) -> SimulatorDriver:
         """Convenience factory. ``SimulatorDriver.for_profile("sma_sunny_tripower")``."""
         return cls(profile=profile, **kwargs)
+
+
+# SPEC-001 §5.1 mode enum: 0=FAULT 1=STRESS 2=NORMAL(TOU) 3=IDLE
+_MODE_CODES: dict[str, float] = {
+    SimMode.FAULT: 0.0,
+    SimMode.STRESS: 1.0,
+    SimMode.NORMAL: 2.0,
+    SimMode.IDLE: 3.0,
+}
+
+# Tag name → value of the current simulation state (with sensor noise).
+# Built once at import; a read evaluates only the requested tag.
+_TAG_FNS: dict[str, Callable[[SimulatorDriver], float]] = {
+    # ----------------------------------------------------------------
+    # BESSAI-SPEC-001 §5.1 — Required normalized tag names
+    # These tags MUST be present in every conformant DataProvider.
+    # ----------------------------------------------------------------
+    "SOC_%": lambda d: d._soc + _noise(0.1),  # 0–100 %
+    "P_kW": lambda d: d._power_kw + _noise(0.05),  # kW (+charge, -discharge)
+    "T_battery_C": lambda d: d._temp_c + _noise(0.2),  # −40 to 100 °C
+    "V_dc_V": lambda d: max(0.0, d._voltage + _noise(2)),  # 0–∞ V
+    "alarm_code": lambda d: 0.0 if d._mode != SimMode.FAULT else 16.0,  # 0–∞
+    "mode": lambda d: _MODE_CODES.get(d._mode, 0.0),
+    # ----------------------------------------------------------------
+    # State of charge / health
+    "luna_soc": lambda d: d._soc + _noise(0.1),
+    "battery_soc": lambda d: d._soc + _noise(0.1),
+    "luna_soh": lambda d: 97.5 - d._cycle_count * 0.008 + _noise(0.1),
+    "battery_soh": lambda d: 97.5 - d._cycle_count * 0.008 + _noise(0.1),
+    # Power — battery side
+    "luna_power": lambda d: d._power_kw + _noise(0.05),
+    "battery_power": lambda d: d._power_kw * 1000 + _noise(50),  # W for some profiles
+    "pv_power": lambda d: max(0.0, random.gauss(15, 3)),  # kW solar
+    # Voltage & current
+    "luna_voltage": lambda d: d._voltage + _noise(2),
+    "battery_voltage": lambda d: d._voltage + _noise(2),
+    "luna_current": lambda d: d._current + _noise(0.5),
+    "battery_current": lambda d: d._current + _noise(0.5),
+    # Temperature
+    "luna_temperature": lambda d: d._temp_c + _noise(0.2),
+    "battery_temperature": lambda d: d._temp_c + _noise(0.2),
+    "internal_temperature": lambda d: d._temp_c - 3 + _noise(0.5),  # inverter cooler
+    # AC grid side
+    "active_power": lambda d: d._ac_power_w / 1000 + _noise(0.02),  # kW
+    "ac_power_total": lambda d: d._ac_power_w + _noise(10),  # W
+    "ac_voltage": lambda d: d._ac_voltage_v + _noise(0.5),
+    "ac_voltage_l1": lambda d: d._ac_voltage_v + _noise(0.5),
+    "ac_voltage_l2": lambda d: d._ac_voltage_v + _noise(0.5),
+    "ac_voltage_l3": lambda d: d._ac_voltage_v + _noise(0.5),
+    "ac_current": lambda d: abs(d._current) * 0.7 + _noise(0.1),
+    "ac_current_total": lambda d: abs(d._current) * 0.7 + _noise(0.1),
+    "grid_frequency": lambda d: d._frequency_hz + _noise(0.02),
+    "frequency": lambda d: d._frequency_hz + _noise(0.02),
+    "grid_power": lambda d: d._ac_power_w + _noise(20),  # W
+    # DC input
+    "dc_power": lambda d: abs(d._power_kw) * 1000 * 1.02,
+    "dc_voltage": lambda d: d._voltage * 2.5 + _noise(5),
+    "pv_total_power": lambda d: max(0.0, random.gauss(12, 2)),  # kW
+    "pv1_voltage": lambda d: 280 + _noise(5),
+    "pv1_current": lambda d: max(0.0, random.gauss(8, 1)),
+    "pv2_voltage": lambda d: 280 + _noise(5),
+    "pv2_current": lambda d: max(0.0, random.gauss(8, 1)),
+    # Power factor
+    "power_factor": lambda d: 0.98 + _noise(0.01),
+    "reactive_power": lambda d: _noise(5),
+    # Capacity & energy
+    "luna_capacity": lambda d: d._capacity_kwh * 0.95,
+    "battery_charge_total": lambda d: d._total_energy_kwh * 3600,  # Wh total charge
+    "battery_discharge_total": lambda d: d._total_energy_kwh * 3600,
+    "daily_energy": lambda d: d._daily_energy_kwh,
+    "total_energy": lambda d: d._total_energy_kwh,
+    # Cycles
+    "luna_cycle_count": lambda d: float(d._cycle_count),
+    # State / status (enums as floats)
+    "inverter_state": lambda d: 1392.0 if d._mode != SimMode.FAULT else 307.0,  # SMA: 1392=OK
+    "device_status": lambda d: 1392.0 if d._mode != SimMode.FAULT else 307.0,
+    "battery_status": lambda d: 3.0 if d._power_kw > 0 else 2.0,  # 3=charging, 2=discharging
+    "grid_relay_status": lambda d: 51.0,  # 51=closed
+    # AC output (Victron / off-grid)
+    "ac_output_voltage": lambda d: d._ac_voltage_v + _noise(0.3),
+    "ac_output_current": lambda d: abs(d._current) * 0.6 + _noise(0.1),
+    "ac_output_power": lambda d: abs(d._ac_power_w) * 0.8 + _noise(20),
+    "ac_input_voltage": lambda d: d._ac_voltage_v + _noise(1),
+    "ac_input_current": lambda d: abs(d._current) * 0.3 + _noise(0.1),
+    "ac_input_power": lambda d: d._ac_power_w * 0.5 + _noise(30),
+    # Victron specifics
+    "battery_consumed_ah": lambda d: max(0.0, (100 - d._soc) * d._capacity_kwh * 10 / 48),
+    "time_to_go": lambda d: max(
+        0.0, d._soc / 100 * d._capacity_kwh / max(0.1, abs(d._power_kw))
+    ),
+    "ess_setpoint": lambda d: d._power_kw * 1000,
+    "minimum_soc": lambda d: 10.0,
+    # Alarms (0 = no alarm)
+    "alarm1": lambda d: 0.0 if d._mode != SimMode.FAULT else 16.0,
+    "alarm2": lambda d: 0.0 if d._mode != SimMode.FAULT else 512.0,
+    "alarm3": lambda d: 0.0,
+    "vebus_error": lambda d: 0.0,
+    # Watchdog / heartbeat (read back what was last written)
+    "watchdog_heartbeat": lambda d: 1.0,
+    # Control registers (readable current setpoints)
+    "luna_working_mode": lambda d: 2.0,  # TOU
+    "luna_charge_target_soc": lambda d: 90.0,
+    "operating_mode": lambda d: 1467.0,
+    "storage_control_mode": lambda d: 1.0,  # Auto
+    "storage_setpoint_power": lambda d: d._power_kw * 1000,
+    "storage_minimum_soc": lambda d: 10.0,
+    "active_power_limit": lambda d: _MAX_POWER_KW * 1000,
+}
@@ -26,6 +26,7 @@ model has been trained yet, following the fail-safe principle of the roadmap.
 
 from __future__ import annotations
 
+import math
 import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
@@ -50,7 +51,7 @@ log = structlog.get_logger(__name__)
 DEFAULT_THRESHOLD: float = 0.65
 
 
-@dataclass
+@dataclass(slots=True)
 class ModbusFrame:
     """Represents a single Modbus read operation (features for AI-IDS).
 
@@ -79,6 +80,22 @@ class ModbusFrame:
             dtype=np.float64,
         )
 
+    @staticmethod
+    def stack(frames: Sequence[ModbusFrame]) -> np.ndarray:
+        """Return the ``(len(frames), 6)`` feature matrix for *frames*.
+
+        Filled one column at a time, so no per-frame array is allocated.
+        Row ``i`` equals ``frames[i].to_features()``.
+        """
+        X = np.empty((len(frames), 6), dtype=np.float64)
+        X[:, 0] = [f.fc_code for f in frames]
+        X[:, 1] = [f.address for f in frames]
+        X[:, 2] = [f.count for f in frames]
+        X[:, 3] = [f.timing_ms for f in frames]
+        X[:, 4] = [f.soc_pct for f in frames]
+        X[:, 5] = [f.power_kw for f in frames]
+        return X
+
 
 class ModbusAnomalyDetector:
     """Two-layer anomaly detector for Modbus traffic.
@@ -91,6 +108,8 @@ class ModbusAnomalyDetector:
         contamination:      Expected fraction of anomalies in training data.
         min_fit_samples:    Minimum frames before IsolationForest is trained.
         site_id:            Site identifier for Prometheus label.
+        adaptive_baseline:  Fold frames scored below threshold into the
+                            timing baseline (see update_baseline()).
     """
 
     def __init__(
@@ -99,16 +118,20 @@ class ModbusAnomalyDetector:
         contamination: float = 0.05,
         min_fit_samples: int = 50,
         site_id: str = "unknown",
+        adaptive_baseline: bool = False,
     ) -> None:
         self.threshold = threshold
         self.contamination = contamination
         self.min_fit_samples = min_fit_samples
         self.site_id = site_id
+        self.adaptive_baseline = adaptive_baseline
 
         self._iso_forest: IsolationForest | None = None
         self._fitted: bool = False
-        self._baseline_timings: list[float] = []
+        # Running timing baseline (Welford): count, mean, sum of squared deviations
+        self._timing_n: int = 0
         self._timing_mean: float = 0.0
+        self._timing_m2: float = 0.0
         self._timing_std: float = 1.0
 
         log.info("ai_ids.init", threshold=threshold, site_id=site_id)
@@ -126,13 +149,14 @@ class ModbusAnomalyDetector:
         if not frames:
             return
 
-        timings = [f.timing_ms for f in frames]
-        self._timing_mean = float(np.mean(timings))
-        self._timing_std = max(float(np.std(timings)), 1.0)
-        self._baseline_timings = list(timings)
+        timings = np.fromiter((f.timing_ms for f in frames), dtype=np.float64, count=len(frames))
+        self._timing_n = len(timings)
+        self._timing_mean = float(timings.mean())
+        self._timing_m2 = float(np.square(timings - self._timing_mean).sum())
+        self._timing_std = max(math.sqrt(self._timing_m2 / self._timing_n), 1.0)
 
         if _SKLEARN_AVAILABLE and len(frames) >= self.min_fit_samples:
-            X = np.array([f.to_features() for f in frames])
+            X = ModbusFrame.stack(frames)
             self._iso_forest = IsolationForest(
                 contamination=self.contamination,  # type: ignore[arg-type]
                 random_state=42,
@@ -150,6 +174,16 @@ class ModbusAnomalyDetector:
                 required=self.min_fit_samples,
             )
 
+    def update_baseline(self, timing_ms: float) -> None:
+        """Fold one known-normal timing into the baseline in O(1) (Welford)."""
+        n = self._timing_n + 1
+        delta = timing_ms - self._timing_mean
+        mean = self._timing_mean + delta / n
+        self._timing_m2 += delta * (timing_ms - mean)
+        self._timing_n = n
+        self._timing_mean = mean
+        self._timing_std = max(math.sqrt(self._timing_m2 / n), 1.0)
+
     def score(self, frame: ModbusFrame) -> float:
         """Return ensemble anomaly score in [0, 1].
 
@@ -163,6 +197,34 @@ class ModbusAnomalyDetector:
         ensemble = 0.4 * iso_score + 0.6 * z_score
         return float(np.clip(ensemble, 0.0, 1.0))
 
+    def score_batch(self, frames: Sequence[ModbusFrame]) -> np.ndarray:
+        """Vectorised score() over many frames (bulk replay / backtests).
+
+        Runs a single decision_function call over the stacked feature matrix
+        instead of one per frame. Returns a float64 array of scores in [0, 1].
+        """
+        if not frames or not (self._fitted or self._timing_n):
+            return np.zeros(len(frames), dtype=np.float64)
+
+        if self._fitted and self._iso_forest is not None:
+            X = ModbusFrame.stack(frames)
+            iso = np.clip(0.5 - self._iso_forest.decision_function(X), 0.0, 1.0)
+            timings = X[:, 3]
+        else:
+            iso = 0.0
+            timings = np.fromiter(
+                (f.timing_ms for f in frames), dtype=np.float64, count=len(frames)
+            )
+
+        if self._timing_n:
+            z = np.abs(timings - self._timing_mean) / self._timing_std
+            z_score = np.clip(z / (z + 1.0), 0.0, 1.0)
+        else:
+            z_score = 0.0
+
+        ensemble = 0.4 * iso + 0.6 * z_score
+        return np.clip(ensemble, 0.0, 1.0)
+
     def check_and_alert(self, frame: ModbusFrame) -> float:
         """Score the frame; if above threshold, log alert + update metrics.
 
@@ -186,6 +248,8 @@ class ModbusAnomalyDetector:
             )
         else:
             log.debug("ai_ids.normal", score=round(float(s), 4), site_id=self.site_id)
+            if self.adaptive_baseline:
+                self.update_baseline(frame.timing_ms)
 
         return s
 
@@ -213,7 +277,7 @@ class ModbusAnomalyDetector:
 
         A timing deviation beyond 3σ yields score ≥ 1.
         """
-        if not self._baseline_timings:
+        if not self._timing_n:
             return 0.0
         z = abs(timing_ms - self._timing_mean) / self._timing_std
         # Sigmoid-like mapping: z=0→0, z=3→~0.95
@@ -33,6 +33,7 @@ __all__ = [
     "CYCLES_TOTAL",
     "SAFETY_BLOCKS_TOTAL",
     "PUBLISH_ERRORS_TOTAL",
+    "CYCLE_OVERRUNS_TOTAL",
     "LAST_SOC_PERCENT",
     "LAST_POWER_KW",
     "LAST_CYCLE_DURATION_S",
@@ -94,6 +95,12 @@ PUBLISH_ERRORS_TOTAL: Counter = Counter(
     ["site_id"],
 )
 
+CYCLE_OVERRUNS_TOTAL: Counter = Counter(
+    "bess_cycle_overruns_total",
+    "Number of acquisition cycles that ran past their scheduled deadline.",
+    ["site_id"],
+)
+
 CONNECT_RETRIES_TOTAL: Counter = Counter(
     "bess_modbus_connect_retries_total",
     "Total Modbus TCP connection retries.",
@@ -59,6 +59,9 @@ log = structlog.get_logger(__name__)
 # Expected input feature names in the ONNX model
 _INPUT_FEATURES = ["soc_pct", "power_kw", "temp_c", "hour_of_day"]
 
+# Symbolic batch dimension name used by scripts/generate_dummy_onnx.py
+_BATCH_DIM = "batch_size"
+
 
 class DispatchResult:
     """Result from ONNX inference.
@@ -87,20 +90,31 @@ class ONNXDispatcher:
 
     Parameters:
         model_path: Path to the ``.onnx`` file. Relative paths are resolved
-                    from the repository root.
+                    from the repository root.  If a pre-optimized sibling
+                    ``<name>.opt.onnx`` exists and is not older than the
+                    model it is loaded instead.
         site_id:    Site identifier used in Prometheus labels.
+        shared_session: An already-built ``InferenceSession`` to use instead of
+                    loading *model_path*.  Lets many per-site dispatchers
+                    share one set of weights and one ORT thread pool.
     """
 
     def __init__(
         self,
         model_path: str | Path = "models/dispatch_policy.onnx",
         site_id: str = "unknown",
+        shared_session: ort.InferenceSession | None = None,  # type: ignore[name-defined]
     ) -> None:
         self.model_path = Path(model_path)
         self.site_id = site_id
+        self._shared_session = shared_session
         self._session: ort.InferenceSession | None = None  # type: ignore[name-defined]
         self._input_name: str | None = None
         self._loaded: bool = False
+        # Preallocated I/O buffers bound to the session (see _bind_io)
+        self._binding: ort.IOBinding | None = None  # type: ignore[name-defined]
+        self._input_buf: np.ndarray = np.empty((1, len(_INPUT_FEATURES)), dtype=np.float32)
+        self._output_buf: np.ndarray | None = None
 
     # ------------------------------------------------------------------
     # Context manager (async-compatible but synchronous internally)
@@ -112,10 +126,42 @@ class ONNXDispatcher:
 
     async def __aexit__(self, *_: object) -> None:
         self._session = None
+        self._binding = None
+        self._output_buf = None
         self._loaded = False
 
+    def load(self) -> ONNXDispatcher:
+        """Load the model without an ``async with`` block and return ``self``.
+
+        For long-lived dispatchers (benchmarks, fleet managers).  Failures
+        are logged, as in ``__aenter__``; check :attr:`is_loaded`.
+        """
+        self._load()
+        return self
+
+    def _optimized_sibling(self) -> Path | None:
+        """Return the ``<name>.opt.onnx`` sibling if it is at least as new as the model."""
+        opt_path = self.model_path.with_suffix(".opt.onnx")
+        if not opt_path.exists():
+            return None
+        if opt_path.stat().st_mtime < self.model_path.stat().st_mtime:
+            log.warning(
+                "onnx_dispatcher.optimized_model_stale",
+                path=str(opt_path),
+                model_path=str(self.model_path),
+            )
+            return None
+        return opt_path
+
     def _load(self) -> None:
         """Attempt to load the ONNX model. Logs warning on failure."""
+        if self._shared_session is not None:
+            self._session = self._shared_session
+            self._input_name = self._session.get_inputs()[0].name
+            self._bind_io()
+            self._loaded = True
+            return
+
         if not _ONNX_AVAILABLE:
             log.warning("onnx_dispatcher.onnxruntime_not_installed")
             return
@@ -130,21 +176,54 @@ class ONNXDispatcher:
         try:
             opts = ort.SessionOptions()
             opts.log_severity_level = 3  # suppress verbose ort logs
+            # Inference is always single-sample: specialize kernels to batch=1
+            opts.add_free_dimension_override_by_name(_BATCH_DIM, 1)
+            load_path = self._optimized_sibling()
+            if load_path is not None:
+                # Graph already optimized offline — skip re-optimization
+                opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            else:
+                load_path = self.model_path
+                opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
             self._session = ort.InferenceSession(
-                str(self.model_path),
+                str(load_path),
                 sess_options=opts,
                 providers=["CPUExecutionProvider"],
             )
             self._input_name = self._session.get_inputs()[0].name
+            self._bind_io()
             self._loaded = True
             log.info(
                 "onnx_dispatcher.model_loaded",
-                path=str(self.model_path),
+                path=str(load_path),
                 input_name=self._input_name,
             )
         except Exception as exc:  # noqa: BLE001
             log.error("onnx_dispatcher.load_error", error=str(exc), path=str(self.model_path))
 
+    def _bind_io(self) -> None:
+        """Bind the fixed input buffer and, when its shape is static, the output.
+
+        ``infer()`` then writes features into ``_input_buf`` in place and
+        reads the result from ``_output_buf``, so no tensors are allocated
+        per call.  Outputs that are not float32 fall back to an ORT-allocated
+        buffer.
+        """
+        assert self._session is not None
+        binding = self._session.io_binding()
+        binding.bind_cpu_input(self._input_name, self._input_buf)
+        out = self._session.get_outputs()[0]
+        if out.type == "tensor(float)":
+            shape = tuple(d if isinstance(d, int) else 1 for d in out.shape)
+            self._output_buf = np.empty(shape, dtype=np.float32)
+            binding.bind_output(
+                out.name, "cpu", 0, np.float32, list(shape), self._output_buf.ctypes.data
+            )
+        else:
+            self._output_buf = None
+            binding.bind_output(out.name, "cpu")
+        self._binding = binding
+
     # ------------------------------------------------------------------
     # Inference
     # ------------------------------------------------------------------
@@ -160,17 +239,24 @@ class ONNXDispatcher:
 
         Returns ``None`` if the model is not loaded (fallback mode).
         """
-        if not self._loaded or self._session is None:
+        if not self._loaded or self._session is None or self._binding is None:
             log.debug("onnx_dispatcher.fallback_mode", site_id=self.site_id)
             return None
 
-        features = np.array([[soc_pct, power_kw, temp_c, hour_of_day]], dtype=np.float32)
+        features = self._input_buf[0]
+        features[0] = soc_pct
+        features[1] = power_kw
+        features[2] = temp_c
+        features[3] = hour_of_day
 
         t0 = time.perf_counter()
         try:
-            outputs = self._session.run(None, {self._input_name: features})
+            self._session.run_with_iobinding(self._binding)
             elapsed_ms = (time.perf_counter() - t0) * 1000.0
-            target_kw = float(np.asarray(outputs[0]).flatten()[0])
+            if self._output_buf is not None:
+                target_kw = float(self._output_buf.flat[0])
+            else:
+                target_kw = float(self._binding.copy_outputs_to_cpu()[0].flat[0])
 
             # Update Prometheus metrics
             ONNX_INFERENCE_MS.labels(site_id=self.site_id).set(elapsed_ms)
@@ -12,7 +12,9 @@ Configures the global ``TracerProvider`` and ``MeterProvider`` with:
 * Batch processors / readers for production throughput.
 
 Call ``configure_otel()`` once at application startup, before creating
-any tracer or meter.
+any tracer or meter.  An empty ``OTEL_EXPORTER_OTLP_ENDPOINT`` disables
+export entirely; hot paths can check ``tracing_enabled()`` and skip span
+creation.
 
 Usage
 -----
@@ -43,7 +45,7 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-from src.core.config import settings
+from src.core.config import get_settings
 
 log: structlog.BoundLogger = structlog.get_logger(__name__)
 
@@ -56,7 +58,7 @@ _INSTRUMENTATION_SCOPE = "bessai.edge"
 
 def _build_resource() -> Resource:
     """Create an OTel Resource from application settings."""
-    cfg = settings
+    cfg = get_settings()
     return Resource.create(
         {
             "service.name": cfg.OTEL_SERVICE_NAME,
@@ -75,7 +77,9 @@ def configure_otel(
     Initialise the global OpenTelemetry providers.
 
     This function is idempotent — calling it more than once is a no-op
-    after the first successful initialisation.
+    after the first successful initialisation.  If no endpoint is
+    configured, no providers are installed and the OTel API stays in its
+    no-op mode.
 
     Parameters
     ----------
@@ -92,6 +96,9 @@ def configure_otel(
         return
 
     endpoint = otlp_endpoint or _resolve_endpoint()
+    if not endpoint:
+        log.info("otel.disabled", reason="OTEL_EXPORTER_OTLP_ENDPOINT is empty")
+        return
     resource = _build_resource()
 
     # ------------------------------------------------------------------ Traces
@@ -112,8 +119,8 @@ def configure_otel(
     log.info(
         "otel.configured",
         endpoint=endpoint,
-        service=settings.OTEL_SERVICE_NAME,
-        site=settings.SITE_ID,
+        service=resource.attributes["service.name"],
+        site=resource.attributes["bessai.site_id"],
     )
 
 
@@ -129,6 +136,11 @@ def shutdown_otel() -> None:
     log.info("otel.shutdown")
 
 
+def tracing_enabled() -> bool:
+    """Return ``True`` if ``configure_otel()`` installed an exporting tracer."""
+    return _tracer_provider is not None
+
+
 def get_tracer(name: str = _INSTRUMENTATION_SCOPE) -> trace.Tracer:
     """Return a named tracer from the global provider."""
     return trace.get_tracer(name)
@@ -146,4 +158,4 @@ def get_meter(name: str = _INSTRUMENTATION_SCOPE) -> metrics.Meter:
 
 def _resolve_endpoint() -> str:
     """Read the OTLP endpoint from settings (env var or .env file)."""
-    return settings.OTEL_EXPORTER_OTLP_ENDPOINT
+    return get_settings().OTEL_EXPORTER_OTLP_ENDPOINT
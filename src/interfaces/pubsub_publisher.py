@@ -12,6 +12,9 @@ Wraps ``gcloud-aio-pubsub`` to provide:
   downstream routing and schema evolution.
 * Structured logging and OpenTelemetry span injection.
 * Graceful connection management with context-manager support.
+* Batched publishing: many samples per ``publish`` request, split so no
+  request exceeds the configured message-count / byte thresholds.
+* Fire-and-forget publishing with a bounded number of in-flight requests.
 
 Usage
 -----
@@ -23,6 +26,7 @@ Usage
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from typing import Any
@@ -39,6 +43,13 @@ _SCHEMA_VERSION = "1.0"
 
 Telemetry = dict[str, Any]
 
+# Default cap on outstanding publish_nowait() requests before callers wait.
+_MAX_IN_FLIGHT = 1000
+
+# Default per-request thresholds (Pub/Sub itself allows 1000 messages / 10 MB).
+_MAX_REQUEST_MESSAGES = 100
+_MAX_REQUEST_BYTES = 1024 * 1024
+
 
 class PublisherError(RuntimeError):
     """Raised when a Pub/Sub publish operation fails unrecoverably."""
@@ -56,6 +67,13 @@ class PubSubPublisher:
         Pub/Sub topic name (not the full resource path).
     site_id:
         Site identifier injected as a message attribute for routing.
+    max_in_flight:
+        Maximum number of :meth:`publish_nowait` requests outstanding at
+        once; further calls wait for one to finish (back-pressure).
+    max_request_messages:
+        Maximum messages sent in one ``publish`` request.
+    max_request_bytes:
+        Maximum summed payload bytes sent in one ``publish`` request.
     """
 
     def __init__(
@@ -63,13 +81,26 @@ class PubSubPublisher:
         project_id: str,
         topic_name: str,
         site_id: str | None = None,
+        max_in_flight: int = _MAX_IN_FLIGHT,
+        max_request_messages: int = _MAX_REQUEST_MESSAGES,
+        max_request_bytes: int = _MAX_REQUEST_BYTES,
     ) -> None:
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        if max_request_messages < 1:
+            raise ValueError(f"max_request_messages must be >= 1, got {max_request_messages}")
+        if max_request_bytes < 1:
+            raise ValueError(f"max_request_bytes must be >= 1, got {max_request_bytes}")
         self._project_id = project_id
         self._topic_name = topic_name
         self._topic_path = f"projects/{project_id}/topics/{topic_name}"
         self._site_id = site_id or get_settings().SITE_ID
         self._client: PublisherClient | None = None
         self._session: Any = None  # aiohttp.ClientSession managed internally
+        self._max_in_flight = max_in_flight
+        self._in_flight: set[asyncio.Task[list[str]]] = set()
+        self._max_request_messages = max_request_messages
+        self._max_request_bytes = max_request_bytes
 
     # ------------------------------------------------------------------
     # Context-manager support
@@ -99,7 +130,8 @@ class PubSubPublisher:
         )
 
     async def _close(self) -> None:
-        """Close the underlying HTTP session."""
+        """Wait briefly for in-flight publishes, then close the HTTP session."""
+        await self.drain(timeout=5.0)
         if self._session is not None:
             await self._session.close()
             self._session = None
@@ -137,30 +169,12 @@ class PubSubPublisher:
         if self._client is None:
             raise RuntimeError("PubSubPublisher must be used as an async context manager.")
 
-        # Inject envelope fields
-        payload: Telemetry = {
-            "site_id": self._site_id,
-            "schema_version": _SCHEMA_VERSION,
-            "observed_at": telemetry.get(
-                "observed_at",
-                datetime.now(tz=timezone.utc).isoformat(),
-            ),
-            **telemetry,
-        }
-
-        data: bytes = json.dumps(payload, default=str).encode("utf-8")
-        attributes: dict[str, str] = {
-            "site_id": self._site_id,
-            "schema_version": _SCHEMA_VERSION,
-            "content_type": "application/json",
-        }
-
-        message = PubsubMessage(data=data, attributes=attributes)
+        message = self._to_message(telemetry)
 
         log.debug(
             "pubsub.publish.start",
             topic=self._topic_name,
-            payload_bytes=len(data),
+            payload_bytes=len(message.data),
         )
 
         try:
@@ -181,6 +195,174 @@ class PubSubPublisher:
             )
             raise PublisherError(f"Failed to publish to {self._topic_path}: {exc}") from exc
 
+    async def publish_batch(self, batch: list[Telemetry]) -> list[str]:
+        """
+        Publish several telemetry samples with as few Pub/Sub requests as possible.
+
+        Each sample becomes its own message with the same envelope as
+        :meth:`publish`, so subscribers cannot tell the two paths apart.
+        Messages are packed into requests of at most
+        ``max_request_messages`` messages / ``max_request_bytes`` bytes,
+        which are sent concurrently.
+
+        Parameters
+        ----------
+        batch:
+            Telemetry dictionaries, oldest first.
+
+        Returns
+        -------
+        list[str]
+            Message IDs in the same order as *batch* (empty for an empty batch).
+
+        Raises
+        ------
+        PublisherError
+            If the publish call fails.
+        RuntimeError
+            If called outside of the async context manager.
+        """
+        if self._client is None:
+            raise RuntimeError("PubSubPublisher must be used as an async context manager.")
+        if not batch:
+            return []
+
+        messages = [self._to_message(telemetry) for telemetry in batch]
+        client = self._client
+
+        try:
+            responses = await asyncio.gather(
+                *(
+                    client.publish(self._topic_path, messages=chunk)
+                    for chunk in self._split_requests(messages)
+                )
+            )
+            msg_ids: list[str] = [
+                msg_id for response in responses for msg_id in response.get("messageIds", [])
+            ]
+            log.debug(
+                "pubsub.publish_batch.success",
+                topic=self._topic_name,
+                n_messages=len(messages),
+                n_requests=len(responses),
+                payload_bytes=sum(len(m.data) for m in messages),
+            )
+            return msg_ids
+        except Exception as exc:
+            log.error(
+                "pubsub.publish_batch.failed",
+                topic=self._topic_name,
+                n_messages=len(messages),
+                error=str(exc),
+            )
+            raise PublisherError(f"Failed to publish to {self._topic_path}: {exc}") from exc
+
+    def _split_requests(self, messages: list[PubsubMessage]) -> list[list[PubsubMessage]]:
+        """Pack *messages*, in order, into chunks within the request thresholds."""
+        chunks: list[list[PubsubMessage]] = []
+        chunk: list[PubsubMessage] = []
+        chunk_bytes = 0
+        for message in messages:
+            size = len(message.data)
+            if chunk and (
+                len(chunk) >= self._max_request_messages
+                or chunk_bytes + size > self._max_request_bytes
+            ):
+                chunks.append(chunk)
+                chunk, chunk_bytes = [], 0
+            chunk.append(message)
+            chunk_bytes += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @property
+    def in_flight(self) -> int:
+        """Number of :meth:`publish_nowait` requests not yet completed."""
+        return len(self._in_flight)
+
+    async def publish_nowait(self, batch: list[Telemetry]) -> asyncio.Task[list[str]]:
+        """
+        Start publishing *batch* without waiting for the server to confirm.
+
+        The request runs as a background task; attach a done-callback to
+        the returned task to observe the message IDs or the
+        :class:`PublisherError`.  This coroutine only blocks while
+        ``max_in_flight`` requests are already outstanding.
+
+        Parameters
+        ----------
+        batch:
+            Telemetry dictionaries, oldest first.  The list is copied, so
+            the caller may reuse it immediately.
+
+        Returns
+        -------
+        asyncio.Task[list[str]]
+            Task resolving to the message IDs, as :meth:`publish_batch`.
+        """
+        if self._client is None:
+            raise RuntimeError("PubSubPublisher must be used as an async context manager.")
+
+        while len(self._in_flight) >= self._max_in_flight:
+            log.warning(
+                "pubsub.publish.backpressure",
+                topic=self._topic_name,
+                in_flight=len(self._in_flight),
+            )
+            await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+        task = asyncio.create_task(self.publish_batch(list(batch)))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        return task
+
+    async def drain(self, timeout: float | None = None) -> int:
+        """
+        Wait for in-flight :meth:`publish_nowait` requests to complete.
+
+        Parameters
+        ----------
+        timeout:
+            Maximum seconds to wait; ``None`` waits indefinitely.
+
+        Returns
+        -------
+        int
+            Number of requests still outstanding when the wait ended.
+        """
+        if not self._in_flight:
+            return 0
+        _, pending = await asyncio.wait(set(self._in_flight), timeout=timeout)
+        if pending:
+            log.warning(
+                "pubsub.drain.timeout",
+                topic=self._topic_name,
+                pending=len(pending),
+            )
+        return len(pending)
+
+    def _to_message(self, telemetry: Telemetry) -> PubsubMessage:
+        """Wrap *telemetry* in the schema envelope as a ``PubsubMessage``."""
+        payload: Telemetry = {
+            "site_id": self._site_id,
+            "schema_version": _SCHEMA_VERSION,
+            "observed_at": telemetry.get(
+                "observed_at",
+                datetime.now(tz=timezone.utc).isoformat(),
+            ),
+            **telemetry,
+        }
+
+        data: bytes = json.dumps(payload, default=str).encode("utf-8")
+        attributes: dict[str, str] = {
+            "site_id": self._site_id,
+            "schema_version": _SCHEMA_VERSION,
+            "content_type": "application/json",
+        }
+
+        return PubsubMessage(data=data, attributes=attributes)
+
 
 # ---------------------------------------------------------------------------
 # Module-level convenience factory  (optional singleton pattern)
@@ -129,6 +129,9 @@ class BESSAIServer:
         # Per-site telemetry cache (for /fleet/sites)
         self._site_telemetries: list[dict[str, Any]] = []
 
+        # Device driver whose link state is reported on /health (optional)
+        self._driver: Any = None
+
         self._app = self._build_app()
 
     # ------------------------------------------------------------------
@@ -185,6 +188,10 @@ class BESSAIServer:
         """Cache per-site telemetry for /fleet/sites."""
         self._site_telemetries = sites
 
+    def set_driver(self, driver: Any) -> None:
+        """Report *driver*'s ``is_connected`` on /health (no extra probe)."""
+        self._driver = driver
+
     # ------------------------------------------------------------------
     # Route handlers
     # ------------------------------------------------------------------
@@ -205,6 +212,8 @@ class BESSAIServer:
             "compliance_ok": self._compliance.all_ok,
             "compliance_score": self._compliance.score,
         }
+        if self._driver is not None:
+            payload["device_connected"] = bool(self._driver.is_connected)
         return web.Response(
             text=json.dumps(payload, indent=2),
             content_type="application/json",
@@ -136,6 +136,17 @@ class TestContract:
             "No device profile JSON found in registry/. Create a profile per BESSAI-SPEC-001 §7."
         )
 
+    @pytest.mark.asyncio
+    async def test_a11_read_tags_returns_requested_tags_in_order(
+        self, driver: DataProvider
+    ) -> None:
+        """A-11: read_tags() returns one value per requested tag, in order (SPEC-001 §4.5)."""
+        await driver.connect()
+        tags = ("alarm_code", "SOC_%", "P_kW")
+        values = await driver.read_tags(tags)
+        assert tuple(values) == tags
+        assert all(isinstance(v, float) for v in values.values())
+
 
 # ---------------------------------------------------------------------------
 # Category B — Required Tag Tests (hardware / accurate simulator required)
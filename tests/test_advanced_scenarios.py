@@ -19,6 +19,7 @@ Implements all recommendations from the 2026-04-12 review:
 
 from __future__ import annotations
 
+import gc
 import json
 import time
 
@@ -362,6 +363,7 @@ class TestFleetCoordinatorStress:
 
     def test_100_sites_total_flex_fast(self):
         coord = self._register_n_sites(100)
+        gc.collect()  # keep a full collection of the suite's heap out of the timing
         t0 = time.perf_counter()
         flex = coord.total_flex_kw("discharge")
         elapsed = time.perf_counter() - t0
@@ -370,6 +372,7 @@ class TestFleetCoordinatorStress:
 
     def test_100_sites_compute_setpoints_fast(self):
         coord = self._register_n_sites(100)
+        gc.collect()  # keep a full collection of the suite's heap out of the timing
         t0 = time.perf_counter()
         setpoints = coord.compute_setpoints(dispatch_kw=10_000.0, mode="discharge")
         elapsed = time.perf_counter() - t0
@@ -378,6 +381,7 @@ class TestFleetCoordinatorStress:
 
     def test_100_sites_fleet_summary_fast(self):
         coord = self._register_n_sites(100)
+        gc.collect()  # keep a full collection of the suite's heap out of the timing
         t0 = time.perf_counter()
         summary = coord.fleet_summary()
         elapsed = time.perf_counter() - t0
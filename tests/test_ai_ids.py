@@ -16,6 +16,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 from src.interfaces.ai_ids import ModbusAnomalyDetector, ModbusFrame
 
@@ -74,6 +75,14 @@ def test_modbus_frame_feature_values():
     assert f[5] == pytest.approx(30.0)
 
 
+def test_modbus_frame_stack_matches_rows():
+    """stack() builds the same matrix as stacking to_features() rows."""
+    frames = [_normal_frame() for _ in range(5)] + [_anomalous_frame()]
+    X = ModbusFrame.stack(frames)
+    assert X.shape == (6, 6)
+    np.testing.assert_array_equal(X, np.array([f.to_features() for f in frames]))
+
+
 # ---------------------------------------------------------------------------
 # Tests — Unfitted detector (fail-safe)
 # ---------------------------------------------------------------------------
@@ -163,8 +172,37 @@ def test_zscore_timing_without_isolation_forest():
     detector = ModbusAnomalyDetector(min_fit_samples=200)  # won't fit IsoForest
     detector.fit(_normal_traffic(30))  # builds baseline only
     assert detector._fitted is False
-    assert len(detector._baseline_timings) == 30
+    assert detector._timing_n == 30
 
     s_low = detector.score(_normal_frame(timing_ms=10.0))
     s_high = detector.score(_normal_frame(timing_ms=1000.0))
     assert s_high > s_low
+
+
+def test_update_baseline_matches_batch_fit():
+    """Online Welford updates reproduce the mean/std that fit() computes."""
+    frames = [_normal_frame(timing_ms=t) for t in (8.0, 9.5, 10.0, 12.5, 30.0, 11.0)]
+    batch = ModbusAnomalyDetector(min_fit_samples=200)
+    batch.fit(frames)
+    online = ModbusAnomalyDetector(min_fit_samples=200)
+    for f in frames:
+        online.update_baseline(f.timing_ms)
+    assert online._timing_n == batch._timing_n
+    assert online._timing_mean == pytest.approx(batch._timing_mean)
+    assert online._timing_std == pytest.approx(batch._timing_std)
+
+
+def test_score_batch_matches_per_frame_score():
+    """score_batch() equals score() applied frame by frame."""
+    detector = ModbusAnomalyDetector(min_fit_samples=50)
+    detector.fit([_normal_frame(timing_ms=10.0 + (i % 5) * 0.5) for i in range(60)])
+    frames = [_normal_frame(timing_ms=t) for t in (9.0, 10.5, 25.0, 400.0)]
+    scores = detector.score_batch(frames)
+    assert scores.shape == (4,)
+    assert scores == pytest.approx([detector.score(f) for f in frames])
+
+
+def test_score_batch_unfitted_returns_zeros():
+    detector = ModbusAnomalyDetector()
+    assert detector.score_batch([_normal_frame(), _normal_frame()]).tolist() == [0.0, 0.0]
+    assert detector.score_batch([]).shape == (0,)
@@ -11,8 +11,9 @@ Covers:
 * INVERTER_PORT clamped to 1-65535.
 * DRIVER_PROFILE_PATH default.
 * WATCHDOG_TIMEOUT default.
+* Driver-selection defaults; BESSAI_MODE / BESSAI_SIM_MODE case-insensitive.
 * Derived property inverter_ip_str returns a plain string.
-* Singleton behaviour of get_settings().
+* Singleton behaviour of get_settings() and the lazy ``settings`` name.
 """
 
 from __future__ import annotations
@@ -96,6 +97,15 @@ class TestFieldTypes:
         with pytest.raises(ValidationError):
             _make_settings(INVERTER_IP="not an ip!")
 
+    def test_inverter_ip_accepts_ipv6_and_hostname(self) -> None:
+        assert _make_settings(INVERTER_IP="fe80::1").INVERTER_IP == "fe80::1"
+        assert _make_settings(INVERTER_IP="modbus-simulator").INVERTER_IP == "modbus-simulator"
+
+    def test_inverter_ip_overlong_hostname_raises(self) -> None:
+        # DNS names are capped at 253 characters
+        with pytest.raises(ValidationError):
+            _make_settings(INVERTER_IP="a." * 127 + "b")
+
     def test_inverter_port_default(self) -> None:
         env = {k: v for k, v in _VALID_ENV.items() if k != "INVERTER_PORT"}
         with patch.dict(os.environ, env, clear=True):
@@ -122,6 +132,18 @@ class TestFieldTypes:
             s = config_module.Settings(_env_file=None)  # type: ignore[call-arg]
         assert s.DRIVER_PROFILE_PATH == "registry/huawei_sun2000.json"
 
+    def test_driver_selection_defaults(self) -> None:
+        s = _make_settings()
+        assert (s.BESSAI_MODE, s.BESSAI_SIM_MODE, s.DEVICE_PROFILE) == (
+            "auto",
+            "normal",
+            "huawei_sun2000",
+        )
+
+    def test_modes_are_case_insensitive(self) -> None:
+        s = _make_settings(BESSAI_MODE=" Demo ", BESSAI_SIM_MODE="STRESS")
+        assert (s.BESSAI_MODE, s.BESSAI_SIM_MODE) == ("demo", "stress")
+
 
 # ---------------------------------------------------------------------------
 # Derived properties
@@ -164,3 +186,34 @@ class TestSingleton:
             s2 = config_module.get_settings()
         # Different parse → different object identity
         assert s1 is not s2
+
+    def test_module_settings_resolves_lazily_and_binds(self) -> None:
+        config_module.__dict__.pop("settings", None)
+        try:
+            with patch.dict(os.environ, _VALID_ENV, clear=True):
+                s = config_module.settings
+            assert s is config_module.get_settings()
+            # Bound into the module namespace: no further lazy resolution
+            assert config_module.__dict__["settings"] is s
+        finally:
+            config_module.__dict__.pop("settings", None)
+
+    def test_unknown_module_attribute_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            _ = config_module.does_not_exist
+
+
+# ---------------------------------------------------------------------------
+# Immutability
+# ---------------------------------------------------------------------------
+
+
+class TestFrozen:
+    def test_settings_are_read_only(self) -> None:
+        s = _make_settings()
+        with pytest.raises(ValidationError):
+            s.SITE_ID = "SITE-OTHER"  # type: ignore[misc]
+
+    def test_driver_profile_abs_is_memoised(self) -> None:
+        s = _make_settings()
+        assert s.driver_profile_abs is s.driver_profile_abs
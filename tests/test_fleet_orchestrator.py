@@ -6,10 +6,12 @@ Unit tests for FleetOrchestrator, SiteProxy, and FleetSummary.
 
 from __future__ import annotations
 
+import aiohttp
 import pytest
 from src.core.fleet_orchestrator import (
     FleetOrchestrator,
     FleetSummary,
+    FleetTelemetryBatch,
     SiteProxy,
     SiteTelemetry,
 )
@@ -62,12 +64,31 @@ class TestFleetOrchestrator:
         orch.register_site("B", _make_proxy("B", cap=200.0))
         assert orch.total_capacity_kwh == pytest.approx(300.0)
 
+    def test_total_capacity_tracks_replace_and_remove(self):
+        orch = FleetOrchestrator()
+        orch.register_site("A", _make_proxy("A", cap=100.0))
+        orch.register_site("B", _make_proxy("B", cap=200.0))
+        orch.register_site("A", _make_proxy("A", cap=150.0))  # re-register replaces
+        assert orch.total_capacity_kwh == pytest.approx(350.0)
+        orch.remove_site("B")
+        orch.remove_site("missing")
+        assert orch.total_capacity_kwh == pytest.approx(150.0)
+        orch.remove_site("A")
+        assert orch.total_capacity_kwh == 0.0
+
     def test_aggregate_empty_returns_zero_summary(self):
         orch = FleetOrchestrator()
         summary = orch.aggregate([])
         assert summary.n_sites == 0
         assert summary.fleet_soc_pct == pytest.approx(0.0)
 
+    def test_empty_summaries_are_independent(self):
+        first = FleetSummary.empty()
+        second = FleetSummary.empty()
+        first.cycle_duration_s = 1.5
+        assert second.cycle_duration_s == 0.0
+        assert second == FleetSummary(0, 0.0, 0.0, 0.0, 0.0, 0, 0.0, timestamp=second.timestamp)
+
     def test_aggregate_weighted_soc(self):
         tels = [
             _make_telemetry("A", soc=80.0, cap=100.0),
@@ -87,6 +108,25 @@ class TestFleetOrchestrator:
         summary = orch.aggregate(tels)
         assert summary.sites_in_alarm == 2
 
+    def test_aggregate_large_fleet_matches_scalar_path(self):
+        tels = [
+            _make_telemetry(f"S{i}", soc=10.0 + i, power=-2.0 * i, cap=50.0 + 10 * i,
+                            avail=5.0 * i, anomaly=(i % 10) / 10)
+            for i in range(20)
+        ]
+        orch = FleetOrchestrator(anomaly_threshold=0.7)
+        vec = orch.aggregate(tels)
+        scalar = [orch.aggregate(tels[i : i + 4]) for i in range(0, 20, 4)]
+        total_cap = sum(s.total_capacity_kwh for s in scalar)
+        assert vec.n_sites == 20
+        assert vec.total_capacity_kwh == pytest.approx(total_cap)
+        assert vec.fleet_soc_pct == pytest.approx(
+            sum(s.fleet_soc_pct * s.total_capacity_kwh for s in scalar) / total_cap
+        )
+        assert vec.total_power_kw == pytest.approx(sum(s.total_power_kw for s in scalar))
+        assert vec.total_available_kw == pytest.approx(sum(s.total_available_kw for s in scalar))
+        assert vec.sites_in_alarm == sum(s.sites_in_alarm for s in scalar) == 4
+
     def test_run_cycle_returns_fleet_summary(self):
         orch = FleetOrchestrator()
         orch.register_site("A", _make_proxy("A", soc=60.0, avail=30.0))
@@ -95,3 +135,122 @@ class TestFleetOrchestrator:
         assert summary.n_sites == 1
         assert summary.fleet_soc_pct == pytest.approx(60.0)
         assert summary.cycle_duration_s >= 0.0
+        assert summary.timestamp > 0.0
+
+    async def test_poll_stamps_every_site_with_one_timestamp(self):
+        orch = FleetOrchestrator()
+        for sid in ("A", "B", "C"):
+            orch.register_site(sid, _make_proxy(sid))
+        tels = await orch.poll_all()
+        assert tels[0].timestamp > 0.0
+        assert {t.timestamp for t in tels} == {tels[0].timestamp}
+
+    def test_run_cycle_reuses_private_loop(self):
+        orch = FleetOrchestrator()
+        orch.register_site("A", _make_proxy("A"))
+        orch.run_cycle()
+        loop = orch._loop
+        orch.run_cycle()
+        assert orch._loop is loop
+        orch.close()
+        assert loop.is_closed()
+        # A closed orchestrator transparently gets a fresh loop.
+        assert orch.run_cycle().n_sites == 1
+        orch.close()
+
+    async def test_remote_sites_share_one_pooled_session(self):
+        orch = FleetOrchestrator()
+        orch.register_site("A", SiteProxy(host="10.0.0.1", site_id="A"))
+        orch.register_site("mock", _make_proxy("mock"))
+        orch._ensure_http()
+        orch.register_site("B", SiteProxy(host="10.0.0.2", site_id="B"))
+        shared = orch._sites["A"].session
+        assert shared is not None
+        assert orch._sites["B"].session is shared
+        assert orch._sites["mock"].session is None
+        orch._ensure_http()  # same loop: no new session
+        assert orch._sites["A"].session is shared
+        await orch.aclose()
+        assert shared.closed
+
+    def test_pooled_session_closed_before_its_loop_ends(self):
+        import asyncio
+
+        orch = FleetOrchestrator()
+        orch.register_site("A", SiteProxy(host="10.0.0.1", site_id="A"))
+
+        async def _open() -> aiohttp.ClientSession:
+            orch._ensure_http()
+            return orch._http
+
+        # asyncio.run() cancels the guard task at shutdown, closing the session.
+        first = asyncio.run(_open())
+        assert first.closed
+        # The private run_cycle() loop's session is closed by close().
+        private = orch._loop = asyncio.new_event_loop()
+        second = private.run_until_complete(_open())
+        assert second is not first
+        orch.close()
+        assert second.closed and private.is_closed()
+
+    async def test_simulated_fleet_opens_no_session(self):
+        orch = FleetOrchestrator()
+        orch.register_site("A", _make_proxy("A"))
+        await orch.poll_all()
+        assert orch._http is None
+
+    async def test_poll_all_caps_concurrency_and_keeps_order(self):
+        import asyncio
+
+        in_flight = peak = 0
+
+        class SlowProxy(SiteProxy):
+            async def fetch_telemetry(self, now: float | None = None) -> SiteTelemetry:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+                return _make_telemetry(self.site_id)
+
+        orch = FleetOrchestrator(max_parallel=3)
+        for i in range(10):
+            orch.register_site(f"S{i}", SlowProxy(host="localhost", site_id=f"S{i}"))
+        orch._ensure_http = lambda: None  # no network in this test
+        tels = await orch.poll_all()
+        assert [t.site_id for t in tels] == [f"S{i}" for i in range(10)]
+        assert peak == 3
+
+    def test_max_parallel_must_be_positive(self):
+        with pytest.raises(ValueError):
+            FleetOrchestrator(max_parallel=0)
+
+
+class TestFleetTelemetryBatch:
+    def test_round_trips_site_view(self):
+        tels = [_make_telemetry("A", soc=40.0, cap=80.0), _make_telemetry("B", anomaly=0.9)]
+        batch = FleetTelemetryBatch.from_telemetries(tels)
+        assert len(batch) == 2
+        assert batch.site(0) == tels[0]
+        assert batch.site(1) == tels[1]
+
+    def test_aggregate_batch_matches_list(self):
+        tels = [_make_telemetry(f"S{i}", soc=20.0 + i, cap=100.0 + i, anomaly=i / 4) for i in range(4)]
+        orch = FleetOrchestrator()
+        from_list = orch.aggregate(tels)
+        from_batch = orch.aggregate(FleetTelemetryBatch.from_telemetries(tels))
+        assert from_batch.n_sites == from_list.n_sites
+        assert from_batch.fleet_soc_pct == pytest.approx(from_list.fleet_soc_pct)
+        assert from_batch.sites_in_alarm == from_list.sites_in_alarm
+
+    async def test_poll_batch_drops_failed_sites(self):
+        def boom(sid: str) -> SiteTelemetry:
+            raise RuntimeError("offline")
+
+        orch = FleetOrchestrator()
+        orch.register_site("A", _make_proxy("A", soc=55.0))
+        orch.register_site("B", SiteProxy(host="localhost", site_id="B", telemetry_fn=boom))
+        orch.register_site("C", _make_proxy("C", soc=65.0))
+        batch = await orch.poll_batch()
+        assert list(batch.site_ids) == ["A", "C"]
+        assert batch.soc.tolist() == [55.0, 65.0]
@@ -7,7 +7,7 @@ Uses fully mocked ModbusTcpClient to simulate a real SUN2000 device.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.drivers.luna2000_driver import BatteryMode, LUNADriver
 from src.interfaces.sun2000_monitor import (
@@ -66,7 +66,7 @@ def _mock_client(reg_map: dict[int, list[int]] | None = None) -> MagicMock:
     rmap = reg_map or REGISTER_MAP
     client = MagicMock()
 
-    def _read(address, count, slave=3):
+    def _read(address, count, **_unit):
         r = MagicMock()
         r.isError.return_value = False
         r.registers = rmap.get(address, [0] * count)
@@ -78,6 +78,16 @@ def _mock_client(reg_map: dict[int, list[int]] | None = None) -> MagicMock:
     return client
 
 
+def _mock_async_client(reg_map: dict[int, list[int]] | None = None) -> MagicMock:
+    """Same register map, served through awaitable methods (AsyncModbusTcpClient)."""
+    sync = _mock_client(reg_map)
+    client = MagicMock()
+    client.read_holding_registers = AsyncMock(side_effect=sync.read_holding_registers.side_effect)
+    client.write_register = AsyncMock(return_value=sync.write_register.return_value)
+    client.connect = AsyncMock(return_value=True)
+    return client
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -131,25 +141,25 @@ class TestLUNARegisters:
 
     def setup_method(self):
         self.drv = LUNADriver(host="127.0.0.1", slave_id=3)
-        self.drv._client = _mock_client()
+        self.drv._client = _mock_async_client()
 
-    def test_soc_reads_60_percent(self):
-        raw = self.drv._read_regs(37760, 1)[0]
+    async def test_soc_reads_60_percent(self):
+        raw = (await self.drv._read_regs(37760, 1))[0]
         assert abs(raw * 0.1 - 60.0) < 0.01
 
-    def test_battery_power_discharging(self):
-        regs = self.drv._read_regs(37765, 2)
+    async def test_battery_power_discharging(self):
+        regs = await self.drv._read_regs(37765, 2)
         power = self.drv._to_int32(*regs) * 0.001
         assert power < 0, "discharging should be negative"
         assert abs(power - (-3.0)) < 0.001
 
-    def test_temperature_positive(self):
-        raw = self.drv._read_regs(37752, 1)[0]
+    async def test_temperature_positive(self):
+        raw = (await self.drv._read_regs(37752, 1))[0]
         temp = self.drv._to_int16(raw) * 0.1
         assert abs(temp - 25.0) < 0.01
 
-    def test_mode_write_is_called(self):
-        self.drv._write_reg(47086, int(BatteryMode.TIME_OF_USE))
+    async def test_mode_write_is_called(self):
+        await self.drv._write_reg(47086, int(BatteryMode.TIME_OF_USE))
         self.drv._client.write_register.assert_called_once()  # type: ignore[attr-defined,union-attr]
         call_kwargs = self.drv._client.write_register.call_args  # type: ignore[attr-defined,union-attr]
         # address is first positional arg or 'address' kwarg
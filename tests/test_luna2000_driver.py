@@ -7,7 +7,7 @@ All tests use mock Modbus registers — no real hardware needed.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.drivers.luna2000_driver import (
     BatteryMode,
@@ -24,15 +24,15 @@ def _make_register_mock(values: dict[int, list[int]]):
     """Return a mock Modbus client that returns preset register values."""
     mock = MagicMock()
 
-    def _read(address, count, slave=3):
+    def _read(address, count, device_id=3):
         result = MagicMock()
         result.isError.return_value = False
         result.registers = values.get(address, [0] * count)
         return result
 
-    mock.read_holding_registers.side_effect = _read
-    mock.write_register.return_value = MagicMock(isError=lambda: False)
-    mock.connect.return_value = True
+    mock.read_holding_registers = AsyncMock(side_effect=_read)
+    mock.write_register = AsyncMock(return_value=MagicMock(isError=lambda: False))
+    mock.connect = AsyncMock(return_value=True)
     return mock
 
 
@@ -150,16 +150,16 @@ class TestLUNADriverAsync:
         drv._client = mock_client
         return drv, mock_client
 
-    def test_read_soc_register_raw(self):
+    async def test_read_soc_register_raw(self):
         """Verify _read_regs returns the mocked SOC register."""
         drv, _ = self._driver_with_mock()
-        regs = drv._read_regs(37760, 1)
+        regs = await drv._read_regs(37760, 1)
         assert regs == [600]
         assert 600 * 0.1 == 60.0
 
-    def test_read_mode_returns_enum(self):
+    async def test_read_mode_returns_enum(self):
         """Verify working mode register is read correctly."""
         drv, _ = self._driver_with_mock()
-        mode_raw = drv._read_regs(47086, 1)[0]
+        mode_raw = (await drv._read_regs(47086, 1))[0]
         mode = BatteryMode(min(mode_raw, 3))
         assert mode == BatteryMode.MAX_SELF_CONSUMPTION
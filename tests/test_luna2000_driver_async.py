@@ -7,7 +7,7 @@ set_charge_target_soc, __aenter__ / __aexit__ lifecycle.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from src.drivers.luna2000_driver import BatteryMode, LUNADriver, LUNATelemetry
@@ -19,16 +19,18 @@ from src.drivers.luna2000_driver import BatteryMode, LUNADriver, LUNATelemetry
 
 def _make_register_mock(values: dict[int, list[int]]) -> MagicMock:
     mock = MagicMock()
+    # Flatten to a per-address map so bulk reads can span several entries.
+    flat = {addr + i: v for addr, regs in values.items() for i, v in enumerate(regs)}
 
-    def _read(address, count, slave=3):
+    def _read(address, count, device_id=3):
         result = MagicMock()
         result.isError.return_value = False
-        result.registers = values.get(address, [0] * count)
+        result.registers = [flat.get(address + i, 0) for i in range(count)]
         return result
 
-    mock.read_holding_registers.side_effect = _read
-    mock.write_register.return_value = MagicMock(isError=lambda: False)
-    mock.connect.return_value = True
+    mock.read_holding_registers = AsyncMock(side_effect=_read)
+    mock.write_register = AsyncMock(return_value=MagicMock(isError=lambda: False))
+    mock.connect = AsyncMock(return_value=True)
     return mock
 
 
@@ -78,6 +80,13 @@ class TestReadTelemetry:
         assert tel.power_kw < 0
         assert tel.is_discharging
 
+    @pytest.mark.asyncio
+    async def test_reads_signed_current_and_voltage(self):
+        drv, _ = _driver_with_mock()
+        tel = await drv.read_telemetry()
+        assert tel.current_a == pytest.approx(-4.6, abs=0.01)
+        assert tel.voltage_v == pytest.approx(480.0, abs=0.01)
+
     @pytest.mark.asyncio
     async def test_reads_cycle_count(self):
         drv, _ = _driver_with_mock()
@@ -102,6 +111,17 @@ class TestReadTelemetry:
         tel = await drv.read_telemetry()
         assert isinstance(tel, LUNATelemetry)
 
+    @pytest.mark.asyncio
+    async def test_reads_in_two_bulk_transactions(self):
+        drv, mock_client = _driver_with_mock()
+        await drv.read_telemetry()
+        calls = mock_client.read_holding_registers.call_args_list
+        assert [(c.kwargs["address"], c.kwargs["count"]) for c in calls] == [
+            (37752, 50),
+            (47086, 2),
+        ]
+        assert all(c.kwargs["count"] <= 125 for c in calls)  # FC03 limit
+
 
 # ---------------------------------------------------------------------------
 # set_mode
@@ -118,20 +138,20 @@ class TestSetMode:
 
         # REG_LUNA_MODE = 47086
         mock_client.write_register.assert_called_once_with(
-            address=47086, value=int(BatteryMode.TIME_OF_USE), slave=3
+            address=47086, value=int(BatteryMode.TIME_OF_USE), device_id=3
         )
 
     @pytest.mark.asyncio
     async def test_set_mode_fully_charged(self):
         drv, mock_client = _driver_with_mock()
         await drv.set_mode(BatteryMode.FULLY_CHARGED)
-        mock_client.write_register.assert_called_once_with(address=47086, value=1, slave=3)
+        mock_client.write_register.assert_called_once_with(address=47086, value=1, device_id=3)
 
     @pytest.mark.asyncio
     async def test_set_mode_remote_dispatch(self):
         drv, mock_client = _driver_with_mock()
         await drv.set_mode(BatteryMode.REMOTE_DISPATCH)
-        mock_client.write_register.assert_called_once_with(address=47086, value=3, slave=3)
+        mock_client.write_register.assert_called_once_with(address=47086, value=3, device_id=3)
 
 
 # ---------------------------------------------------------------------------
@@ -145,19 +165,19 @@ class TestSetChargeTargetSOC:
         drv, mock_client = _driver_with_mock()
         await drv.set_charge_target_soc(80.0)
         # REG_LUNA_TARGET_SOC = 47087 (registro contiguo al modo 47086)
-        mock_client.write_register.assert_called_once_with(address=47087, value=800, slave=3)
+        mock_client.write_register.assert_called_once_with(address=47087, value=800, device_id=3)
 
     @pytest.mark.asyncio
     async def test_valid_target_100_pct(self):
         drv, mock_client = _driver_with_mock()
         await drv.set_charge_target_soc(100.0)
-        mock_client.write_register.assert_called_once_with(address=47087, value=1000, slave=3)
+        mock_client.write_register.assert_called_once_with(address=47087, value=1000, device_id=3)
 
     @pytest.mark.asyncio
     async def test_valid_target_0_pct(self):
         drv, mock_client = _driver_with_mock()
         await drv.set_charge_target_soc(0.0)
-        mock_client.write_register.assert_called_once_with(address=47087, value=0, slave=3)
+        mock_client.write_register.assert_called_once_with(address=47087, value=0, device_id=3)
 
     @pytest.mark.asyncio
     async def test_raises_on_negative_target(self):
@@ -218,7 +238,7 @@ class TestLUNADriverLifecycle:
 
 
 class TestReadRegsErrorHandling:
-    def test_read_regs_raises_on_modbus_error(self):
+    async def test_read_regs_raises_on_modbus_error(self):
         drv, mock_client = _driver_with_mock()
         error_result = MagicMock()
         error_result.isError = MagicMock(return_value=True)
@@ -227,9 +247,9 @@ class TestReadRegsErrorHandling:
         mock_client.read_holding_registers.return_value = error_result
 
         with pytest.raises(OSError, match="Modbus read error"):
-            drv._read_regs(37760, 1)
+            await drv._read_regs(37760, 1)
 
-    def test_write_reg_raises_on_modbus_error(self):
+    async def test_write_reg_raises_on_modbus_error(self):
         drv, mock_client = _driver_with_mock()
         error_result = MagicMock()
         error_result.isError = MagicMock(return_value=True)
@@ -237,4 +257,4 @@ class TestReadRegsErrorHandling:
         mock_client.write_register.return_value = error_result
 
         with pytest.raises(OSError, match="Modbus write error"):
-            drv._write_reg(47086, 0)
+            await drv._write_reg(47086, 0)
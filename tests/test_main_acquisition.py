@@ -0,0 +1,81 @@
+"""
+tests/test_main_acquisition.py
+==============================
+Unit tests for the per-cycle tag acquisition helpers in main.py.
+
+Tests verify that:
+- Acquisition tags are filtered once to those the driver's profile defines.
+- With the default Huawei profile every cycle uses one bulk read_tags()
+  call and never falls back to single-tag reads.
+- Drivers without ``tag_names`` keep the full acquisition tag set.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+# main.py imports the Pub/Sub publisher, which needs gcloud-aio-pubsub, and
+# reads its settings at import time.
+pytest.importorskip("gcloud.aio.pubsub")
+os.environ.setdefault("SITE_ID", "SITE-TEST-001")
+os.environ.setdefault("INVERTER_IP", "127.0.0.1")
+
+from src.core.main import (  # noqa: E402
+    _ACQUISITION_TAGS,
+    _acquire,
+    _resolve_acquisition_tags,
+    _Telemetry,
+)
+from src.drivers.modbus_driver import TagNotFoundError, UniversalDriver  # noqa: E402
+
+_HUAWEI_PROFILE = Path(__file__).resolve().parents[1] / "registry" / "huawei_sun2000.json"
+
+
+class _CountingDriver:
+    """Driver double that records bulk and single-tag reads."""
+
+    def __init__(self, tag_names: frozenset[str]) -> None:
+        self.tag_names = tag_names
+        self.bulk_calls = 0
+        self.single_calls = 0
+
+    async def read_tags(self, tags: Sequence[str]) -> dict[str, float]:
+        self.bulk_calls += 1
+        for tag in tags:
+            if tag not in self.tag_names:
+                raise TagNotFoundError(tag)
+        return {tag: 1.0 for tag in tags}
+
+    async def read_tag(self, tag: str) -> float:
+        self.single_calls += 1
+        if tag not in self.tag_names:
+            raise TagNotFoundError(tag)
+        return 1.0
+
+
+@pytest.mark.asyncio
+async def test_huawei_profile_drops_undefined_tags() -> None:
+    driver = UniversalDriver(host="127.0.0.1", port=502, profile_path=_HUAWEI_PROFILE)
+    tags = _resolve_acquisition_tags(driver)
+    assert "soc" not in tags
+    assert set(tags) == set(_ACQUISITION_TAGS) & driver.tag_names
+
+
+@pytest.mark.asyncio
+async def test_every_cycle_uses_one_bulk_read() -> None:
+    driver = _CountingDriver(frozenset({"active_power", "frequency", "ac_voltage"}))
+    tags = _resolve_acquisition_tags(driver)
+    out = _Telemetry()
+    for _ in range(3):
+        telemetry = await _acquire(driver, tags, driver.read_tags, out)
+        assert set(telemetry) == {"active_power", "frequency", "ac_voltage"}
+    assert driver.bulk_calls == 3
+    assert driver.single_calls == 0
+
+
+def test_driver_without_tag_names_keeps_all_tags() -> None:
+    assert _resolve_acquisition_tags(object()) == _ACQUISITION_TAGS  # type: ignore[arg-type]
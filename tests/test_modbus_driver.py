@@ -12,17 +12,22 @@ Covers:
 * read_tag: ConnectionException → ModbusReadError.
 * read_tag: Modbus error response → ModbusReadError.
 * read_tag: unknown tag → TagNotFoundError.
+* read_tags: nearby tags coalesced into one read; distant tags split.
+* read_tag: concurrent callers batched into coalesced reads.
 * write_tag: success path.
 * write_tag: read-only tag → PermissionError.
 * write_tag: ConnectionException → ModbusWriteError.
+* shared_client: one TCP client per host:port, closed by the last user.
 * connect: success after retries.
 * connect: fails after max retries → ConnectionException.
+* connect: TCP socket tuned with TCP_NODELAY and keepalive.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+import struct
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
@@ -36,6 +41,8 @@ from src.drivers.modbus_driver import (
     UniversalDriver,
 )
 
+_HUAWEI_PROFILE = Path(__file__).resolve().parents[1] / "registry" / "huawei_sun2000.json"
+
 # ---------------------------------------------------------------------------
 # Minimal valid profile (in-memory — no disk I/O in tests)
 # ---------------------------------------------------------------------------
@@ -75,10 +82,13 @@ _VALID_PROFILE: dict[str, Any] = {
 # ---------------------------------------------------------------------------
 
 
-async def _make_driver(tmp_path: Path) -> UniversalDriver:
-    """Write the valid profile to a temp file and return a driver instance."""
+async def _make_driver(
+    tmp_path: Path, extra_registers: dict[str, dict[str, Any]] | None = None
+) -> UniversalDriver:
+    """Write the valid profile, plus any *extra_registers*, and return a driver."""
+    registers = {**_VALID_PROFILE["registers"], **(extra_registers or {})}
     profile_file = tmp_path / "test_profile.json"
-    profile_file.write_text(json.dumps(_VALID_PROFILE))
+    profile_file.write_text(json.dumps({**_VALID_PROFILE, "registers": registers}))
     return UniversalDriver(host="127.0.0.1", port=502, profile_path=profile_file)
 
 
@@ -97,6 +107,15 @@ def _mock_error_result() -> MagicMock:
     return result
 
 
+def _mock_register_map(registers: dict[int, int]) -> AsyncMock:
+    """Return a read_holding_registers mock serving words from *registers*."""
+
+    async def _read(address: int, count: int, **_unit: Any) -> MagicMock:
+        return _mock_register_result([registers.get(a, 0) for a in range(address, address + count)])
+
+    return AsyncMock(side_effect=_read)
+
+
 # ---------------------------------------------------------------------------
 # Profile loading
 # ---------------------------------------------------------------------------
@@ -134,6 +153,33 @@ class TestProfileLoading:
 
         asyncio.run(_inner())
 
+    def test_count_must_match_register_type(self, tmp_path: Path) -> None:
+        profile = json.loads(json.dumps(_VALID_PROFILE))
+        profile["registers"]["active_power"]["count"] = 1  # INT32 needs 2
+        f = tmp_path / "short.json"
+        f.write_text(json.dumps(profile))
+        with pytest.raises(DriverConfigError, match="active_power"):
+            UniversalDriver(host="127.0.0.1", profile_path=f)
+
+    @pytest.mark.asyncio
+    async def test_huawei_profile_decodes_coalesced_int32(self) -> None:
+        driver = UniversalDriver(host="127.0.0.1", port=502, profile_path=_HUAWEI_PROFILE)
+        # ac_voltage 230.0 V at 32069; ac_current INT32 -12.5 A at 32072..32073
+        raw_current = (-12500) & 0xFFFFFFFF
+        driver._client.read_holding_registers = _mock_register_map(
+            {32069: 2300, 32070: 0xFFFF, 32071: 0xFFFF,
+             32072: raw_current >> 16, 32073: raw_current & 0xFFFF, 32074: 0xFFFF}
+        )
+        values = await driver.read_tags(["ac_voltage", "ac_current"])
+        assert values == pytest.approx({"ac_voltage": 230.0, "ac_current": -12.5})
+        assert await driver.read_tag("ac_current") == pytest.approx(-12.5)
+
+    @pytest.mark.asyncio
+    async def test_tag_names_lists_profile_tags(self) -> None:
+        driver = UniversalDriver(host="127.0.0.1", port=502, profile_path=_HUAWEI_PROFILE)
+        assert {"active_power", "frequency", "ac_voltage"} <= driver.tag_names
+        assert "soc" not in driver.tag_names
+
 
 # ---------------------------------------------------------------------------
 # read_tag
@@ -190,6 +236,186 @@ class TestReadTag:
         with pytest.raises(ModbusReadError):
             await driver.read_tag("soc")
 
+    @pytest.mark.asyncio
+    async def test_unsupported_type_raises_on_read(self, tmp_path: Path) -> None:
+        driver = await _make_driver(
+            tmp_path,
+            extra_registers={
+                "energy_total": {
+                    "address": 30000, "count": 4, "type": "UINT64", "access": "RO", "scale": 1,
+                },
+            },
+        )
+        driver._client.read_holding_registers = AsyncMock(
+            return_value=_mock_register_result([0, 0, 0, 1])
+        )
+        with pytest.raises(DriverConfigError, match="UINT64"):
+            await driver.read_tag("energy_total")
+
+
+# ---------------------------------------------------------------------------
+# read_tags
+# ---------------------------------------------------------------------------
+
+
+class TestReadTags:
+    @pytest.mark.asyncio
+    async def test_nearby_tags_share_one_read(self, tmp_path: Path) -> None:
+        driver = await _make_driver(
+            tmp_path,
+            extra_registers={
+                "frequency": {
+                    "address": 32085, "count": 1, "type": "UINT16", "access": "RO", "scale": 0.01,
+                },
+            },
+        )
+        # 32080..32085: INT32 120000 at offset 0, UINT16 5000 at offset 5
+        words = [0x0001, 0xD4C0, 0, 0, 0, 5000]
+        driver._client.read_holding_registers = AsyncMock(
+            return_value=_mock_register_result(words)
+        )
+        values = await driver.read_tags(["frequency", "active_power"])
+        assert list(values) == ["frequency", "active_power"]
+        assert values["active_power"] == pytest.approx(120.0)
+        assert values["frequency"] == pytest.approx(50.0)
+        driver._client.read_holding_registers.assert_awaited_once()
+        assert driver._client.read_holding_registers.await_args.kwargs["address"] == 32080
+        assert driver._client.read_holding_registers.await_args.kwargs["count"] == 6
+
+    @pytest.mark.asyncio
+    async def test_distant_tags_are_read_separately(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        driver._client.read_holding_registers = AsyncMock(
+            side_effect=[_mock_register_result([0x0001, 0xD4C0]), _mock_register_result([850])]
+        )
+        values = await driver.read_tags(["soc", "active_power"])
+        assert values == pytest.approx({"soc": 85.0, "active_power": 120.0})
+        assert driver._client.read_holding_registers.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_tag_raises_before_io(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        driver._client.read_holding_registers = AsyncMock()
+        with pytest.raises(TagNotFoundError):
+            await driver.read_tags(["soc", "undefined_tag"])
+        driver._client.read_holding_registers.assert_not_awaited()
+
+
+class TestReadTagBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_transaction(self, tmp_path: Path) -> None:
+        driver = await _make_driver(
+            tmp_path,
+            extra_registers={
+                "frequency": {
+                    "address": 32085, "count": 1, "type": "UINT16", "access": "RO", "scale": 0.01,
+                },
+            },
+        )
+        driver._client.read_holding_registers = AsyncMock(
+            return_value=_mock_register_result([0x0001, 0xD4C0, 0, 0, 0, 5000])
+        )
+        power, freq, power2 = await asyncio.gather(
+            driver.read_tag("active_power"),
+            driver.read_tag("frequency"),
+            driver.read_tag("active_power"),
+        )
+        assert power == power2 == pytest.approx(120.0)
+        assert freq == pytest.approx(50.0)
+        driver._client.read_holding_registers.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_span_only_fails_its_tags(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        # Spans are read in address order: active_power (32080) then soc (37004).
+        driver._client.read_holding_registers = AsyncMock(
+            side_effect=[_mock_error_result(), _mock_register_result([850])]
+        )
+        power, soc = await asyncio.gather(
+            driver.read_tag("active_power"), driver.read_tag("soc"), return_exceptions=True
+        )
+        assert isinstance(power, ModbusReadError)
+        assert soc == pytest.approx(85.0)
+
+    @pytest.mark.asyncio
+    async def test_bad_register_in_span_only_fails_its_tag(self, tmp_path: Path) -> None:
+        driver = await _make_driver(
+            tmp_path,
+            extra_registers={
+                "frequency": {
+                    "address": 32085, "count": 1, "type": "UINT16", "access": "RO", "scale": 0.01,
+                },
+            },
+        )
+        good = _mock_register_map({32080: 0x0001, 32081: 0xD4C0})
+
+        async def _read(address: int, count: int, **unit: Any) -> MagicMock:
+            if address <= 32085 < address + count:  # illegal data address
+                return _mock_error_result()
+            return await good(address=address, count=count, **unit)
+
+        driver._client.read_holding_registers = AsyncMock(side_effect=_read)
+        with pytest.raises(ModbusReadError):
+            await driver.read_tags(["active_power", "frequency"])
+        # The per-tag fallback must still deliver the healthy register.
+        power, freq = await asyncio.gather(
+            driver.read_tag("active_power"), driver.read_tag("frequency"),
+            return_exceptions=True,
+        )
+        assert power == pytest.approx(120.0)
+        assert isinstance(freq, ModbusReadError)
+
+    @pytest.mark.asyncio
+    async def test_decode_error_only_fails_its_tag(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        driver._client.read_holding_registers = _mock_register_map({37004: 850})
+        decode = driver._decode
+
+        def _decode(plan: Any, buf: bytes, offset: int = 0) -> float:
+            if plan.address == 32080:
+                raise struct.error("unpack_from requires a buffer of at least 4 bytes")
+            return decode(plan, buf, offset)
+
+        driver._decode = _decode
+        power, soc = await asyncio.gather(
+            driver.read_tag("active_power"), driver.read_tag("soc"), return_exceptions=True
+        )
+        assert isinstance(power, struct.error)
+        assert soc == pytest.approx(85.0)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_fails_waiting_reads(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        started = asyncio.Event()
+
+        async def _hang(*_args: object, **_kwargs: object) -> None:
+            started.set()
+            await asyncio.Event().wait()
+
+        driver._client.read_holding_registers = _hang
+        reads = asyncio.gather(
+            driver.read_tag("active_power"), driver.read_tag("soc"), return_exceptions=True
+        )
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        (task,) = driver._flush_tasks
+        task.cancel()
+        power, soc = await asyncio.wait_for(reads, timeout=1.0)
+        assert isinstance(power, ModbusReadError)
+        assert isinstance(soc, ModbusReadError)
+        assert not driver._flush_tasks
+
+    @pytest.mark.asyncio
+    async def test_disconnect_fails_reads_not_yet_flushed(self, tmp_path: Path) -> None:
+        driver = await _make_driver(tmp_path)
+        driver._client.read_holding_registers = AsyncMock()
+        read = asyncio.ensure_future(driver.read_tag("soc"))
+        await asyncio.sleep(0)  # read_tag queued; its flush task has not run yet
+        await driver.disconnect()
+        with pytest.raises(ModbusReadError):
+            await asyncio.wait_for(read, timeout=1.0)
+        driver._client.read_holding_registers.assert_not_called()
+        assert not driver._pending_reads and driver._flush_task is None
+
 
 # ---------------------------------------------------------------------------
 # write_tag
@@ -207,6 +433,23 @@ class TestWriteTag:
         await driver.write_tag("watchdog_heartbeat", 42.0)
         driver._client.write_registers.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_write_scaled_tag_encodes_exact_raw(self, tmp_path: Path) -> None:
+        driver = await _make_driver(
+            tmp_path,
+            extra_registers={
+                "soc_target": {
+                    "address": 47087, "count": 1, "type": "UINT16", "access": "RW", "scale": 0.1,
+                },
+            },
+        )
+        write_result = MagicMock()
+        write_result.isError.return_value = False
+        driver._client.write_registers = AsyncMock(return_value=write_result)
+        # 0.3 / 0.1 == 2.999... would truncate to 2
+        await driver.write_tag("soc_target", 0.3)
+        assert driver._client.write_registers.await_args.kwargs["values"] == [3]
+
     @pytest.mark.asyncio
     async def test_write_ro_tag_raises_permission_error(self, tmp_path: Path) -> None:
         driver = await _make_driver(tmp_path)
@@ -227,6 +470,36 @@ class TestWriteTag:
                 await driver.write_tag("watchdog_heartbeat", 1.0)
 
 
+# ---------------------------------------------------------------------------
+# shared_client
+# ---------------------------------------------------------------------------
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_drivers_for_same_endpoint_share_one_client(self, tmp_path: Path) -> None:
+        profile_file = tmp_path / "p.json"
+        profile_file.write_text(json.dumps(_VALID_PROFILE))
+        a = UniversalDriver(host="10.9.9.1", profile_path=profile_file, shared_client=True)
+        b = UniversalDriver(host="10.9.9.1", profile_path=profile_file, shared_client=True)
+        own = UniversalDriver(host="10.9.9.1", profile_path=profile_file)
+        assert a._client is b._client
+        assert own._client is not a._client
+
+    @pytest.mark.asyncio
+    async def test_shared_client_closed_by_last_driver_only(self, tmp_path: Path) -> None:
+        profile_file = tmp_path / "p.json"
+        profile_file.write_text(json.dumps(_VALID_PROFILE))
+        a = UniversalDriver(host="10.9.9.2", profile_path=profile_file, shared_client=True)
+        b = UniversalDriver(host="10.9.9.2", profile_path=profile_file, shared_client=True)
+        a._client.close = MagicMock()  # type: ignore[method-assign]
+        await a.disconnect()
+        await a.disconnect()  # a second disconnect must not close b's connection
+        a._client.close.assert_not_called()
+        await b.disconnect()
+        a._client.close.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # connect
 # ---------------------------------------------------------------------------
@@ -269,3 +542,21 @@ class TestConnect:
 
         with pytest.raises(ConnectionException):
             await asyncio.wait_for(driver.connect(), timeout=10.0)
+
+    @pytest.mark.asyncio
+    async def test_tune_socket_sets_nodelay_and_keepalive(self, tmp_path: Path) -> None:
+        import socket
+
+        driver = await _make_driver(tmp_path)
+        server = socket.create_server(("127.0.0.1", 0))
+        sock = socket.create_connection(server.getsockname())
+        try:
+            transport = MagicMock()
+            transport.get_extra_info.return_value = sock
+            driver._client.ctx.transport = transport
+            driver._tune_socket()
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        finally:
+            sock.close()
+            server.close()
@@ -15,6 +15,7 @@ Tests cover:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -55,6 +56,13 @@ def test_dispatcher_missing_model_returns_none():
     assert result is None
 
 
+def test_load_returns_self_without_context_manager():
+    """load() is the public, non-``async with`` way to load; failures only log."""
+    dispatcher = ONNXDispatcher(model_path="models/nonexistent_model.onnx", site_id="test")
+    assert dispatcher.load() is dispatcher
+    assert dispatcher.is_loaded is False
+
+
 @pytest.mark.asyncio
 async def test_dispatcher_async_context_no_model():
     """Async context manager must not raise when model is missing."""
@@ -136,3 +144,106 @@ async def test_dispatcher_async_context_with_model():
         assert d.is_loaded is True
         result = d.infer(soc_pct=50.0, power_kw=10.0, temp_c=22.0, hour_of_day=10)
         assert result is not None
+
+
+def _has_onnx() -> bool:
+    try:
+        import onnx  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _write_linear_model(path: Path) -> None:
+    """Write a tiny model computing ``target = 0.8 * soc_pct`` to *path*."""
+    import numpy as np
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    weights = np.array([[0.8], [0.0], [0.0], [0.0]], dtype=np.float32)
+    graph = helper.make_graph(
+        [helper.make_node("MatMul", ["features", "W"], ["target"])],
+        "linear_policy",
+        inputs=[helper.make_tensor_value_info("features", TensorProto.FLOAT, ["batch_size", 4])],
+        outputs=[helper.make_tensor_value_info("target", TensorProto.FLOAT, ["batch_size", 1])],
+        initializer=[numpy_helper.from_array(weights, name="W")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 17)])
+    model.ir_version = 9
+    onnx.save(model, str(path))
+
+
+@pytest.mark.skipif(
+    not _has_onnx() or not _has_onnxruntime(),
+    reason="onnx or onnxruntime not installed",
+)
+def test_dispatcher_prefers_optimized_sibling(tmp_path):
+    """A pre-optimized ``<name>.opt.onnx`` next to the model is loaded instead."""
+    _write_linear_model(tmp_path / "policy.opt.onnx")
+    # The raw model is unreadable: loading succeeds only via the sibling
+    (tmp_path / "policy.onnx").write_bytes(b"not an onnx model")
+    os.utime(tmp_path / "policy.onnx", (1_000_000, 1_000_000))
+
+    dispatcher = ONNXDispatcher(model_path=tmp_path / "policy.onnx", site_id="test-opt")
+    dispatcher._load()
+    assert dispatcher.is_loaded is True
+    result = dispatcher.infer(soc_pct=90.0, power_kw=0.0, temp_c=25.0, hour_of_day=12)
+    assert result is not None
+    assert result.target_kw == pytest.approx(72.0, abs=1e-3)
+
+
+@pytest.mark.skipif(
+    not _has_onnx() or not _has_onnxruntime(),
+    reason="onnx or onnxruntime not installed",
+)
+def test_dispatcher_ignores_stale_optimized_sibling(tmp_path):
+    """A sibling older than the model it was built from is skipped for the raw model."""
+    # The stale sibling is unreadable: loading succeeds only via the raw model
+    (tmp_path / "policy.opt.onnx").write_bytes(b"not an onnx model")
+    os.utime(tmp_path / "policy.opt.onnx", (1_000_000, 1_000_000))
+    _write_linear_model(tmp_path / "policy.onnx")
+
+    dispatcher = ONNXDispatcher(model_path=tmp_path / "policy.onnx", site_id="test-stale")
+    dispatcher._load()
+    assert dispatcher.is_loaded is True
+    result = dispatcher.infer(soc_pct=90.0, power_kw=0.0, temp_c=25.0, hour_of_day=12)
+    assert result is not None
+    assert result.target_kw == pytest.approx(72.0, abs=1e-3)
+
+
+@pytest.mark.skipif(
+    not _has_onnx() or not _has_onnxruntime(),
+    reason="onnx or onnxruntime not installed",
+)
+def test_dispatcher_reuses_bound_buffers(tmp_path):
+    """Repeated infer() calls see the new inputs through the preallocated binding."""
+    _write_linear_model(tmp_path / "policy.onnx")
+    dispatcher = ONNXDispatcher(model_path=tmp_path / "policy.onnx", site_id="test-bind")
+    dispatcher._load()
+    first = dispatcher.infer(soc_pct=90.0, power_kw=0.0, temp_c=25.0, hour_of_day=12)
+    second = dispatcher.infer(soc_pct=50.0, power_kw=0.0, temp_c=25.0, hour_of_day=12)
+    assert first is not None and second is not None
+    assert first.target_kw == pytest.approx(72.0, abs=1e-3)
+    assert second.target_kw == pytest.approx(40.0, abs=1e-3)
+
+
+@pytest.mark.skipif(
+    not _has_onnx() or not _has_onnxruntime(),
+    reason="onnx or onnxruntime not installed",
+)
+def test_dispatchers_share_one_session(tmp_path):
+    """Dispatchers built from a shared session keep independent inputs."""
+    import onnxruntime as ort
+
+    _write_linear_model(tmp_path / "policy.onnx")
+    session = ort.InferenceSession(str(tmp_path / "policy.onnx"))
+    missing = "models/missing.onnx"
+    a = ONNXDispatcher(model_path=missing, site_id="a", shared_session=session).load()
+    b = ONNXDispatcher(model_path=missing, site_id="b", shared_session=session).load()
+    assert a.is_loaded and b.is_loaded
+    ra = a.infer(soc_pct=10.0, power_kw=0.0, temp_c=25.0, hour_of_day=1)
+    rb = b.infer(soc_pct=20.0, power_kw=0.0, temp_c=25.0, hour_of_day=1)
+    assert ra is not None and rb is not None
+    assert ra.target_kw == pytest.approx(8.0, abs=1e-3)
+    assert rb.target_kw == pytest.approx(16.0, abs=1e-3)
@@ -0,0 +1,94 @@
+"""
+tests/test_pubsub_publisher.py
+===============================
+Unit tests for PubSubPublisher batching and back-pressure.
+
+Tests verify that:
+- publish_batch() splits messages into requests by count and by bytes,
+  keeping message IDs in batch order.
+- A successful batch flush is logged at DEBUG, not INFO.
+- publish_nowait() blocks once ``max_in_flight`` requests are outstanding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from structlog.testing import capture_logs
+
+pytest.importorskip("gcloud.aio.pubsub")
+
+from src.interfaces.pubsub_publisher import PubSubPublisher  # noqa: E402
+
+
+def _publisher(client: Any, **kwargs: Any) -> PubSubPublisher:
+    """Build a publisher wired to *client* without opening an HTTP session."""
+    pub = PubSubPublisher("proj", "telemetry", site_id="SITE-TEST-001", **kwargs)
+    pub._client = client
+    return pub
+
+
+def _echo_client() -> AsyncMock:
+    """Client whose publish() returns one ID per message, numbered across calls."""
+    counter = iter(range(1_000_000))
+    client = AsyncMock()
+
+    async def publish(topic: str, messages: list[Any]) -> dict[str, list[str]]:
+        return {"messageIds": [str(next(counter)) for _ in messages]}
+
+    client.publish.side_effect = publish
+    return client
+
+
+class TestPublishBatch:
+    @pytest.mark.asyncio
+    async def test_splits_by_message_count(self) -> None:
+        client = _echo_client()
+        pub = _publisher(client, max_request_messages=2)
+        ids = await pub.publish_batch([{"soc": float(i)} for i in range(5)])
+        assert [len(c.kwargs["messages"]) for c in client.publish.await_args_list] == [2, 2, 1]
+        assert ids == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_splits_by_request_bytes(self) -> None:
+        client = _echo_client()
+        probe = _publisher(client)._to_message({"soc": 1.0, "observed_at": "t"})
+        pub = _publisher(client, max_request_bytes=2 * len(probe.data))
+        await pub.publish_batch([{"soc": 1.0, "observed_at": "t"}] * 5)
+        assert [len(c.kwargs["messages"]) for c in client.publish.await_args_list] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_success_is_logged_at_debug(self) -> None:
+        pub = _publisher(_echo_client())
+        with capture_logs() as logs:
+            await pub.publish_batch([{"soc": 1.0}])
+        success = [e for e in logs if e["event"] == "pubsub.publish_batch.success"]
+        assert [e["log_level"] for e in success] == ["debug"]
+
+
+class TestPublishNowait:
+    @pytest.mark.asyncio
+    async def test_blocks_at_max_in_flight(self) -> None:
+        release = asyncio.Event()
+        client = AsyncMock()
+
+        async def publish(topic: str, messages: list[Any]) -> dict[str, list[str]]:
+            await release.wait()
+            return {"messageIds": ["id"] * len(messages)}
+
+        client.publish.side_effect = publish
+        pub = _publisher(client, max_in_flight=1)
+
+        first = await pub.publish_nowait([{"soc": 1.0}])
+        second = asyncio.create_task(pub.publish_nowait([{"soc": 2.0}]))
+        await asyncio.sleep(0.01)
+        assert pub.in_flight == 1
+        assert not second.done()
+
+        release.set()
+        assert await first == ["id"]
+        assert await (await second) == ["id"]
+        assert await pub.drain(timeout=1.0) == 0
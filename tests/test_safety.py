@@ -80,6 +80,16 @@ class TestCheckSafetyBlock:
     def test_soc_bad_temp_ok(self, guard: SafetyGuard) -> None:
         assert guard.check_safety({"soc": 1.0, "temp": 30.0}) is False
 
+    def test_numeric_strings_are_coerced(self, guard: SafetyGuard) -> None:
+        assert guard.check_safety({"soc": "50", "temp": "30"}) is True
+        assert guard.check_safety({"temp": "46"}) is False
+
+    def test_subclass_limits_respected(self) -> None:
+        class StrictGuard(SafetyGuard):
+            TEMP_MAX = 40.0
+
+        assert StrictGuard().check_safety({"temp": 42.0}) is False
+
 
 # ---------------------------------------------------------------------------
 # watchdog_loop